@@ -0,0 +1,7 @@
+"""
+Benchmarks for the project's hot paths.
+
+Run the suite offline, against the baseline, with `python -m benchmarks`.
+Each `bench_*` module is also runnable on its own,
+e.g. `python -m benchmarks.bench_renderer`.
+"""
@@ -0,0 +1,198 @@
+"""
+Runner of the benchmark suite, offline. (see `benchmarks/suite.py`)
+
+Runs the benchmarks on an in-memory database, stores the results as
+JSON, and compares them against a baseline, flagging the benchmarks
+that got slower than the threshold.
+
+NOTE: Timings depend on the machine. Refresh the baseline with
+`--save-baseline` on the machine the comparisons are made on, and
+commit it along with the change that moved it.
+
+Usage:
+    python -m benchmarks [-k resize] [--baseline benchmarks/baseline.json]
+        [--output benchmarks/results/latest.json] [--threshold 0.1]
+        [--save-baseline] [--fail-on-regression]
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+# Directory of the benchmarks.
+BENCHMARKS_DIR = Path(__file__).resolve().parent
+
+DEFAULT_BASELINE = BENCHMARKS_DIR / 'baseline.json'
+DEFAULT_OUTPUT = BENCHMARKS_DIR / 'results' / 'latest.json'
+
+
+def setup() -> None:
+    """
+    Set up Django with the offline settings, and migrate the in-memory
+    database.
+    """
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'benchmarks.settings')
+
+    from loguru import logger
+
+    from .utils import setup_django
+
+    setup_django()
+    logger.remove()  # e.g. a success log per registered user
+
+    from django.core.management import call_command
+    call_command('migrate', verbosity=0)
+
+
+def run(pattern: str | None) -> dict[str, dict]:
+    """
+    Run the benchmarks whose name contains the pattern, if any.
+
+    Returns:
+        dict[str, dict]: The time per operation (in microseconds) and the
+            rounds per benchmark name.
+    """
+    from .suite import BENCHMARKS
+    from .utils import measure
+
+    results = {}
+    for bench in BENCHMARKS:
+        if pattern and pattern not in bench.name:
+            continue
+
+        us = measure(bench.setup(), number=bench.number, repeat=bench.repeat)
+        results[bench.name] = {
+            'us_per_op': round(us, 3),
+            'number': bench.number,
+            'repeat': bench.repeat,
+        }
+        print(f'  {bench.name:<40} {us:>12.1f} us/op', file=sys.stderr)
+    return results
+
+
+def compare(
+    results: dict[str, dict],
+    baseline: dict[str, dict],
+    threshold: float
+) -> list[str]:
+    """
+    Print the change of each benchmark against the baseline.
+
+    Returns:
+        list[str]: The names of the benchmarks slower than the threshold.
+    """
+    regressions = []
+    print(f'{"benchmark":<40} {"baseline":>12} {"current":>12} {"change":>8}')
+    for name, result in results.items():
+        current = result['us_per_op']
+        if name not in baseline:
+            print(f'{name:<40} {"-":>12} {current:>12.1f} {"new":>8}')
+            continue
+
+        previous = baseline[name]['us_per_op']
+        change = (current - previous) / previous if previous else 0
+        marker = ''
+        if change > threshold:
+            regressions.append(name)
+            marker = '  <- regression'
+        print(
+            f'{name:<40} {previous:>12.1f} {current:>12.1f} '
+            f'{change:>+8.1%}{marker}'
+        )
+
+    for name in sorted(baseline.keys() - results.keys()):
+        print(f'{name:<40} (not run)')
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmarks',
+        description='Run the benchmark suite, and compare to a baseline.'
+    )
+    parser.add_argument(
+        '-k',
+        dest='pattern',
+        default=None,
+        help='Only run the benchmarks whose name contains this.'
+    )
+    parser.add_argument(
+        '--baseline',
+        type=Path,
+        default=DEFAULT_BASELINE,
+        help='JSON results to compare against.'
+    )
+    parser.add_argument(
+        '--output',
+        type=Path,
+        default=DEFAULT_OUTPUT,
+        help='Where to store the JSON results.'
+    )
+    parser.add_argument(
+        '--threshold',
+        type=float,
+        default=0.10,
+        help='Slowdown over which a benchmark regressed. (default: 0.10)'
+    )
+    parser.add_argument(
+        '--save-baseline',
+        action='store_true',
+        help='Also store the results as the new baseline.'
+    )
+    parser.add_argument(
+        '--fail-on-regression',
+        action='store_true',
+        help='Exit with a non-zero status when a benchmark regressed.'
+    )
+    args = parser.parse_args()
+
+    setup()
+
+    import django
+    print('Running the benchmarks...', file=sys.stderr)
+    report = {
+        'meta': {
+            'created_at': datetime.now(timezone.utc).isoformat(),
+            'python': platform.python_version(),
+            'django': django.get_version(),
+            'machine': platform.machine(),
+            'system': platform.system(),
+        },
+        'results': run(args.pattern),
+    }
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(report, indent=2) + '\n')
+    print(f'Stored the results in "{args.output}".', file=sys.stderr)
+
+    regressions = []
+    baseline = {'results': {}}
+    if args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text())
+        regressions = compare(
+            report['results'],
+            {
+                name: result
+                for name, result in baseline['results'].items()
+                if not args.pattern or args.pattern in name
+            },
+            args.threshold
+        )
+    else:
+        print(f'No baseline at "{args.baseline}".', file=sys.stderr)
+
+    if args.save_baseline:
+        # NOTE: Keeps the baseline of the benchmarks that weren't run.
+        report['results'] = {**baseline['results'], **report['results']}
+        args.baseline.write_text(json.dumps(report, indent=2) + '\n')
+        print(f'Stored the baseline in "{args.baseline}".', file=sys.stderr)
+
+    if regressions and args.fail_on_regression:
+        sys.exit(f'{len(regressions)} benchmark(s) regressed.')
+
+
+if __name__ == '__main__':
+    main()
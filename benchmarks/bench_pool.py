@@ -0,0 +1,69 @@
+"""
+Benchmark of the connection setup overhead per request, with and
+without the connection pool.
+
+Compares, for a request running a single `SELECT 1`:
+- connect: a new connection per request. (`CONN_MAX_AGE = 0`)
+- pool: a connection checked out of the pool, health-checked, then
+  returned. (`OPTIONS['pool']`)
+
+NOTE: Needs the PostgreSQL database of the `DB_*` environment variables.
+The gap widens with the network latency and TLS handshake of a remote
+database. (e.g. Supabase)
+
+Usage:
+    python -m benchmarks.bench_pool
+"""
+import psycopg
+from psycopg_pool import ConnectionPool
+
+from .utils import measure, setup_django
+
+setup_django()
+
+from django.db import connections  # noqa: E402
+
+
+def main():
+    params = connections['default'].get_connection_params()
+    params['autocommit'] = True
+
+    def connect():
+        with psycopg.connect(**params) as conn:
+            conn.execute('SELECT 1')
+
+    try:
+        connect()
+    except psycopg.OperationalError as e:
+        raise SystemExit(f'Database is unreachable: {e}')
+
+    pool = ConnectionPool(
+        kwargs=params,
+        min_size=1,
+        max_size=1,
+        check=ConnectionPool.check_connection,
+        open=True
+    )
+
+    def pooled():
+        with pool.connection() as conn:
+            conn.execute('SELECT 1')
+
+    try:
+        results = {
+            'connect': measure(connect, number=50, repeat=3),
+            'pool': measure(pooled, number=500, repeat=3),
+        }
+    finally:
+        pool.close()
+
+    print('Time per request (SELECT 1):')
+    for name, us in results.items():
+        print(
+            f'  {name:<8} {us / 1000:>8.2f} ms  '
+            f'({results["connect"] / us:.1f}x)'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,104 @@
+"""
+Benchmark of compact (bigint) references against the `to_field`
+foreign keys of the shop models. (e.g. `Product.fk_shop` by UUID)
+
+Reports, per foreign key:
+- The size of an index on the `to_field` values, and on the bigint ids.
+- The time of a join through each, over the whole table.
+
+Both are measured on a temporary copy of the references, so the tables
+aren't changed. (dropped at the end of the transaction)
+
+NOTE: Needs the PostgreSQL database of the `DB_*` environment variables,
+seeded. (e.g. `python manage.py seed`)
+
+Usage:
+    python -m benchmarks.bench_references
+"""
+from .utils import measure, setup_django
+
+setup_django()
+
+from django.db import connection, transaction  # noqa: E402
+
+# Foreign keys to compare, as:
+# (table, column, referenced table, to_field)
+REFERENCES = [
+    ('shop_shop', 'user_id', 'users_customuser', 'email'),
+    ('shop_product', 'fk_shop_id', 'shop_shop', 'shop_id'),
+    ('shop_shopfollower', 'fk_shop_id', 'shop_shop', 'shop_id'),
+]
+
+# Copy of the references, by `to_field` value and by id.
+COPY_SQL = """
+    CREATE TEMPORARY TABLE bench_references ON COMMIT DROP AS
+    SELECT t.{column} AS value, r.id AS ref
+    FROM {table} t
+    JOIN {to_table} r ON r.{to_field} = t.{column};
+
+    CREATE INDEX bench_references_value_idx ON bench_references (value);
+    CREATE INDEX bench_references_ref_idx ON bench_references (ref);
+    ANALYZE bench_references;
+"""
+
+
+def index_size(name: str) -> int:
+    with connection.cursor() as cursor:
+        cursor.execute('SELECT pg_relation_size(%s::regclass)', [name])
+        return cursor.fetchone()[0]
+
+
+def join_time(sql: str) -> float:
+    def run():
+        with connection.cursor() as cursor:
+            cursor.execute(sql)
+            cursor.fetchone()
+    return measure(run, number=5, repeat=3)
+
+
+def compare(table: str, column: str, to_table: str, to_field: str):
+    """
+    Get the index sizes and join times of a foreign key, by its
+    `to_field` values and by the referenced ids.
+    """
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(COPY_SQL.format(
+            table=table,
+            column=column,
+            to_table=to_table,
+            to_field=to_field
+        ))
+        sizes = [
+            index_size(f'bench_references_{name}_idx')
+            for name in ('value', 'ref')
+        ]
+        times = [
+            join_time(
+                'SELECT COUNT(*) FROM bench_references b '
+                f'JOIN {to_table} r ON r.{field} = b.{name}'
+            )
+            for name, field in (('value', to_field), ('ref', 'id'))
+        ]
+    return sizes, times
+
+
+def main():
+    if connection.vendor != 'postgresql':
+        raise SystemExit('This benchmark needs a PostgreSQL database.')
+
+    print(
+        f'{'foreign key':<32} {'index (KiB)':>20} {'join (ms)':>20}\n'
+        f'{'':<32} {'to_field':>9} {'bigint':>10} {'to_field':>9} '
+        f'{'bigint':>10}'
+    )
+    for table, column, to_table, to_field in REFERENCES:
+        sizes, times = compare(table, column, to_table, to_field)
+        print(
+            f'{f'{table}.{column}':<32} '
+            f'{sizes[0] / 1024:>9.0f} {sizes[1] / 1024:>10.0f} '
+            f'{times[0] / 1000:>9.2f} {times[1] / 1000:>10.2f}'
+        )
+
+
+if __name__ == '__main__':
+    main()
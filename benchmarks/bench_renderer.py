@@ -0,0 +1,86 @@
+"""
+Benchmark of the API response serialization paths.
+
+Compares serializing a page of catalog products with:
+- Ninja's default path: validating ORM-like objects into the schema,
+  `model_dump()` then `json.dumps()` with Ninja's JSON encoder.
+- The same path, rendered with the `ORJSONRenderer`.
+- The precompiled `SchemaSerializer` on `QuerySet.values()` rows.
+
+Usage:
+    python -m benchmarks.bench_renderer
+"""
+import json
+import uuid
+from datetime import datetime, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+
+from .utils import measure, setup_django
+
+setup_django()
+
+from ninja.responses import NinjaJSONEncoder  # noqa: E402
+
+from core.renderers import ORJSONRenderer, SchemaSerializer  # noqa: E402
+from shop.api.schemas import ProductSchemaOut  # noqa: E402
+
+# Number of products per page. (see `CATALOG_PAGE_SIZE`)
+PAGE_SIZE = 24
+
+
+def make_rows(n: int) -> list[dict]:
+    """
+    Create `QuerySet.values()`-like rows of products.
+    """
+    shop_id = uuid.uuid4()
+    return [
+        {
+            'sku': f'XYZSHOP-PHY-{i:06}',
+            'name': f'Product #{i}',
+            'product_type': 'PHY',
+            'price': Decimal('499.99'),
+            'fk_shop_id': shop_id,
+            'created_at': datetime.now(timezone.utc)
+        }
+        for i in range(n)
+    ]
+
+
+def main():
+    rows = make_rows(PAGE_SIZE)
+    objects = [SimpleNamespace(**row) for row in rows]
+    renderer = ORJSONRenderer()
+    serializer = SchemaSerializer(ProductSchemaOut, many=True)
+
+    def ninja_default():
+        data = [
+            ProductSchemaOut.model_validate(obj).model_dump()
+            for obj in objects
+        ]
+        return json.dumps(data, cls=NinjaJSONEncoder)
+
+    def ninja_orjson():
+        data = [
+            ProductSchemaOut.model_validate(obj).model_dump()
+            for obj in objects
+        ]
+        return renderer.render(None, data, response_status=200)
+
+    def precompiled():
+        return serializer.dumps(rows)
+
+    results = {
+        'ninja_default': measure(ninja_default, number=500),
+        'ninja_orjson': measure(ninja_orjson, number=500),
+        'precompiled_values': measure(precompiled, number=500),
+    }
+
+    baseline = results['ninja_default']
+    print(f'Serializing {PAGE_SIZE} products per response:')
+    for name, us in results.items():
+        print(f'  {name:<20} {us:>9.1f} us/op  ({baseline / us:.1f}x)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+"""
+Benchmark of the `validate_params` decorator's per-call overhead.
+
+Compares, on a no-op function with the registration's parameters:
+- legacy: the previous decorator, which inspected the signature and
+  built a model on every call.
+- validated: the current decorator, validating keyword arguments.
+- trusted: the current decorator, given an already-validated schema.
+
+NOTE: Most of the validated path is spent on the `EmailStr` check.
+
+Usage:
+    python -m benchmarks.bench_validate
+"""
+import inspect
+from functools import wraps
+
+from .utils import measure, setup_django
+
+setup_django()
+
+from core.decorators.validate import validate_params  # noqa: E402
+from users.resources.schemas import RegisterUser  # noqa: E402
+
+
+def legacy_validate_params(model):
+    """
+    The previous implementation of `validate_params`, for reference.
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            func_signature = inspect.signature(func)
+            param_names = list(func_signature.parameters.keys())
+            params = {**dict(zip(param_names, args)), **kwargs}
+            validated_data = model(**params).model_dump(exclude_none=True)
+            return func(**validated_data)
+
+        return wrapper
+    return decorator
+
+
+def register(email: str, password: str, **extras):
+    return email
+
+
+def main():
+    legacy = legacy_validate_params(RegisterUser)(register)
+    current = validate_params(RegisterUser)(register)
+
+    params = {
+        'email': 'johndoe@expoph.com',
+        'password': 'Pa$$w0rd',
+        'display_name': 'johndoe01'
+    }
+    details = RegisterUser(**params)
+
+    baseline = measure(lambda: register(**params), number=20000)
+    results = {
+        'legacy': measure(lambda: legacy(**params), number=20000),
+        'validated': measure(lambda: current(**params), number=20000),
+        'trusted': measure(lambda: current(details), number=20000),
+    }
+
+    print(f'Per-call overhead (undecorated call: {baseline:.2f} us):')
+    for name, us in results.items():
+        print(
+            f'  {name:<10} {us - baseline:>7.2f} us/call  '
+            f'({(results["legacy"] - baseline) / (us - baseline):.1f}x)'
+        )
+
+
+if __name__ == '__main__':
+    main()
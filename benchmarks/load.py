@@ -0,0 +1,478 @@
+"""
+Load test of scripted user journeys, against the app in process or a
+running server.
+
+Virtual users replay the journeys in a loop, paced to a target rate of
+requests per second, then the latency percentiles, error rate and
+database queries per request are reported per step:
+- browser: browses the catalog, a shop's page and the shop suggestions.
+- shopper: registers, logs in, browses a shop and its catalog, then views
+  the profile.
+
+Worker models (`--mode`):
+- asgi: `core.asgi.application` in process, on one event loop. Sync
+  views run on a single thread, like a single uvicorn worker.
+- wsgi: `core.wsgi.application` in process, on `--workers` threads,
+  like a gunicorn `gthread` worker.
+- http: a server already running at `--url`, with any worker model.
+  (e.g. `gunicorn core.wsgi -w 4`) Queries aren't counted.
+
+Shops are picked by popularity, from the database. (see `manage.py seed`)
+
+NOTE: This writes to the configured database. The registered users are
+deleted afterwards.
+
+Usage:
+    python -m benchmarks.load [--mode asgi] [--users 20] [--rps 50]
+        [--duration 30] [--mix browser=9,shopper=1] [--output load.json]
+"""
+import argparse
+import asyncio
+import json
+import random
+import re
+import time
+import uuid
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+import httpx
+
+from .utils import setup_django
+
+setup_django()
+
+from asgiref.sync import sync_to_async  # noqa: E402
+from django.db import connections  # noqa: E402
+from django.db.backends.signals import connection_created  # noqa: E402
+from loguru import logger  # noqa: E402
+
+from shop.models import Shop  # noqa: E402
+from users.models import CustomUser  # noqa: E402
+
+# Response header of the number of queries run for a request.
+QUERIES_HEADER = 'x-load-queries'
+
+# Credentials of the registered users.
+EMAIL_DOMAIN = 'loadtest.expoph.com'
+PASSWORD = 'Lo4d-test-pa$$word'
+
+# Token of the login form.
+CSRF_INPUT_RE = re.compile(r'name="csrfmiddlewaretoken" value="([^"]+)"')
+
+# Query counter of the request being handled, in process.
+_queries: ContextVar[list[int] | None] = ContextVar(
+    'load_queries', default=None
+)
+
+
+# Query counting, in process.
+
+def _count_query(execute, sql, params, many, context):
+    counter = _queries.get()
+    if counter is not None:
+        counter[0] += 1
+    return execute(sql, params, many, context)
+
+
+def _install_query_counter(sender=None, connection=None, **kwargs):
+    if _count_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_count_query)
+
+
+def count_queries_asgi(app):
+    """
+    Wrap an ASGI app to send the number of queries per request in the
+    `QUERIES_HEADER` response header.
+    """
+    async def wrapper(scope, receive, send):
+        if scope['type'] != 'http':
+            return await app(scope, receive, send)
+
+        # NOTE: Sync views get a copy of the context, with this counter.
+        counter = [0]
+        token = _queries.set(counter)
+
+        async def send_with_queries(message):
+            if message['type'] == 'http.response.start':
+                message = {**message, 'headers': [
+                    *message.get('headers', []),
+                    (QUERIES_HEADER.encode(), str(counter[0]).encode())
+                ]}
+            await send(message)
+
+        try:
+            await app(scope, receive, send_with_queries)
+        finally:
+            _queries.reset(token)
+    return wrapper
+
+
+def count_queries_wsgi(app):
+    """
+    Wrap a WSGI app to send the number of queries per request in the
+    `QUERIES_HEADER` response header.
+    """
+    def wrapper(environ, start_response):
+        counter = [0]
+        token = _queries.set(counter)
+        try:
+            def start_response_with_queries(status, headers, *args):
+                headers = [*headers, (QUERIES_HEADER, str(counter[0]))]
+                return start_response(status, headers, *args)
+            return app(environ, start_response_with_queries)
+        finally:
+            _queries.reset(token)
+    return wrapper
+
+
+class ThreadedWSGITransport(httpx.AsyncBaseTransport):
+    """
+    Transport that serves the requests with a WSGI app on a pool of
+    worker threads.
+    """
+
+    def __init__(self, app, workers: int):
+        self.transport = httpx.WSGITransport(app=app)
+        self.executor = ThreadPoolExecutor(max_workers=workers)
+
+    def _handle(self, request: httpx.Request) -> httpx.Response:
+        response = self.transport.handle_request(request)
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            content=response.read()
+        )
+
+    async def handle_async_request(self, request):
+        await request.aread()
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.executor, self._handle, request
+        )
+
+    def shutdown(self) -> None:
+        # NOTE: Not on `aclose()`, as each virtual user's client closes
+        # the shared transport.
+        self.executor.shutdown()
+
+
+def make_transport(mode: str, workers: int) -> httpx.AsyncBaseTransport:
+    connection_created.connect(_install_query_counter)
+    for connection in connections.all(initialized_only=True):
+        _install_query_counter(connection=connection)
+
+    if mode == 'asgi':
+        from core.asgi import application
+        return httpx.ASGITransport(app=count_queries_asgi(application))
+
+    from core.wsgi import application
+    return ThreadedWSGITransport(count_queries_wsgi(application), workers)
+
+
+# Load generation.
+
+class Pacer:
+    """
+    Spaces out the requests of every virtual user to a target rate.
+    """
+
+    def __init__(self, rps: float):
+        self.interval = 1 / rps if rps else 0
+        self.next_at = time.perf_counter()
+
+    async def wait(self) -> None:
+        if not self.interval:
+            return
+        now = time.perf_counter()
+        slot = max(self.next_at, now)
+        self.next_at = slot + self.interval
+        await asyncio.sleep(slot - now)
+
+
+@dataclass
+class StepStats:
+    """
+    Measurements of a journey step's requests.
+    """
+    requests: int = 0
+    errors: int = 0
+    latencies: list[float] = field(default_factory=list)
+    queries: list[int] = field(default_factory=list)
+
+    def percentile(self, p: float) -> float:
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * p))]
+
+
+@dataclass
+class Load:
+    """
+    State shared by the virtual users.
+    """
+    pacer: Pacer
+    shops: list[tuple[str, str]]
+    weights: list[int]
+    deadline: float
+    stats: dict[str, StepStats] = field(
+        default_factory=lambda: defaultdict(StepStats)
+    )
+
+
+class VirtualUser:
+    """
+    A client with its own cookies, replaying journeys.
+    """
+
+    def __init__(self, load: Load, transport, base_url: str):
+        self.load = load
+        self.client = httpx.AsyncClient(
+            transport=transport, base_url=base_url, timeout=30
+        )
+
+    def pick_shop(self) -> tuple[str, str]:
+        return random.choices(self.load.shops, self.load.weights)[0]
+
+    async def request(
+        self,
+        step: str,
+        method: str,
+        url: str,
+        expected: int = 200,
+        **kwargs
+    ) -> httpx.Response | None:
+        await self.load.pacer.wait()
+        stats = self.load.stats[step]
+        stats.requests += 1
+
+        start = time.perf_counter()
+        try:
+            response = await self.client.request(method, url, **kwargs)
+        except httpx.HTTPError as e:
+            stats.errors += 1
+            logger.warning(f'{step}: {e!r}')
+            return None
+        stats.latencies.append((time.perf_counter() - start) * 1000)
+
+        if QUERIES_HEADER in response.headers:
+            stats.queries.append(int(response.headers[QUERIES_HEADER]))
+        if response.status_code != expected:
+            stats.errors += 1
+        return response
+
+
+async def browser(vu: VirtualUser) -> None:
+    shop_id, shop_name = vu.pick_shop()
+    await vu.request('catalog', 'GET', '/api/products/')
+    await vu.request(
+        'catalog_page', 'GET', '/api/products/',
+        params={'in_stock': 'true', 'page': random.randint(1, 5)}
+    )
+    await vu.request(
+        'autocomplete', 'GET', '/api/shops/autocomplete',
+        params={'q': shop_name[:random.randint(1, 4)]}
+    )
+    await vu.request('shop', 'GET', f'/api/shops/{shop_id}')
+    await vu.request(
+        'shop_catalog', 'GET', '/api/products/',
+        params={'shop_id': shop_id}
+    )
+
+
+async def shopper(vu: VirtualUser) -> None:
+    email = f'load-{uuid.uuid4().hex[:12]}@{EMAIL_DOMAIN}'
+    vu.client.cookies.clear()
+
+    response = await vu.request(
+        'register', 'POST', '/api/users/', expected=201,
+        data={'email': email, 'password': PASSWORD, 'display_name': 'Load'}
+    )
+    if response is None or response.status_code != 201:
+        return
+
+    # NOTE: Stands for the email verification, which isn't an endpoint.
+    await sync_to_async(
+        CustomUser.objects.filter(email=email).update
+    )(is_verified=True)
+
+    response = await vu.request('login_page', 'GET', '/users/login/')
+    match = response and CSRF_INPUT_RE.search(response.text)
+    if not match:
+        return
+    await vu.request(
+        'login', 'POST', '/users/login/', expected=302,
+        data={
+            'username': email,
+            'password': PASSWORD,
+            'csrfmiddlewaretoken': match.group(1)
+        }
+    )
+
+    shop_id, _ = vu.pick_shop()
+    await vu.request('shop', 'GET', f'/api/shops/{shop_id}')
+    await vu.request(
+        'shop_catalog', 'GET', '/api/products/',
+        params={'shop_id': shop_id}
+    )
+    await vu.request('profile', 'GET', '/users/profile/')
+
+
+JOURNEYS = {
+    'browser': browser,
+    'shopper': shopper,
+}
+
+
+async def run_user(vu: VirtualUser, mix: dict[str, int]) -> None:
+    journeys = [JOURNEYS[name] for name in mix]
+    weights = list(mix.values())
+    try:
+        while time.perf_counter() < vu.load.deadline:
+            await random.choices(journeys, weights)[0](vu)
+    finally:
+        await vu.client.aclose()
+
+
+async def run(args, shops: list[tuple[str, str, int]]) -> Load:
+    if args.mode == 'http':
+        transport, base_url = None, args.url
+    else:
+        transport = make_transport(args.mode, args.workers)
+        base_url = 'http://localhost'
+
+    load = Load(
+        pacer=Pacer(args.rps),
+        shops=[(str(shop_id), name) for shop_id, name, _ in shops],
+        weights=[count + 1 for _, _, count in shops],
+        deadline=time.perf_counter() + args.duration
+    )
+    await asyncio.gather(*(
+        run_user(VirtualUser(load, transport, base_url), args.mix)
+        for _ in range(args.users)
+    ))
+    if isinstance(transport, ThreadedWSGITransport):
+        transport.shutdown()
+    return load
+
+
+def report(load: Load, elapsed: float) -> dict[str, dict]:
+    """
+    Print the measurements per step, and return them.
+    """
+    results = {}
+    print(
+        f'{"step":<14} {"requests":>8} {"rps":>7} {"p50 ms":>8} '
+        f'{"p95 ms":>8} {"p99 ms":>8} {"errors":>7} {"queries":>8}'
+    )
+    for step, stats in sorted(load.stats.items()):
+        if not stats.latencies:
+            print(f'{step:<14} {stats.requests:>8} (no responses)')
+            continue
+
+        results[step] = {
+            'requests': stats.requests,
+            'rps': stats.requests / elapsed,
+            'p50_ms': stats.percentile(0.50),
+            'p95_ms': stats.percentile(0.95),
+            'p99_ms': stats.percentile(0.99),
+            'error_rate': stats.errors / stats.requests,
+            'queries_avg': (
+                sum(stats.queries) / len(stats.queries)
+                if stats.queries else None
+            ),
+            'queries_max': max(stats.queries, default=None),
+        }
+        result = results[step]
+        queries = (
+            f'{result["queries_avg"]:.1f}'
+            if result['queries_avg'] is not None else '-'
+        )
+        print(
+            f'{step:<14} {result["requests"]:>8} {result["rps"]:>7.1f} '
+            f'{result["p50_ms"]:>8.1f} {result["p95_ms"]:>8.1f} '
+            f'{result["p99_ms"]:>8.1f} {result["error_rate"]:>7.1%} '
+            f'{queries:>8}'
+        )
+
+    total = sum(r['requests'] for r in results.values())
+    print(f'{total} requests in {elapsed:.1f}s ({total / elapsed:.1f} rps)')
+    return results
+
+
+def cleanup() -> None:
+    for user in CustomUser.objects.filter(email__endswith=f'@{EMAIL_DOMAIN}'):
+        user.delete()
+
+
+def parse_mix(value: str) -> dict[str, int]:
+    mix = {}
+    for item in value.split(','):
+        name, _, weight = item.partition('=')
+        if name not in JOURNEYS:
+            raise argparse.ArgumentTypeError(f'Unknown journey "{name}".')
+        mix[name] = int(weight or 1)
+    return mix
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        '--mode', choices=('asgi', 'wsgi', 'http'), default='asgi'
+    )
+    parser.add_argument('--url', default='http://localhost:8000')
+    parser.add_argument(
+        '--workers', type=int, default=4,
+        help='Number of threads of the in-process WSGI app.'
+    )
+    parser.add_argument(
+        '--users', type=int, default=20,
+        help='Number of concurrent virtual users.'
+    )
+    parser.add_argument(
+        '--rps', type=float, default=50,
+        help='Target requests per second, 0 for as fast as possible.'
+    )
+    parser.add_argument('--duration', type=float, default=30)
+    parser.add_argument(
+        '--mix', type=parse_mix, default='browser=9,shopper=1',
+        help='Weights of the journeys.'
+    )
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--output', default=None, help='JSON results.')
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+
+    # Silence the per-request logs. (e.g. registrations)
+    logger.disable('users')
+
+    shops = list(
+        Shop.objects
+        .filter(is_active=True)
+        .order_by('-follower_count')
+        .values_list('shop_id', 'shop_name', 'follower_count')[:1000]
+    )
+    if not shops:
+        raise SystemExit('No active shops, run `manage.py seed` first.')
+
+    workers = f' ({args.workers} workers)' if args.mode == 'wsgi' else ''
+    print(
+        f'{args.users} users, {args.rps or "max"} rps, {args.duration:g}s, '
+        f'{args.mode}{workers}:'
+    )
+    try:
+        start = time.perf_counter()
+        load = asyncio.run(run(args, shops))
+        results = report(load, time.perf_counter() - start)
+    finally:
+        cleanup()
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({'args': vars(args), 'results': results}, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,102 @@
+"""
+Load test of the user registration, sync vs async.
+
+Runs N concurrent registrations on one event loop, like an ASGI
+worker would:
+- sync: `register_user()` wrapped by `sync_to_async()`, which is how
+  Django's ASGI handler runs a sync view (on a single shared thread).
+- async: `aregister_user()`, as called by the async users endpoint.
+
+NOTE: This writes to the configured database and storage. The created
+users (and their avatars) are deleted afterwards.
+
+Usage:
+    python -m benchmarks.load_register [--concurrency 200] [--avatar]
+"""
+import argparse
+import asyncio
+import time
+import uuid
+from io import BytesIO
+
+from .utils import setup_django
+
+setup_django()
+
+from asgiref.sync import sync_to_async  # noqa: E402
+from django.core.files.uploadedfile import SimpleUploadedFile  # noqa: E402
+from loguru import logger  # noqa: E402
+from PIL import Image  # noqa: E402
+
+from users.models import CustomUser  # noqa: E402
+from users.resources.register import (  # noqa: E402
+    aregister_user,
+    register_user
+)
+
+
+def make_avatar() -> SimpleUploadedFile:
+    """
+    Create a small uploaded PNG image.
+    """
+    img_io = BytesIO()
+    Image.new('RGB', (600, 600), color=(200, 80, 40)).save(img_io, 'PNG')
+    return SimpleUploadedFile(
+        'avatar.png', img_io.getvalue(), content_type='image/png'
+    )
+
+
+async def run(mode: str, concurrency: int, avatar: bool) -> float:
+    """
+    Run the concurrent registrations, returning the elapsed seconds.
+    """
+    run_id = uuid.uuid4().hex[:8]
+    register = (
+        aregister_user if mode == 'async'
+        else sync_to_async(register_user)
+    )
+
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        register(
+            email=f'load-{mode}-{run_id}-{i}@loadtest.expoph.com',
+            password='Lo4d-test-pa$$word',
+            avatar=make_avatar() if avatar else None
+        )
+        for i in range(concurrency)
+    ))
+    return time.perf_counter() - start
+
+
+def cleanup() -> None:
+    for user in CustomUser.objects.filter(
+        email__startswith='load-', email__endswith='@loadtest.expoph.com'
+    ):
+        if user.avatar:
+            user.avatar.delete(save=False)
+        user.delete()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--concurrency', type=int, default=200)
+    parser.add_argument('--avatar', action='store_true')
+    args = parser.parse_args()
+
+    # Silence the per-user success logs.
+    logger.disable('users')
+
+    print(f'{args.concurrency} concurrent registrations:')
+    try:
+        for mode in ('sync', 'async'):
+            elapsed = asyncio.run(run(mode, args.concurrency, args.avatar))
+            print(
+                f'  {mode:<6} {elapsed:>7.2f} s  '
+                f'({args.concurrency / elapsed:>7.1f} registrations/s)'
+            )
+    finally:
+        cleanup()
+
+
+if __name__ == '__main__':
+    main()
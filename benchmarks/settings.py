@@ -0,0 +1,38 @@
+"""
+Offline settings of the benchmark suite. (see `python -m benchmarks`)
+
+Runs against an in-memory SQLite database, the local memory cache and
+an in-memory file storage, so the suite needs no network access and
+no `.env` file.
+"""
+import os
+
+from core.settings import *  # noqa: F401, F403
+
+SECRET_KEY = os.getenv('DJANGO_SECRET_KEY') or 'benchmarks-offline-key'
+DEBUG = False
+
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': ':memory:',
+    }
+}
+DATABASE_ROUTERS = []
+DB_REPLICAS = []
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'benchmarks',
+    }
+}
+
+STORAGES = {
+    'default': {
+        'BACKEND': 'django.core.files.storage.InMemoryStorage'
+    },
+    'staticfiles': {
+        'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage'
+    }
+}
@@ -0,0 +1,236 @@
+"""
+Benchmarks of the project's hot paths, run by `python -m benchmarks`.
+
+Each benchmark is a setup function, registered with `@benchmark()`,
+that prepares its data and returns the operation to time.
+
+NOTE: Imported once Django is set up, with the offline settings.
+"""
+import itertools
+from collections.abc import Callable
+from dataclasses import dataclass
+from io import BytesIO
+from types import SimpleNamespace
+
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from PIL import Image
+
+from core.handlers import resize_image_file_handler
+from core.storage.backends import SupabaseS3Storage
+from core.utilities.snowflake import SnowflakeGenerator
+from shop.models import Product, Shop
+from shop.models.utils import ProductType
+from users.models import CustomUser
+from users.models.user import generate_uid
+from users.resources.register import register_user
+
+__all__ = [
+    'BENCHMARKS',
+    'Benchmark',
+    'benchmark'
+]
+
+# Sizes (width, height) and formats of the resized images.
+IMAGE_SIZES = {
+    'small': (640, 480),
+    'medium': (1920, 1080),
+    'large': (4000, 3000),
+}
+IMAGE_FORMATS = ('JPEG', 'PNG', 'WEBP')
+
+# Password of the registered users. (hashed with the real hasher)
+PASSWORD = 'b3nchmark-Passw0rd!'
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    """
+    A registered benchmark.
+
+    Attributes:
+        name (str): Dotted name, stored in the results.
+        setup (Callable): Prepares the data, and returns the operation.
+        number (int): Number of operations per round.
+        repeat (int): Number of rounds, the fastest one is kept.
+    """
+    name: str
+    setup: Callable[[], Callable[[], object]]
+    number: int
+    repeat: int = 5
+
+
+# Registered benchmarks, in order.
+BENCHMARKS: list[Benchmark] = []
+
+# Counter of the unique values (e.g. emails) of the operations.
+_counter = itertools.count()
+
+
+def benchmark(name: str, number: int, repeat: int = 5):
+    """
+    Decorator that registers a benchmark's setup function.
+
+    Examples:
+        >>> @benchmark('snowflake.generate_id', number=100_000)
+        >>> def bench_generate_id():
+        >>>     generator = SnowflakeGenerator(worker_id=1, process_id=1)
+        >>>     return generator.generate_id
+    """
+    def decorator(setup):
+        BENCHMARKS.append(Benchmark(name, setup, number, repeat))
+        return setup
+    return decorator
+
+
+def _image(size: tuple[int, int], fmt: str) -> bytes:
+    """
+    Encode a noisy image, which compresses like a photo would.
+    """
+    img = Image.effect_noise(size, 48).convert('RGB')
+    if fmt == 'PNG':
+        img = img.convert('RGBA')  # e.g. screenshots with transparency
+
+    img_io = BytesIO()
+    img.save(img_io, format=fmt)
+    return img_io.getvalue()
+
+
+def _shop() -> Shop:
+    n = next(_counter)
+    user = CustomUser.objects.create_user(f'owner{n}@example.com')
+    return Shop.objects.create(user=user, shop_name=f'Bench Shop {n}')
+
+
+# Snowflake IDs.
+
+@benchmark('snowflake.generate_id', number=100_000)
+def bench_generate_id():
+    generator = SnowflakeGenerator(worker_id=1, process_id=1)
+    return generator.generate_id
+
+
+@benchmark('users.generate_uid', number=100_000)
+def bench_generate_uid():
+    return generate_uid
+
+
+# Image resizing, per size and format.
+
+def _bench_resize(size: tuple[int, int], fmt: str):
+    content = _image(size, fmt)
+
+    def resize():
+        return resize_image_file_handler(
+            SimpleUploadedFile(f'image.{fmt.lower()}', content)
+        )
+    return resize
+
+
+for _label, _size in IMAGE_SIZES.items():
+    for _fmt in IMAGE_FORMATS:
+        benchmark(
+            f'handlers.resize_image.{_label}.{_fmt.lower()}',
+            number=1 if _label == 'large' else 5,
+            repeat=3
+        )(lambda size=_size, fmt=_fmt: _bench_resize(size, fmt))
+
+
+# Products and followers.
+
+@benchmark('shop.product_save_sku', number=200)
+def bench_product_save():
+    shop = _shop()
+
+    def save():
+        Product(
+            fk_shop=shop,
+            product_type=ProductType.PHYSICAL,
+            name='Bench Product'
+        ).save()
+    return save
+
+
+@benchmark('users.follow_unfollow_shop', number=200)
+def bench_follow_unfollow():
+    shop = _shop()
+    user = CustomUser.objects.create_user(
+        f'follower{next(_counter)}@example.com'
+    )
+    shop_id = str(shop.shop_id)
+
+    def follow_unfollow():
+        user.follow_shop(shop_id)
+        user.unfollow_shop(shop_id)
+    return follow_unfollow
+
+
+# Registration, end to end. (validation, hashing, insert, avatar)
+
+@benchmark('users.register_user', number=3, repeat=3)
+def bench_register_user():
+    def register():
+        return register_user(
+            email=f'user{next(_counter)}@example.com',
+            password=PASSWORD,
+            display_name='Bench User'
+        )
+    return register
+
+
+@benchmark('users.register_user.avatar', number=3, repeat=3)
+def bench_register_user_avatar():
+    content = _image(IMAGE_SIZES['small'], 'PNG')
+
+    def register():
+        return register_user(
+            email=f'user{next(_counter)}@example.com',
+            password=PASSWORD,
+            display_name='Bench User',
+            avatar=SimpleUploadedFile(
+                'avatar.png', content, content_type='image/png'
+            )
+        )
+    return register
+
+
+# Signed URLs, against a local stub of the Supabase storage API.
+
+class StubSupabaseS3Storage(SupabaseS3Storage):
+    """
+    Supabase storage whose API client signs URLs locally.
+    """
+    supabase = SimpleNamespace(storage=SimpleNamespace(
+        from_=lambda bucket_id: SimpleNamespace(
+            create_signed_url=lambda path, expires_in: {
+                'signedURL': f'https://stub.local/{path}?token=signed'
+            }
+        )
+    ))
+
+    def _supabase_bucket(self):
+        return self.supabase.storage.from_(self.bucket_name)
+
+
+def _stub_storage() -> StubSupabaseS3Storage:
+    cache.clear()
+    return StubSupabaseS3Storage(bucket_name='benchmarks')
+
+
+@benchmark('storage.signed_url.miss', number=5_000)
+def bench_signed_url_miss():
+    storage = _stub_storage()
+
+    def url():
+        return storage.url(f'users/{next(_counter)}/avatar.jpg')
+    return url
+
+
+@benchmark('storage.signed_url.hit', number=5_000)
+def bench_signed_url_hit():
+    storage = _stub_storage()
+    storage.url('users/1/avatar.jpg')
+
+    def url():
+        return storage.url('users/1/avatar.jpg')
+    return url
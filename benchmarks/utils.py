@@ -0,0 +1,34 @@
+import os
+import time
+from collections.abc import Callable
+
+import django
+
+
+def setup_django() -> None:
+    """
+    Set up Django for a standalone benchmark script.
+    """
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'core.settings')
+    django.setup()
+
+
+def measure(func: Callable[[], object], number: int, repeat: int = 5) -> float:
+    """
+    Measure the best average time per call of `func`, in microseconds.
+
+    Args:
+        func (Callable): The function to call, without arguments.
+        number (int): Number of calls per round.
+        repeat (int): Number of rounds, the fastest one is kept.
+
+    Returns:
+        float: The time per call in microseconds.
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        best = min(best, time.perf_counter() - start)
+    return best / number * 1_000_000
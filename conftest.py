@@ -0,0 +1,94 @@
+from decimal import Decimal
+
+import pytest
+
+pytest_plugins = ['core.testing.pytest_plugin']
+
+# Size of the seeded fixtures, large enough to reveal queries per row.
+NUM_USERS = 60
+NUM_SHOPS = 6
+NUM_PRODUCTS_PER_SHOP = 30
+
+
+@pytest.fixture(autouse=True)
+def shared_cache(monkeypatch):
+    """
+    Treat the local memory cache as shared, as the tests run in a single
+    process. (like a Redis cache in production)
+    """
+    from core.sessions import backends
+    from users import middleware
+
+    for module in (backends, middleware):
+        monkeypatch.setattr(module, 'is_process_local', lambda alias: False)
+
+
+@pytest.fixture
+def staff_user(db, django_user_model):
+    """
+    A superuser, for the admin pages.
+    """
+    return django_user_model.objects.create_superuser(
+        email='staff@example.com',
+        password='password'
+    )
+
+
+@pytest.fixture
+def seeded(db, django_user_model) -> dict:
+    """
+    Seed users, shops with followers, and products with their inventory
+    and facets, in bulk.
+
+    Returns:
+        dict: The seeded `users`, `shops` and `products`.
+    """
+    from shop.models import Product, ProductInventory, Shop, ShopFollower
+    from shop.models.utils import ProductType
+    from shop.resources.facets import rebuild_facets
+
+    users = django_user_model.objects.bulk_create([
+        django_user_model(
+            email=f'user{i}@example.com',
+            display_name=f'User {i}'
+        )
+        for i in range(NUM_USERS)
+    ])
+
+    # NOTE: The owners follow every other shop.
+    shops = Shop.objects.bulk_create([
+        Shop(
+            user=users[i],
+            shop_name=f'Shop {i}',
+            description=f'The shop of user {i}.',
+            follower_count=NUM_USERS - 1,
+            is_active=True
+        )
+        for i in range(NUM_SHOPS)
+    ])
+    ShopFollower.objects.bulk_create([
+        ShopFollower(fk_user=user, fk_shop=shop)
+        for shop in shops
+        for user in users
+        if user.email != shop.user_id
+    ])
+
+    products = Product.objects.bulk_create([
+        Product(
+            fk_shop=shop,
+            sku=f'SHOP{i}-PHY-{j:06}',
+            product_type=ProductType.PHYSICAL,
+            name=f'Product {j}',
+            price=Decimal(100 + j * 50),
+            is_listed=True
+        )
+        for i, shop in enumerate(shops)
+        for j in range(NUM_PRODUCTS_PER_SHOP)
+    ])
+    ProductInventory.objects.bulk_create([
+        ProductInventory(product=product, qty=index % 5)
+        for index, product in enumerate(products)
+    ])
+    rebuild_facets()
+
+    return {'users': users, 'shops': shops, 'products': products}
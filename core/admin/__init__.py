@@ -0,0 +1,4 @@
+# flake8: noqa
+from core.admin.inlines import *
+from core.admin.mixins import *
+from core.admin.paginator import *
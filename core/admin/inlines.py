@@ -0,0 +1,111 @@
+from django.contrib import admin
+from django.core.paginator import Paginator
+from django.forms.models import BaseInlineFormSet
+
+__all__ = [
+    'PaginatedInlineFormSet',
+    'PaginatedTabularInline'
+]
+
+
+class PaginatedInlineFormSet(BaseInlineFormSet):
+    """
+    Inline formset that only loads a single page of its objects.
+
+    NOTE: The page is read from the query string, which is kept when
+    the change form is submitted, so the forms of the page are saved
+    against the same objects.
+
+    NOTE: Only the page's objects are loaded, so submitted forms of
+    objects that moved to another page meanwhile are ignored.
+    """
+    per_page = 20
+    page_param = 'p'
+
+    # Set per request by `PaginatedTabularInline.get_formset()`.
+    page_number = 1
+    total_count = None
+    params = None
+
+    def get_queryset(self):
+        if not hasattr(self, '_queryset'):
+            self.page = self.paginate(super().get_queryset())
+            self._queryset = list(self.page.object_list)
+
+            # NOTE: Avoids a query per row for the parent. (e.g. `__str__`)
+            for obj in self._queryset:
+                self.fk.set_cached_value(obj, self.instance)
+        return self._queryset
+
+    def paginate(self, queryset):
+        """
+        Get the requested page of the queryset, counted from
+        `total_count` when known.
+        """
+        paginator = Paginator(queryset, self.per_page)
+        if self.total_count is not None:
+            # NOTE: Skips the `COUNT(*)` of the related objects.
+            paginator.count = self.total_count
+        return paginator.get_page(self.page_number)
+
+    def page_links(self) -> list[tuple[int | str, str | None]]:
+        """
+        Get the number and query string of the pages around the current
+        page, with `None` as query string for the current page and the
+        elided ones.
+        """
+        links = []
+        for number in self.page.paginator.get_elided_page_range(
+            self.page.number, on_each_side=2, on_ends=1
+        ):
+            if number == self.page.number or not isinstance(number, int):
+                links.append((number, None))
+                continue
+
+            params = self.params.copy()
+            params[self.page_param] = number
+            links.append((number, f'?{params.urlencode()}'))
+        return links
+
+
+class PaginatedTabularInline(admin.TabularInline):
+    """
+    Tabular inline that renders a single page of the related objects,
+    with a pager, instead of every object on the change page.
+
+    Override `get_total_count()` with a denormalized count when there is
+    one, and `get_queryset()` to `select_related()` what the rows show.
+
+    Examples:
+        >>> class ShopFollowerInline(PaginatedTabularInline):
+        >>>     model = ShopFollower
+        >>>     per_page = 25
+        >>>     page_param = 'followers_page'
+        >>>
+        >>>     def get_total_count(self, obj):
+        >>>         return obj.follower_count
+    """
+    formset = PaginatedInlineFormSet
+    template = 'admin/edit_inline/paginated_tabular.html'
+    per_page = 20
+    page_param = 'p'
+
+    def get_total_count(self, obj) -> int | None:
+        """
+        Get the number of related objects of the parent instance, or
+        None to count them.
+        """
+        return None
+
+    def get_formset(self, request, obj=None, **kwargs):
+        formset = super().get_formset(request, obj, **kwargs)
+
+        # NOTE: The formset class is created per request.
+        formset.per_page = self.per_page
+        formset.page_param = self.page_param
+        formset.page_number = request.GET.get(self.page_param, 1)
+        formset.total_count = (
+            self.get_total_count(obj) if obj is not None else 0
+        )
+        formset.params = request.GET.copy()
+        return formset
@@ -0,0 +1,64 @@
+import json
+from functools import cached_property
+
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import QuerySet
+
+__all__ = ['EstimatedCountPaginator']
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator that uses PostgreSQL's planner estimates as the count of
+    large querysets, instead of a `COUNT(*)` over the whole table.
+
+    - Unfiltered querysets use the table's `pg_class.reltuples`.
+    - Filtered querysets use the row estimate of their `EXPLAIN` plan.
+
+    Estimates under `exact_count_threshold` are counted exactly, as the
+    count is cheap and the last page should stay accurate. Other
+    database backends always count exactly.
+
+    NOTE: Use with `show_full_result_count = False` on the admin, which
+    otherwise runs another `COUNT(*)` of the unfiltered table.
+    """
+    exact_count_threshold = 10_000
+
+    @cached_property
+    def count(self) -> int:
+        estimate = self.estimate()
+        if estimate is None or estimate < self.exact_count_threshold:
+            return super().count
+        return estimate
+
+    def estimate(self) -> int | None:
+        """
+        Get the planner's row estimate of the object list, if possible.
+        """
+        queryset = self.object_list
+        if not isinstance(queryset, QuerySet):
+            return None
+
+        connection = connections[queryset.db]
+        if connection.vendor != 'postgresql':
+            return None
+
+        with connection.cursor() as cursor:
+            if not queryset.query.where:
+                cursor.execute(
+                    'SELECT reltuples::bigint FROM pg_class '
+                    'WHERE oid = to_regclass(%s)',
+                    [connection.ops.quote_name(queryset.model._meta.db_table)]
+                )
+                row = cursor.fetchone()
+
+                # NOTE: -1 when the table was never analyzed.
+                return row[0] if row and row[0] >= 0 else None
+
+            sql, params = queryset.query.sql_with_params()
+            cursor.execute(f'EXPLAIN (FORMAT JSON) {sql}', params)
+            plan = cursor.fetchone()[0]
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            return int(plan[0]['Plan']['Plan Rows'])
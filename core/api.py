@@ -1,10 +1,17 @@
+import os
+
 from django.contrib.admin.views.decorators import staff_member_required
 from ninja import NinjaAPI, Redoc
 
+from .db.pool import pool_stats
+from .renderers import ORJSONRenderer
+from .security import StaffSessionAuth
+
 # Instantiate the NinjaAPI object.
 api = NinjaAPI(
     docs=Redoc(),
     docs_decorator=staff_member_required,
+    renderer=ORJSONRenderer(),
     title='Expo PH API',
     description=(
         'This is the official API for Expo PH for the '
@@ -16,3 +23,14 @@ api = NinjaAPI(
 
 # TODO: Add routers per application. (09-19-2024)
 api.add_router('/users/', 'users.api.user.router')
+api.add_router('/shops/', 'shop.api.shop.router')
+api.add_router('/products/', 'shop.api.product.router')
+
+
+@api.get('/internal/db-pool', auth=StaffSessionAuth(), include_in_schema=False)
+def db_pool_stats(request):
+    """
+    Get the stats of the database connection pools of the process
+    serving the request. (e.g. wait time, connections in use, timeouts)
+    """
+    return {'pid': os.getpid(), 'pools': pool_stats()}
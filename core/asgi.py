@@ -11,6 +11,11 @@ import os
 
 from django.core.asgi import get_asgi_application
 
+from core.db.pool import install_fork_handler
+
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'core.settings')
 
 application = get_asgi_application()
+
+# Open new database connections in forked workers. (e.g. gunicorn --preload)
+install_fork_handler()
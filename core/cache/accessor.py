@@ -0,0 +1,119 @@
+import pickle
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+
+from .tiered import tiered_cache
+
+__all__ = ['CachedAccessor']
+
+
+class CachedAccessor:
+    """
+    Read-through accessor of model instances on the two-tier cache.
+
+    Instances are cached under their primary key, while each unique
+    lookup field (e.g. `email`) only caches a pointer to the primary
+    key. Saving or deleting an instance invalidates its primary key
+    entry, and a pointer is verified against the instance on read, so
+    a changed lookup value is never served stale.
+
+    NOTE: Each call returns a fresh copy of the instance, so it's safe
+    to modify and save.
+
+    Examples:
+        >>> class Shop(models.Model):
+        >>>     cached = CachedAccessor(lookups=('shop_id',))
+        >>>
+        >>> Shop.cached.get(shop_id=shop_id)
+    """
+
+    def __init__(self, lookups: tuple[str, ...] = (), timeout: int = 300):
+        self.lookups = ('pk', *lookups)
+        self.timeout = timeout
+        self.model = None
+
+    def __set_name__(self, owner, name):
+        self.model = owner
+        post_save.connect(self._invalidate, sender=owner, weak=False)
+        post_delete.connect(self._invalidate, sender=owner, weak=False)
+
+    def __get__(self, instance, owner):
+        if instance is not None:
+            raise AttributeError(
+                'Cached accessor is only accessible via the model class.'
+            )
+        return self
+
+    def _key(self, field: str, value) -> str:
+        return f'model:{self.model._meta.label_lower}:{field}:{value}'
+
+    def _invalidate(self, sender, instance, **kwargs):
+        self.invalidate(instance.pk)
+
+    def invalidate(self, *pks) -> None:
+        """
+        Invalidate the cached instances of primary keys, for changes
+        that send no signal. (e.g. `QuerySet.update()`)
+        """
+        keys = [self._key('pk', pk) for pk in pks]
+
+        # NOTE: Deleted again on commit, in case a concurrent read cached
+        # the uncommitted (old) row in between. Only then is it broadcast
+        # to the other processes, with a single `NOTIFY`.
+        tiered_cache.delete_many(keys, broadcast=False)
+        transaction.on_commit(lambda: tiered_cache.delete_many(keys))
+
+    def _fetch(self, **lookup):
+        """
+        Get the instance from the database, and cache it.
+        """
+        obj = self.model._default_manager.get(**lookup)
+        self.prime(obj)
+        return obj
+
+    def prime(self, obj) -> None:
+        """
+        Cache an instance that was just loaded from the database.
+        """
+        tiered_cache.set(
+            self._key('pk', obj.pk),
+            pickle.dumps(obj),
+            timeout=self.timeout
+        )
+        for field in self.lookups[1:]:
+            tiered_cache.set(
+                self._key(field, getattr(obj, field)),
+                obj.pk,
+                timeout=self.timeout
+            )
+
+    def get(self, **lookup):
+        """
+        Get a single instance by its primary key or a unique field.
+
+        Raises:
+            ValueError: If not given exactly one of the allowed lookups.
+            DoesNotExist: If no instance matches the lookup.
+        """
+        if len(lookup) != 1 or next(iter(lookup)) not in self.lookups:
+            raise ValueError(
+                f'Expected exactly one lookup of: {", ".join(self.lookups)}'
+            )
+        (field, value), = lookup.items()
+
+        pk = value if field == 'pk' else tiered_cache.get(
+            self._key(field, value)
+        )
+        if pk is None:
+            return self._fetch(**lookup)
+
+        data = tiered_cache.get(self._key('pk', pk))
+        if data is None:
+            return self._fetch(**lookup)
+
+        # Verify the pointer still matches. (e.g. a changed email)
+        obj = pickle.loads(data)
+        if field != 'pk' and str(getattr(obj, field)) != str(value):
+            return self._fetch(**lookup)
+        return obj
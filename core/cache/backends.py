@@ -0,0 +1,13 @@
+from django.core.cache import caches
+from django.core.cache.backends.locmem import LocMemCache
+
+__all__ = ['is_process_local']
+
+
+def is_process_local(alias: str = 'default') -> bool:
+    """
+    Check if a cache only lives in the current process, so its entries
+    (and deletions) aren't seen by the other worker processes.
+    (e.g. `LocMemCache`, the default when `CACHE_BACKEND` isn't set)
+    """
+    return isinstance(caches[alias], LocMemCache)
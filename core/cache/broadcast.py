@@ -0,0 +1,155 @@
+import os
+import threading
+import time
+from collections.abc import Callable
+
+from django.conf import settings
+from django.db import connection, connections
+from loguru import logger
+
+__all__ = [
+    'publish_invalidation',
+    'subscribe_invalidations'
+]
+
+# Callbacks to run for each invalidated key received.
+# NOTE: Called with None when invalidations might have been missed.
+_subscribers: list[Callable[[str | None], None]] = []
+
+# Max size in bytes of a notification's payload, below PostgreSQL's 8000.
+MAX_PAYLOAD_SIZE = 7900
+
+# The listener thread of the current process. (see `_ensure_listener`)
+_listener: threading.Thread | None = None
+_listener_pid: int | None = None
+_listener_lock = threading.Lock()
+
+
+def _channel() -> str:
+    return getattr(
+        settings,
+        'CACHE_INVALIDATION_CHANNEL',
+        'expoph_cache_invalidation'
+    )
+
+
+def _is_supported() -> bool:
+    return settings.DATABASES['default']['ENGINE'].endswith('postgresql')
+
+
+def _payloads(keys: tuple[str, ...]):
+    """
+    Group keys into newline-separated payloads of a bounded size.
+    """
+    payload = ''
+    for key in keys:
+        if payload and len(payload) + len(key) + 1 > MAX_PAYLOAD_SIZE:
+            yield payload
+            payload = ''
+        payload = f'{payload}\n{key}' if payload else key
+    if payload:
+        yield payload
+
+
+def publish_invalidation(*keys: str) -> None:
+    """
+    Broadcast the invalidation of cache keys to every process.
+
+    Uses PostgreSQL's `NOTIFY`, which is transactional: when called
+    inside a transaction, the notification is only delivered once it
+    commits. This is a no-op on other database backends.
+
+    NOTE: The keys are sent together, in as few notifications as their
+    size allows. (e.g. the shops of an admin action's chunk)
+
+    Args:
+        *keys (str): The invalidated cache keys.
+    """
+    if not _is_supported():
+        return
+    with connection.cursor() as cursor:
+        for payload in _payloads(keys):
+            cursor.execute(
+                'SELECT pg_notify(%s, %s)', [_channel(), payload]
+            )
+
+
+def subscribe_invalidations(
+    callback: Callable[[str | None], None]
+) -> None:
+    """
+    Register a callback to run for every broadcasted invalidation,
+    starting this process' listener if it isn't running yet.
+
+    Args:
+        callback (Callable[[str | None], None]): Called with the
+            invalidated key, or with None after the listener reconnects
+            (as invalidations might have been missed meanwhile).
+    """
+    if callback not in _subscribers:
+        _subscribers.append(callback)
+    _ensure_listener()
+
+
+def _ensure_listener() -> None:
+    """
+    Start the listener thread of the current process.
+
+    NOTE: Threads don't survive a `fork()`, so a forked worker
+    (e.g. gunicorn's) starts its own listener on first use.
+    """
+    global _listener, _listener_pid
+
+    if not _is_supported():
+        return
+
+    pid = os.getpid()
+    if _listener_pid == pid and _listener and _listener.is_alive():
+        return
+
+    with _listener_lock:
+        if _listener_pid == pid and _listener and _listener.is_alive():
+            return
+        _listener = threading.Thread(
+            target=_listen,
+            name='cache-invalidation-listener',
+            daemon=True
+        )
+        _listener_pid = pid
+        _listener.start()
+
+
+def _listen() -> None:
+    """
+    Listen for invalidations on a dedicated connection, reconnecting
+    with a backoff when the connection drops.
+    """
+    import psycopg
+
+    # NOTE: Connects like the default database, with its `OPTIONS` (e.g.
+    # `sslmode`), bypassing its pool and Django's cursors.
+    params = connections['default'].get_connection_params()
+    for name in ('cursor_factory', 'context'):
+        params.pop(name, None)
+
+    backoff, reconnecting = 1, False
+    while True:
+        try:
+            with psycopg.connect(**params, autocommit=True) as conn:
+                conn.execute(f'LISTEN "{_channel()}"')
+                backoff = 1
+
+                if reconnecting:
+                    for callback in _subscribers:
+                        callback(None)
+
+                for notify in conn.notifies():
+                    for key in notify.payload.split('\n'):
+                        for callback in _subscribers:
+                            callback(key)
+
+        except Exception as e:
+            logger.error(f'Cache invalidation listener error: {e}')
+            reconnecting = True
+            time.sleep(backoff)
+            backoff = min(backoff * 2, 30)
@@ -0,0 +1,284 @@
+import asyncio
+import hashlib
+import threading
+import time
+from functools import wraps
+from inspect import iscoroutinefunction
+
+from asgiref.sync import sync_to_async
+from django.core.cache import cache
+from django.http import HttpRequest, HttpResponse, JsonResponse
+from ninja.operation import Operation
+from ninja.utils import contribute_operation_callback
+
+__all__ = ['idempotent']
+
+# Header sent by clients to make a request idempotent.
+IDEMPOTENCY_HEADER = 'Idempotency-Key'
+
+# Prefix of the cache keys used by this module.
+_PREFIX = 'idempotency'
+
+
+def _client_id(request: HttpRequest) -> str:
+    """
+    Identify the client of a request, by user or by session.
+
+    NOTE: Anonymous clients without a session share one namespace, and
+    are told apart by their (random) keys and payload fingerprints,
+    instead of by IP address, as clients behind the same proxy would
+    share it.
+    """
+    user = getattr(request, 'user', None)
+    if user is not None and user.is_authenticated:
+        return f'user:{user.pk}'
+    session = getattr(request, 'session', None)
+    if session is not None and session.session_key:
+        return f'session:{session.session_key}'
+    return 'anonymous'
+
+
+def _fingerprint(request: HttpRequest) -> str:
+    """
+    Hash the payload of a request, to detect a key reused with another
+    payload.
+
+    NOTE: Multipart payloads are hashed from their parsed fields and
+    files' name and size, as their (large) raw body isn't kept.
+    """
+    if request.content_type == 'multipart/form-data':
+        raw = repr((
+            sorted(request.POST.lists()),
+            sorted(
+                (field, f.name, f.size)
+                for field, files in request.FILES.lists()
+                for f in files
+            )
+        )).encode()
+    else:
+        raw = request.body
+    return hashlib.sha256(raw).hexdigest()
+
+
+def _error(status: int, detail: str) -> HttpResponse:
+    return JsonResponse({'detail': detail}, status=status)
+
+
+def _invalid_key(msg: str) -> HttpResponse:
+    """
+    Get a `422` response shaped like Ninja's validation errors.
+    (see `Http422Message`)
+    """
+    return JsonResponse(
+        {
+            'detail': [
+                {
+                    'type': 'value_error',
+                    'loc': ['header', IDEMPOTENCY_HEADER],
+                    'msg': msg
+                }
+            ]
+        },
+        status=422
+    )
+
+
+def _replay(entry: dict) -> HttpResponse:
+    response = HttpResponse(
+        entry['content'],
+        status=entry['status'],
+        content_type=entry['content_type']
+    )
+    response['Idempotent-Replayed'] = 'true'
+    return response
+
+
+def idempotent(timeout: int = 60 * 60 * 24, lock_timeout: int = 30):
+    """
+    Decorator that makes a Ninja `POST` operation idempotent, given an
+    `Idempotency-Key` header sent by the client.
+
+    To be placed below the router's decorator. The first response
+    (status and body) is stored per client and key, then replayed on
+    retries with the same key, without running the view again.
+
+    - It runs after the operation's auth, CSRF and throttling checks,
+      and the payload's validation, which aren't stored.
+    - Concurrent duplicates wait on the request in flight instead of
+      redoing the work, or get a `409 Conflict` after `lock_timeout`.
+    - A key reused with another payload gets a `422`.
+    - Server errors (5xx) aren't stored, so they can be retried.
+
+    Requests without the header run as usual.
+
+    NOTE: The in-flight lock expires after `lock_timeout`, but is
+    extended while the view runs, so a slow request isn't run again by
+    a retry. (e.g. a large bulk registration)
+
+    Args:
+        timeout (int): Time in seconds to keep a stored response.
+        lock_timeout (int): Time in seconds before the lock of a
+            request that stopped (e.g. a killed worker) expires, and
+            that duplicates wait on a request in flight.
+
+    Returns:
+        Callable: A decorator for the operation's view.
+
+    Examples:
+        >>> @router.post('/')
+        >>> @idempotent()
+        >>> def register_user(request, details: Form[UserSchemaIn]):
+        >>>     ...
+    """
+    # Interval in seconds to extend the lock of a request in flight.
+    keepalive = max(lock_timeout / 3, 0.1)
+
+    def resolve(request: HttpRequest):
+        """
+        Get the request's cache key and payload fingerprint, or an error
+        response, or None if the request isn't idempotent.
+        """
+        idempotency_key = request.headers.get(IDEMPOTENCY_HEADER)
+        if not idempotency_key or request.method != 'POST':
+            return None
+        if len(idempotency_key) > 255:
+            return _invalid_key(
+                f'{IDEMPOTENCY_HEADER} must be at most 255 characters.'
+            )
+
+        raw = f'{_client_id(request)}#{request.path}#{idempotency_key}'
+        key = hashlib.sha256(raw.encode()).hexdigest()
+        return f'{_PREFIX}:{key}', _fingerprint(request)
+
+    def check(entry: dict, fingerprint: str) -> HttpResponse:
+        if entry['fingerprint'] != fingerprint:
+            return _invalid_key(
+                f'{IDEMPOTENCY_HEADER} was already used '
+                'with a different payload.'
+            )
+        return _replay(entry)
+
+    def store(key: str, response: HttpResponse, fingerprint: str) -> None:
+        # Server errors aren't stored, so they can be retried.
+        if response.status_code < 500 and not response.streaming:
+            cache.set(
+                key,
+                {
+                    'status': response.status_code,
+                    'content': response.content,
+                    'content_type': response['Content-Type'],
+                    'fingerprint': fingerprint
+                },
+                timeout=timeout
+            )
+
+    def in_flight() -> HttpResponse:
+        return _error(
+            409,
+            f'A request with this {IDEMPOTENCY_HEADER} is still '
+            'being processed. Please retry later.'
+        )
+
+    def extend_lock(lock: str, done: threading.Event) -> None:
+        while not done.wait(keepalive):
+            cache.touch(lock, lock_timeout)
+
+    async def aextend_lock(lock: str) -> None:
+        while True:
+            await asyncio.sleep(keepalive)
+            await cache.atouch(lock, lock_timeout)
+
+    def wrap(operation: Operation) -> None:
+        """
+        Wrap the operation's view, so it runs after the operation's
+        checks, and its result is rendered into the stored response.
+        """
+        func = operation.view_func
+
+        def render(request: HttpRequest, result) -> HttpResponse:
+            return operation._result_to_response(
+                request,
+                result,
+                operation.api.create_temporal_response(request)
+            )
+
+        if iscoroutinefunction(func):
+            @wraps(func)
+            async def async_view(request, **kwargs):
+                resolved = await sync_to_async(resolve)(request)
+                if resolved is None:
+                    return await func(request, **kwargs)
+                if isinstance(resolved, HttpResponse):
+                    return resolved
+
+                key, fingerprint = resolved
+                deadline = time.monotonic() + lock_timeout
+                while True:
+                    entry = await cache.aget(key)
+                    if entry is not None:
+                        return check(entry, fingerprint)
+
+                    # Only the request holding the lock runs the view.
+                    lock = f'{key}:lock'
+                    if await cache.aadd(lock, 1, lock_timeout):
+                        keeper = asyncio.create_task(aextend_lock(lock))
+                        try:
+                            response = render(
+                                request, await func(request, **kwargs)
+                            )
+                            await sync_to_async(store)(
+                                key, response, fingerprint
+                            )
+                            return response
+                        finally:
+                            keeper.cancel()
+                            await cache.adelete(lock)
+
+                    if time.monotonic() > deadline:
+                        return in_flight()
+                    await asyncio.sleep(0.1)
+
+            operation.view_func = async_view
+            return
+
+        @wraps(func)
+        def view(request, **kwargs):
+            resolved = resolve(request)
+            if resolved is None:
+                return func(request, **kwargs)
+            if isinstance(resolved, HttpResponse):
+                return resolved
+
+            key, fingerprint = resolved
+            deadline = time.monotonic() + lock_timeout
+            while True:
+                entry = cache.get(key)
+                if entry is not None:
+                    return check(entry, fingerprint)
+
+                # Only the request holding the lock runs the view.
+                lock = f'{key}:lock'
+                if cache.add(lock, 1, lock_timeout):
+                    done = threading.Event()
+                    threading.Thread(
+                        target=extend_lock, args=(lock, done), daemon=True
+                    ).start()
+                    try:
+                        response = render(request, func(request, **kwargs))
+                        store(key, response, fingerprint)
+                        return response
+                    finally:
+                        done.set()
+                        cache.delete(lock)
+
+                if time.monotonic() > deadline:
+                    return in_flight()
+                time.sleep(0.1)
+
+        operation.view_func = view
+
+    def decorator(func):
+        contribute_operation_callback(func, wrap)
+        return func
+
+    return decorator
@@ -0,0 +1,223 @@
+import asyncio
+import hashlib
+import time
+from collections.abc import Callable, Iterable
+from functools import wraps
+from inspect import iscoroutinefunction
+
+from asgiref.sync import sync_to_async
+from django.core.cache import cache
+from django.http import HttpRequest, HttpResponse, HttpResponseNotModified
+
+__all__ = [
+    'get_versions',
+    'bump_version',
+    'versioned_cache'
+]
+
+# Type of the scopes resolver of a cached endpoint.
+ScopesType = Iterable[str] | Callable[..., Iterable[str]]
+
+# Prefix of the cache keys used by this module.
+_PREFIX = 'response-cache'
+
+
+def _version_key(scope: str) -> str:
+    return f'{_PREFIX}:version:{scope}'
+
+
+def get_versions(scopes: Iterable[str]) -> dict[str, int]:
+    """
+    Get the current version number of each of the given scopes.
+
+    Scopes without a version yet (or evicted from the cache) start at
+    the current time in milliseconds, so an evicted version never goes
+    back to a number used by an older cached response.
+
+    Args:
+        scopes (Iterable[str]): Scopes to get the versions of.
+            (e.g. `["catalog", "shop:<shop_id>"]`)
+
+    Returns:
+        dict[str, int]: The version number per scope.
+    """
+    scopes = sorted(set(scopes))
+    found = cache.get_many([_version_key(s) for s in scopes])
+
+    versions = {}
+    for scope in scopes:
+        key = _version_key(scope)
+        if key not in found:
+            cache.add(key, time.time_ns() // 1_000_000, timeout=None)
+            found[key] = cache.get(key)
+        versions[scope] = found[key]
+    return versions
+
+
+def bump_version(*scopes: str) -> None:
+    """
+    Bump the version number of the given scopes, invalidating every
+    cached response keyed by them at once.
+
+    Args:
+        *scopes (str): Scopes to invalidate. (e.g. `"shop:<shop_id>"`)
+    """
+    for scope in scopes:
+        try:
+            cache.incr(_version_key(scope))
+        except ValueError:
+            # No version yet, it starts fresh on the next read.
+            pass
+
+
+def _response_key(request: HttpRequest, versions: dict[str, int]) -> str:
+    """
+    Build the cache key of a response from the request's path, its
+    (sorted) query string and the versions of its scopes.
+    """
+    query = sorted(request.GET.lists())
+    raw = f'{request.path}?{query}#{sorted(versions.items())}'
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+def _to_response(entry: dict, etag: str) -> HttpResponse:
+    response = HttpResponse(
+        entry['content'],
+        status=entry['status'],
+        content_type=entry['content_type']
+    )
+    response['ETag'] = etag
+    response['Cache-Control'] = 'no-cache'
+    return response
+
+
+def versioned_cache(
+    scopes: ScopesType,
+    timeout: int = 300,
+    lock_timeout: int = 10
+):
+    """
+    Decorator that caches the responses of a Ninja `GET` operation,
+    keyed by path, query string and the version of its scopes.
+
+    To be used with `ninja.decorators.decorate_view`. Bumping the version
+    of a scope (via `bump_version`) invalidates its responses in O(1).
+
+    - Responses get an `ETag` derived from the versions, so clients
+      revalidating with `If-None-Match` get a `304 Not Modified`
+      without the view running.
+    - On a miss, only one request recomputes the response (single
+      flight), while concurrent requests wait for it to be cached.
+
+    Args:
+        scopes (ScopesType): The scopes of the response, or a callable
+            that returns them given the request and path parameters. (or
+            None, when the request isn't cacheable)
+        timeout (int): Time in seconds to keep a cached response.
+        lock_timeout (int): Max time in seconds to wait on a response
+            being recomputed by another request.
+
+    Returns:
+        Callable: A decorator for the operation's `run()` method.
+
+    Examples:
+        >>> @router.get('/{shop_id}')
+        >>> @decorate_view(versioned_cache(
+        >>>     lambda request, shop_id: [f'shop:{shop_id}']
+        >>> ))
+        >>> def get_shop(request, shop_id: UUID):
+        >>>     ...
+    """
+    def resolve(request: HttpRequest, kwargs: dict):
+        """
+        Get the response's cache key and ETag, or None if uncacheable.
+        """
+        if request.method not in ('GET', 'HEAD'):
+            return None
+
+        resolved = scopes(request, **kwargs) if callable(scopes) else scopes
+        if resolved is None:
+            return None
+        key = _response_key(request, get_versions(resolved))
+        return f'{_PREFIX}:{key}', f'W/"{key[:32]}"'
+
+    def store(key: str, response: HttpResponse, etag: str) -> HttpResponse:
+        # Only successful responses are cached.
+        if response.status_code == 200 and not response.streaming:
+            cache.set(
+                key,
+                {
+                    'status': response.status_code,
+                    'content': response.content,
+                    'content_type': response['Content-Type']
+                },
+                timeout=timeout
+            )
+            response['ETag'] = etag
+            response['Cache-Control'] = 'no-cache'
+        return response
+
+    def decorator(func):
+
+        if iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(request, **kwargs):
+                resolved = await sync_to_async(resolve)(request, kwargs)
+                if resolved is None:
+                    return await func(request, **kwargs)
+
+                key, etag = resolved
+                if request.headers.get('If-None-Match') == etag:
+                    return HttpResponseNotModified(headers={'ETag': etag})
+
+                deadline = time.monotonic() + lock_timeout
+                while True:
+                    entry = await cache.aget(key)
+                    if entry is not None:
+                        return _to_response(entry, etag)
+
+                    # Single flight: recompute only if holding the lock.
+                    if await cache.aadd(f'{key}:lock', 1, lock_timeout):
+                        try:
+                            response = await func(request, **kwargs)
+                            return await sync_to_async(store)(
+                                key, response, etag
+                            )
+                        finally:
+                            await cache.adelete(f'{key}:lock')
+
+                    if time.monotonic() > deadline:
+                        return await func(request, **kwargs)
+                    await asyncio.sleep(0.05)
+
+            return async_wrapper
+
+        @wraps(func)
+        def wrapper(request, **kwargs):
+            resolved = resolve(request, kwargs)
+            if resolved is None:
+                return func(request, **kwargs)
+
+            key, etag = resolved
+            if request.headers.get('If-None-Match') == etag:
+                return HttpResponseNotModified(headers={'ETag': etag})
+
+            deadline = time.monotonic() + lock_timeout
+            while True:
+                entry = cache.get(key)
+                if entry is not None:
+                    return _to_response(entry, etag)
+
+                # Single flight: recompute only if holding the lock.
+                if cache.add(f'{key}:lock', 1, lock_timeout):
+                    try:
+                        return store(key, func(request, **kwargs), etag)
+                    finally:
+                        cache.delete(f'{key}:lock')
+
+                if time.monotonic() > deadline:
+                    return func(request, **kwargs)
+                time.sleep(0.05)
+
+        return wrapper
+    return decorator
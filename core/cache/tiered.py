@@ -0,0 +1,215 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import caches
+
+from core.instrumentation.metrics import CACHE_LOOKUPS
+
+from .broadcast import publish_invalidation, subscribe_invalidations
+
+__all__ = [
+    'LRUCache',
+    'TierStats',
+    'TieredCache',
+    'tiered_cache'
+]
+
+# Sentinel for cache misses, as `None` can be a cached value.
+MISSING = object()
+
+
+class LRUCache:
+    """
+    Thread-safe, size-bounded in-process LRU cache with expiry.
+    """
+
+    def __init__(self, maxsize: int = 1024, timeout: float | None = 60):
+        self.maxsize = maxsize
+        self.timeout = timeout
+        self._data: OrderedDict[str, tuple[float | None, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: str, default: Any = MISSING) -> Any:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return default
+
+            expires_at, value = item
+            if expires_at is not None and expires_at < time.monotonic():
+                del self._data[key]
+                return default
+
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, timeout: float | None = None):
+        timeout = self.timeout if timeout is None else timeout
+        expires_at = time.monotonic() + timeout if timeout else None
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+@dataclass
+class TierStats:
+    """
+    Hit / miss counters of a single cache tier, also exported to the
+    Prometheus metrics. (see `core.instrumentation.metrics`)
+    """
+    tier: str
+    hits: int = 0
+    misses: int = 0
+
+    def __post_init__(self):
+        self._lock = threading.Lock()
+        self._counters = {
+            True: CACHE_LOOKUPS.labels(self.tier, 'hit'),
+            False: CACHE_LOOKUPS.labels(self.tier, 'miss')
+        }
+
+    def record(self, hit: bool) -> None:
+        """
+        Count a lookup of the tier.
+        """
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+        self._counters[hit].inc()
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hit_rate
+        }
+
+
+class TieredCache:
+    """
+    Two-tier cache with an in-process LRU in front of a shared
+    Django cache backend.
+
+    Reads go through the local tier first, then the shared tier
+    (filling the local tier on a hit). Deletes are applied to both
+    tiers, and broadcasted so the other processes evict their local
+    copy. (see `core.cache.broadcast`)
+
+    NOTE: Local entries expire after `local_timeout`, which bounds
+    staleness when a broadcast is missed or unsupported.
+    """
+
+    def __init__(
+        self,
+        alias: str = 'default',
+        maxsize: int = 1024,
+        local_timeout: float = 60
+    ):
+        self.alias = alias
+        self.local = LRUCache(maxsize=maxsize, timeout=local_timeout)
+        self.stats = {
+            'local': TierStats('local'),
+            'shared': TierStats('shared')
+        }
+        self._subscribed = False
+
+    @property
+    def shared(self):
+        return caches[self.alias]
+
+    def _subscribe(self) -> None:
+        if not self._subscribed:
+            self._subscribed = True
+            subscribe_invalidations(self._on_invalidation)
+
+    def _on_invalidation(self, key: str | None) -> None:
+        if key is None:
+            self.local.clear()
+        else:
+            self.local.delete(key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Get a value from the local tier, then from the shared tier.
+        """
+        self._subscribe()
+
+        value = self.local.get(key)
+        self.stats['local'].record(value is not MISSING)
+        if value is not MISSING:
+            return value
+
+        value = self.shared.get(key, MISSING)
+        self.stats['shared'].record(value is not MISSING)
+        if value is not MISSING:
+            self.local.set(key, value)
+            return value
+
+        return default
+
+    def set(self, key: str, value: Any, timeout: int | None = 300) -> None:
+        """
+        Set a value on both tiers.
+        """
+        self.shared.set(key, value, timeout=timeout)
+        self.local.set(key, value)
+
+    def delete(self, key: str, broadcast: bool = True) -> None:
+        """
+        Delete a value from both tiers, and broadcast its invalidation
+        unless told otherwise.
+        """
+        self.local.delete(key)
+        self.shared.delete(key)
+        if broadcast:
+            publish_invalidation(key)
+
+    def delete_many(self, keys: list[str], broadcast: bool = True) -> None:
+        """
+        Delete values from both tiers, and broadcast their invalidation
+        together unless told otherwise.
+        """
+        for key in keys:
+            self.local.delete(key)
+        self.shared.delete_many(keys)
+        if broadcast:
+            publish_invalidation(*keys)
+
+    def get_stats(self) -> dict:
+        """
+        Get the hit / miss counters and hit rate of each tier.
+        """
+        return {
+            tier: stats.as_dict() for tier, stats in self.stats.items()
+        }
+
+
+# Process-wide two-tier cache.
+tiered_cache = TieredCache(
+    maxsize=getattr(settings, 'CACHE_LOCAL_MAXSIZE', 1024),
+    local_timeout=getattr(settings, 'CACHE_LOCAL_TIMEOUT', 60)
+)
@@ -0,0 +1,50 @@
+from django.conf import settings
+from django.utils.deprecation import MiddlewareMixin
+
+from .routers import has_written, reset_routing
+
+__all__ = ['ReplicaPinningMiddleware']
+
+# Cookie that keeps a client on the primary after it wrote.
+PIN_COOKIE_NAME = 'db_pinned'
+
+# Methods that don't write, whose reads may go to the replicas.
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+
+class ReplicaPinningMiddleware(MiddlewareMixin):
+    """
+    Middleware that keeps a client's reads on the primary database for
+    `DB_REPLICA_PIN_SECONDS` after it wrote, so it reads its own writes
+    despite the replication lag. (see `core.db.routers.ReplicaRouter`)
+
+    - Unsafe requests (e.g. `POST`) read from the primary.
+    - A request that wrote sets a short-lived cookie, which pins the
+      client's next requests to the primary until it expires.
+
+    NOTE: Should be the first middleware, so that the reads of the
+    other middlewares are routed too. (e.g. sessions)
+    """
+
+    def process_request(self, request):
+        reset_routing(
+            pinned=(
+                request.method not in SAFE_METHODS or
+                PIN_COOKIE_NAME in request.COOKIES
+            )
+        )
+
+    def process_response(self, request, response):
+        if has_written():
+            response.set_cookie(
+                PIN_COOKIE_NAME,
+                '1',
+                max_age=settings.DB_REPLICA_PIN_SECONDS,
+                secure=request.is_secure(),
+                httponly=True,
+                samesite='Lax'
+            )
+
+        # NOTE: Threads are reused across requests. (e.g. on WSGI)
+        reset_routing()
+        return response
@@ -0,0 +1,59 @@
+from typing import override
+
+from django.contrib.postgres.operations import (
+    AddIndexConcurrently as PostgresAddIndexConcurrently
+)
+from django.db import migrations
+
+__all__ = [
+    'AddIndexConcurrently',
+    'RunPostgresSQL'
+]
+
+
+class RunPostgresSQL(migrations.RunSQL):
+    """
+    Migration operation that runs raw SQL only on PostgreSQL databases.
+
+    NOTE: Used for PostgreSQL-only features (e.g. `pg_trgm` indexes)
+    so that migrations still apply on SQLite for local tooling.
+    """
+
+    @override
+    def _run_sql(self, schema_editor, sqls):
+        if schema_editor.connection.vendor != 'postgresql':
+            return  # skip on non-postgres database backends
+        super()._run_sql(schema_editor, sqls)
+
+
+class AddIndexConcurrently(PostgresAddIndexConcurrently):
+    """
+    Migration operation that creates an index concurrently on PostgreSQL
+    (without blocking the writes), and as usual on other databases.
+
+    NOTE: Set `atomic = False` on the migration.
+    """
+
+    @override
+    def database_forwards(
+        self, app_label, schema_editor, from_state, to_state
+    ):
+        if schema_editor.connection.vendor != 'postgresql':
+            return migrations.AddIndex.database_forwards(
+                self, app_label, schema_editor, from_state, to_state
+            )
+        super().database_forwards(
+            app_label, schema_editor, from_state, to_state
+        )
+
+    @override
+    def database_backwards(
+        self, app_label, schema_editor, from_state, to_state
+    ):
+        if schema_editor.connection.vendor != 'postgresql':
+            return migrations.AddIndex.database_backwards(
+                self, app_label, schema_editor, from_state, to_state
+            )
+        super().database_backwards(
+            app_label, schema_editor, from_state, to_state
+        )
@@ -0,0 +1,88 @@
+import os
+
+from django.db import connections
+
+__all__ = [
+    'install_fork_handler',
+    'pool_stats'
+]
+
+# Connections (and pools) inherited from the parent process.
+# NOTE: Kept referenced, as closing them (even on garbage collection)
+# would terminate the parent's sessions, which share their sockets.
+_inherited: list = []
+
+_fork_handler_installed = False
+
+
+def _pools() -> dict:
+    try:
+        from django.db.backends.postgresql.base import DatabaseWrapper
+    except ImportError:
+        return {}
+    return DatabaseWrapper._connection_pools
+
+
+def _discard_inherited_connections() -> None:
+    """
+    Drop the pools and connections inherited by a forked process, so
+    it opens its own. (e.g. gunicorn workers, with `--preload`)
+    """
+    pools = _pools()
+    _inherited.append(dict(pools))
+    pools.clear()
+
+    for connection in connections.all(initialized_only=True):
+        if connection.connection is not None:
+            _inherited.append(connection.connection)
+            connection.connection = None
+
+
+def install_fork_handler() -> None:
+    """
+    Make the connection pools fork-safe, for servers that fork their
+    workers after loading the application.
+
+    NOTE: A pool's connections and maintenance threads can't be shared
+    between processes, so each forked process starts with no pool.
+    """
+    global _fork_handler_installed
+    if not _fork_handler_installed and hasattr(os, 'register_at_fork'):
+        os.register_at_fork(after_in_child=_discard_inherited_connections)
+        _fork_handler_installed = True
+
+
+def pool_stats() -> dict[str, dict]:
+    """
+    Get the stats of the connection pools of the current process.
+
+    NOTE: The counters are cumulative since the pool was opened.
+
+    Returns:
+        dict[str, dict]: The stats per database alias, with `psycopg`'s
+            stats (e.g. `pool_size`, `requests_waiting`), plus:
+            - in_use: The number of connections checked out.
+            - wait_ms_avg: The average wait for a connection, of the
+              requests that had to wait.
+            - timeouts: The number of requests that got no connection.
+    """
+    stats = {}
+    for alias, pool in list(_pools().items()):
+        if pool.closed:
+            continue  # e.g. not opened yet, by a first query
+
+        counters = pool.get_stats()
+        queued = counters.get('requests_queued', 0)
+        stats[alias] = {
+            **counters,
+            'in_use': (
+                counters.get('pool_size', 0) -
+                counters.get('pool_available', 0)
+            ),
+            'wait_ms_avg': (
+                counters.get('requests_wait_ms', 0) / queued
+                if queued else 0
+            ),
+            'timeouts': counters.get('requests_errors', 0),
+        }
+    return stats
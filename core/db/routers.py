@@ -0,0 +1,168 @@
+import random
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, connections
+from loguru import logger
+
+__all__ = [
+    'ReplicaRouter',
+    'has_written',
+    'is_pinned',
+    'pin_primary',
+    'reset_routing',
+    'use_primary'
+]
+
+# Time in seconds to reuse the replication lag of a replica.
+LAG_CHECK_INTERVAL = 5
+
+# Replication lag in seconds of a replica. (0 when not replicating)
+LAG_SQL = """
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(
+            EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0
+        )
+    END
+"""
+
+# Whether the reads of the current context go to the primary.
+# NOTE: Set per request by `ReplicaPinningMiddleware`.
+_pinned: ContextVar[bool] = ContextVar('db_pinned', default=False)
+
+# Whether the current context wrote to the primary.
+_written: ContextVar[bool] = ContextVar('db_written', default=False)
+
+# Last lag check per replica alias, as (checked at, healthy).
+_health: dict[str, tuple[float, bool]] = {}
+
+
+def is_pinned() -> bool:
+    """
+    Whether the reads of the current context are pinned to the primary.
+    """
+    return _pinned.get()
+
+
+def has_written() -> bool:
+    """
+    Whether the current context wrote to the primary.
+    """
+    return _written.get()
+
+
+def pin_primary() -> None:
+    """
+    Pin the reads of the current context to the primary.
+    (e.g. for the rest of the request)
+    """
+    _pinned.set(True)
+
+
+def reset_routing(pinned: bool = False) -> None:
+    """
+    Reset the routing state of the current context. (e.g. per request)
+    """
+    _pinned.set(pinned)
+    _written.set(False)
+
+
+@contextmanager
+def use_primary():
+    """
+    Context manager that reads from the primary within its block.
+
+    Examples:
+        >>> with use_primary():
+        >>>     shop = Shop.objects.get(shop_id=shop_id)
+    """
+    token = _pinned.set(True)
+    try:
+        yield
+    finally:
+        _pinned.reset(token)
+
+
+def _replica_lag(alias: str) -> float:
+    connection = connections[alias]
+    if connection.vendor != 'postgresql':
+        return 0  # e.g. SQLite stand-ins on local tooling
+    with connection.cursor() as cursor:
+        cursor.execute(LAG_SQL)
+        return float(cursor.fetchone()[0])
+
+
+def _is_healthy(alias: str) -> bool:
+    """
+    Whether the replica is reachable, and its replication lag is within
+    `DB_REPLICA_MAX_LAG`. Checked at most once per `LAG_CHECK_INTERVAL`
+    seconds per process.
+    """
+    now = time.monotonic()
+    checked_at, healthy = _health.get(alias, (None, False))
+    if checked_at is not None and now - checked_at < LAG_CHECK_INTERVAL:
+        return healthy
+
+    try:
+        lag = _replica_lag(alias)
+        healthy = lag <= settings.DB_REPLICA_MAX_LAG
+        if not healthy:
+            logger.warning(f'Replica "{alias}" is lagging by {lag:.1f}s.')
+    except DatabaseError as e:
+        healthy = False
+        logger.warning(f'Replica "{alias}" is unreachable: {e}')
+
+    _health[alias] = (now, healthy)
+    return healthy
+
+
+class ReplicaRouter:
+    """
+    Database router that sends reads to the replicas in
+    `DB_REPLICAS`, and writes to the primary. (`default`)
+
+    Reads go to the primary instead when:
+    - The context is pinned to the primary. (see `pin_primary()`)
+      Writing pins the context, so a request reads its own writes.
+    - A transaction is open on the primary, so reads within it are
+      consistent. (e.g. admin change forms, `select_for_update()`)
+    - No replica is healthy. (unreachable, or lagging behind)
+
+    NOTE: Migrations only run on the primary, as replicas get the
+    schema through replication.
+    """
+
+    @property
+    def replicas(self) -> list[str]:
+        return settings.DB_REPLICAS
+
+    def db_for_read(self, model, **hints):
+        if (
+            not self.replicas or
+            _pinned.get() or
+            connections[DEFAULT_DB_ALIAS].in_atomic_block
+        ):
+            return DEFAULT_DB_ALIAS
+
+        replicas = [alias for alias in self.replicas if _is_healthy(alias)]
+        return random.choice(replicas) if replicas else DEFAULT_DB_ALIAS
+
+    def db_for_write(self, model, **hints):
+        # Read the writes back from the primary. (read-your-writes)
+        _pinned.set(True)
+        _written.set(True)
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # NOTE: Every database holds the same data.
+        databases = {DEFAULT_DB_ALIAS, *self.replicas}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db not in self.replicas
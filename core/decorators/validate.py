@@ -2,37 +2,83 @@ import inspect
 from functools import wraps
 from typing import Type
 
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
 
-def validate_params(model: Type[BaseModel]):
+def validate_params(
+    model: Type[BaseModel],
+    trusted: tuple[Type[BaseModel], ...] = ()
+):
     """
     Decorator that validates both positional and keyword
     arguments using `pydantic.BaseModel`.
 
+    The function's parameter names and the model's `TypeAdapter` are
+    built once when decorating, not on every call.
+
+    When the first positional argument is an instance of the model (or
+    of a `trusted` schema), it's considered as already validated: its
+    fields are passed as is, along with the other keyword arguments.
+    (e.g. a Ninja schema validated from the request)
+
+    NOTE: Supports both sync and async (coroutine) functions.
+
     Args:
         model (Type[BaseModel]): The Pydantic model class used for validation.
+        trusted (tuple[Type[BaseModel], ...]): Schemas whose instances
+            skip the validation. Defaults to none.
 
     Returns:
         Callable: A decorated function with validated parameters.
+
+    Examples:
+        >>> @validate_params(RegisterUser)
+        >>> def register_user(email: str, password: str, **extras):
+        >>>     ...
+        >>>
+        >>> details = RegisterUser.model_construct(**dict(payload))
+        >>> register_user(details, avatar=avatar)  # trusted
+        >>> register_user(email=email, password=password)  # validated
     """
     def decorator(func):
-        @wraps(func)
-        def wrapper(*args, **kwargs):
 
-            # Extract the function's signature to map positional args.
-            func_signature = inspect.signature(func)
-            param_names = list(func_signature.parameters.keys())
+        # Extract the function's parameter names to map positional args.
+        param_names = tuple(inspect.signature(func).parameters)
+        adapter = TypeAdapter(model)
+        trusted_types = (model, *trusted)
+
+        def validate(args: tuple, kwargs: dict) -> dict:
+
+            # Trusted path: pass the validated instance's fields as is.
+            if len(args) == 1 and isinstance(args[0], trusted_types):
+                return {
+                    **args[0].model_dump(exclude_none=True),
+                    **{k: v for k, v in kwargs.items() if v is not None}
+                }
 
             # Map positional arguments to the corresponding parameter names.
-            params = {**dict(zip(param_names, args)), **kwargs}
+            params = dict(zip(param_names, args))
+            params.update(kwargs)
 
             # Validate the combined parameters using the Pydantic model.
             # Make sure we're excluding none fields.
-            validated_data = model(**params).model_dump(exclude_none=True)
+            return adapter.dump_python(
+                adapter.validate_python(params),
+                exclude_none=True
+            )
+
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                return await func(**validate(args, kwargs))
+
+            return async_wrapper
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
 
             # Call the original function with validated data.
-            return func(**validated_data)
+            return func(**validate(args, kwargs))
 
         return wrapper
     return decorator
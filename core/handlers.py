@@ -7,6 +7,9 @@ from django.core.files.uploadedfile import UploadedFile
 from django.db.models.fields.files import ImageFieldFile
 from PIL import Image
 
+from core.instrumentation import instrumented
+from core.instrumentation.metrics import IMAGE_PROCESSING
+
 # Declare the ImageFileType for the handler function.
 ImageFileType = TypeVar(
     'ImageFileType',
@@ -14,6 +17,7 @@ ImageFileType = TypeVar(
 )
 
 
+@instrumented('image', IMAGE_PROCESSING)
 def resize_image_file_handler(
     image_file: ImageFileType,
     size: tuple[int, int] = (300, 300),
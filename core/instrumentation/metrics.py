@@ -0,0 +1,136 @@
+import os
+
+from prometheus_client import REGISTRY, CollectorRegistry, Counter, Histogram
+from prometheus_client.core import GaugeMetricFamily
+from prometheus_client.multiprocess import MultiProcessCollector
+
+__all__ = [
+    'CACHE_LOOKUPS',
+    'DB_QUERIES',
+    'IMAGE_PROCESSING',
+    'REQUESTS',
+    'REQUEST_LATENCY',
+    'SIGNED_URL_CACHE',
+    'SNOWFLAKE_SPINS',
+    'SNOWFLAKE_WAITS',
+    'STORAGE_LATENCY',
+    'JobQueueCollector',
+    'metrics_registry'
+]
+
+# Directory of the metrics of every worker process, when set.
+# NOTE: Read by `prometheus_client` once the first metric is created, so it
+# has to be set beforehand. (e.g. in `.env`, or by the server's config)
+MULTIPROCESS = 'PROMETHEUS_MULTIPROC_DIR' in os.environ
+
+# Requests, per route. (URL name, e.g. "api-1.0.1:catalog")
+REQUEST_LATENCY = Histogram(
+    'http_request_duration_seconds',
+    'Latency of the requests, per route.',
+    ['method', 'route']
+)
+REQUESTS = Counter(
+    'http_requests',
+    'Requests, per route and status code.',
+    ['method', 'route', 'status']
+)
+
+# Database queries, per database alias. (e.g. "replica_0")
+DB_QUERIES = Counter(
+    'db_queries',
+    'Database queries, per database alias.',
+    ['alias']
+)
+
+# Lookups of the two-tier cache. (see `core.cache.tiered`)
+CACHE_LOOKUPS = Counter(
+    'cache_tier_lookups',
+    'Lookups of the two-tier cache, per tier and result. (hit or miss)',
+    ['tier', 'result']
+)
+
+# Storage calls, per storage method. (e.g. "url", "save")
+STORAGE_LATENCY = Histogram(
+    'storage_call_duration_seconds',
+    'Latency of the file storage calls, per method.',
+    ['method']
+)
+SIGNED_URL_CACHE = Counter(
+    'signed_url_cache_lookups',
+    'Lookups of the cached signed URLs, per result. (hit or miss)',
+    ['result']
+)
+
+# Image handling. (resizing and compression)
+IMAGE_PROCESSING = Histogram(
+    'image_processing_duration_seconds',
+    'Time to resize and compress an uploaded image.',
+    buckets=(.01, .025, .05, .1, .25, .5, 1, 2.5, 5, 10)
+)
+
+# Snowflake IDs generated within an exhausted millisecond.
+SNOWFLAKE_WAITS = Counter(
+    'snowflake_clock_waits',
+    'IDs that waited for the next millisecond.'
+)
+SNOWFLAKE_SPINS = Counter(
+    'snowflake_clock_spins',
+    'Clock reads while waiting for the next millisecond.'
+)
+
+
+class JobQueueCollector:
+    """
+    Collector of the depth of the background jobs' queue, per status,
+    queried from the database on each scrape.
+    """
+
+    def _family(self) -> GaugeMetricFamily:
+        return GaugeMetricFamily(
+            'background_jobs',
+            'Background jobs waiting or running, per status.',
+            labels=['status']
+        )
+
+    def describe(self):
+        # NOTE: Skips the query when the collector is registered.
+        yield self._family()
+
+    def collect(self):
+        from django.db.models import Count
+
+        from jobs.models import AdminJob, JobStatus
+
+        statuses = (JobStatus.PENDING, JobStatus.RUNNING)
+        counts = dict(
+            AdminJob.objects
+            .filter(status__in=statuses)
+            .values_list('status')
+            .annotate(count=Count('pk'))
+            .order_by()
+        )
+
+        family = self._family()
+        for status in statuses:
+            family.add_metric([status.value], counts.get(status, 0))
+        yield family
+
+
+REGISTRY.register(JobQueueCollector())
+
+
+def metrics_registry() -> CollectorRegistry:
+    """
+    Get the registry of the metrics to export, aggregated over the worker
+    processes in multiprocess mode. (e.g. gunicorn workers)
+
+    NOTE: In multiprocess mode, the directory should be emptied when the
+    server starts, as the files of the previous workers are aggregated.
+    """
+    if not MULTIPROCESS:
+        return REGISTRY
+
+    registry = CollectorRegistry()
+    MultiProcessCollector(registry)
+    registry.register(JobQueueCollector())
+    return registry
@@ -0,0 +1,108 @@
+import random
+import time
+
+from django.conf import settings
+from django.utils.deprecation import MiddlewareMixin
+from loguru import logger
+
+from .metrics import REQUEST_LATENCY, REQUESTS
+from .timing import (
+    current_timings,
+    install_query_timer,
+    start_timings,
+    stop_timings
+)
+
+__all__ = [
+    'MetricsMiddleware',
+    'ServerTimingMiddleware'
+]
+
+# Route of the requests that matched no URL pattern. (e.g. 404s)
+UNMATCHED_ROUTE = '<unmatched>'
+
+# Header that asks for the timings of a request, whatever the sample rate.
+TIMING_HEADER = 'X-Server-Timing'
+
+
+class ServerTimingMiddleware(MiddlewareMixin):
+    """
+    Middleware that times the hot paths of a sample of the requests (the
+    queries, storage calls, image handling and template rendering), and
+    logs them with a structured line per request.
+
+    - A request is sampled at `SERVER_TIMING_SAMPLE_RATE`, or when it sends
+      the `X-Server-Timing: 1` header.
+    - The timings are sent back in a `Server-Timing` header, shown by the
+      browsers' dev tools, in `DEBUG` or to staff users only.
+
+    NOTE: Should come right after `ReplicaPinningMiddleware`, so the other
+    middlewares (e.g. sessions) are timed too.
+    """
+
+    def __init__(self, get_response):
+        super().__init__(get_response)
+        install_query_timer()
+
+    def process_request(self, request):
+        if (
+            request.headers.get(TIMING_HEADER) == '1' or
+            random.random() < settings.SERVER_TIMING_SAMPLE_RATE
+        ):
+            start_timings()
+
+    def process_response(self, request, response):
+        timings = current_timings()
+        if timings is None:
+            return response
+
+        # NOTE: Threads are reused across requests. (e.g. on WSGI)
+        stop_timings()
+
+        total_ms = timings.total_ms
+        header = timings.server_timing()
+        logger.bind(
+            method=request.method,
+            path=request.path,
+            status=response.status_code,
+            total_ms=round(total_ms, 2),
+            timings=timings.as_dict()
+        ).info(
+            f'{request.method} {request.path} {response.status_code} '
+            f'in {total_ms:.1f}ms ({header})'
+        )
+
+        user = getattr(request, 'user', None)
+        if settings.DEBUG or getattr(user, 'is_staff', False):
+            response['Server-Timing'] = header
+        return response
+
+
+class MetricsMiddleware(MiddlewareMixin):
+    """
+    Middleware that counts the requests and observes their latency per
+    route, for the Prometheus metrics. (see `core.instrumentation.metrics`)
+
+    NOTE: Routes are the URL names (e.g. "api-1.0.1:catalog") rather than
+    the paths, to keep the number of time series bounded.
+    """
+
+    def __init__(self, get_response):
+        super().__init__(get_response)
+        install_query_timer()
+
+    def process_request(self, request):
+        request._metrics_started = time.perf_counter()
+
+    def process_response(self, request, response):
+        started = getattr(request, '_metrics_started', None)
+        if started is None:
+            return response
+
+        match = request.resolver_match
+        route = match.view_name if match else UNMATCHED_ROUTE
+        REQUEST_LATENCY.labels(request.method, route).observe(
+            time.perf_counter() - started
+        )
+        REQUESTS.labels(request.method, route, response.status_code).inc()
+        return response
@@ -0,0 +1,34 @@
+from django.template.backends.django import DjangoTemplates as BaseBackend
+from django.template.backends.django import Template as BaseTemplate
+from django.template.backends.django import reraise
+from django.template.exceptions import TemplateDoesNotExist
+
+from .timing import instrumented
+
+__all__ = ['DjangoTemplates']
+
+
+class Template(BaseTemplate):
+    """
+    Django template whose rendering is timed as `template`.
+    """
+
+    @instrumented('template')
+    def render(self, context=None, request=None):
+        return super().render(context, request)
+
+
+class DjangoTemplates(BaseBackend):
+    """
+    Django templates backend, with the rendering of the templates timed
+    for the `Server-Timing` header. (see `ServerTimingMiddleware`)
+    """
+
+    def from_string(self, template_code):
+        return Template(self.engine.from_string(template_code), self)
+
+    def get_template(self, template_name):
+        try:
+            return Template(self.engine.get_template(template_name), self)
+        except TemplateDoesNotExist as exc:
+            reraise(exc, self)
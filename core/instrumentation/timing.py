@@ -0,0 +1,194 @@
+import time
+from collections.abc import Callable
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from functools import wraps
+
+from django.db import connections
+from django.db.backends.signals import connection_created
+
+from .metrics import DB_QUERIES
+
+__all__ = [
+    'RequestTimings',
+    'current_timings',
+    'install_query_timer',
+    'instrumented',
+    'start_timings',
+    'stop_timings',
+    'timed'
+]
+
+
+@dataclass
+class Metric:
+    """
+    Accumulated time and number of calls of a single hot path.
+    """
+    duration_ms: float = 0
+    count: int = 0
+
+
+class RequestTimings:
+    """
+    Time spent per hot path (e.g. `db`, `storage`) within a request.
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.metrics: dict[str, Metric] = {}
+        self._active: set[str] = set()
+
+    @property
+    def total_ms(self) -> float:
+        return (time.perf_counter() - self.started) * 1000
+
+    def add(self, name: str, duration_ms: float) -> None:
+        metric = self.metrics.setdefault(name, Metric())
+        metric.duration_ms += duration_ms
+        metric.count += 1
+
+    def server_timing(self) -> str:
+        """
+        Format the timings as a `Server-Timing` header value.
+        """
+        entries = [
+            f'{name};dur={metric.duration_ms:.1f};desc="{metric.count}x"'
+            for name, metric in self.metrics.items()
+        ]
+        entries.append(f'total;dur={self.total_ms:.1f}')
+        return ', '.join(entries)
+
+    def as_dict(self) -> dict[str, dict]:
+        return {
+            name: {'ms': round(metric.duration_ms, 2), 'count': metric.count}
+            for name, metric in self.metrics.items()
+        }
+
+
+# Timings of the request being handled, when it's sampled.
+# NOTE: Sync views and threads started with `sync_to_async()` (or
+# `asyncio.to_thread()`) get a copy of the context, with the same timings.
+_current: ContextVar[RequestTimings | None] = ContextVar(
+    'request_timings', default=None
+)
+
+
+def current_timings() -> RequestTimings | None:
+    """
+    Get the timings of the current request, if it's sampled.
+    """
+    return _current.get()
+
+
+def start_timings() -> RequestTimings:
+    """
+    Start timing the hot paths of the current context. (e.g. a request)
+    """
+    timings = RequestTimings()
+    _current.set(timings)
+    return timings
+
+
+def stop_timings() -> None:
+    """
+    Stop timing the hot paths of the current context.
+    """
+    _current.set(None)
+
+
+@contextmanager
+def timed(name: str, histogram=None):
+    """
+    Context manager that adds the time of its block to the current
+    request's timings, if any, and observes it in a Prometheus histogram.
+
+    NOTE: Nested blocks of the same name are only added once to the
+    timings. (e.g. a storage method calling another one)
+
+    Args:
+        name (str): Name of the timing. (e.g. `storage`)
+        histogram (Histogram, optional): Histogram (or labeled child) that
+            observes every call, in seconds, whether the request is sampled
+            or not. Defaults to None.
+
+    Examples:
+        >>> with timed('image', IMAGE_PROCESSING):
+        >>>     img.save(img_io, format='JPEG')
+    """
+    timings = _current.get()
+    if timings is not None and name in timings._active:
+        timings = None
+    if timings is None and histogram is None:
+        yield
+        return
+
+    if timings is not None:
+        timings._active.add(name)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        duration = time.perf_counter() - start
+        if histogram is not None:
+            histogram.observe(duration)
+        if timings is not None:
+            timings._active.discard(name)
+            timings.add(name, duration * 1000)
+
+
+def instrumented(name: str, histogram=None) -> Callable:
+    """
+    Decorator that times each call. (see `timed()`)
+
+    Examples:
+        >>> @instrumented('image', IMAGE_PROCESSING)
+        >>> def resize_image_file_handler(image_file, ...):
+        >>>     ...
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if _current.get() is not None:
+                with timed(name, histogram):
+                    return func(*args, **kwargs)
+            if histogram is None:
+                return func(*args, **kwargs)
+
+            # NOTE: Skips the context manager, on the hot path.
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                histogram.observe(time.perf_counter() - start)
+        return wrapper
+    return decorator
+
+
+def _time_query(execute, sql, params, many, context):
+    DB_QUERIES.labels(context['connection'].alias).inc()
+    if _current.get() is None:
+        return execute(sql, params, many, context)
+    with timed('db'):
+        return execute(sql, params, many, context)
+
+
+def _install_query_timer(sender=None, connection=None, **kwargs) -> None:
+    if _time_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_time_query)
+
+
+def install_query_timer() -> None:
+    """
+    Time and count the queries of every database connection, through an
+    execute wrapper installed on each connection once it's opened.
+
+    NOTE: The wrapper only costs a counter increment and a context
+    variable lookup per query when the request isn't sampled.
+    """
+    connection_created.connect(
+        _install_query_timer, dispatch_uid='core.instrumentation.db'
+    )
+    for connection in connections.all(initialized_only=True):
+        _install_query_timer(connection=connection)
@@ -0,0 +1,48 @@
+import hmac
+from functools import wraps
+
+from django.conf import settings
+from django.contrib.admin.views.decorators import staff_member_required
+from django.http import HttpResponse
+from django.views.decorators.http import require_GET
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+
+from .metrics import metrics_registry
+
+__all__ = ['metrics_view']
+
+
+def token_or_staff_required(view_func):
+    """
+    Decorator that lets through the requests with the `METRICS_TOKEN`
+    bearer token (e.g. a Prometheus scraper), or else from staff users.
+    (like the API docs)
+    """
+    staff_view = staff_member_required(view_func)
+
+    @wraps(view_func)
+    def wrapper(request, *args, **kwargs):
+        token = settings.METRICS_TOKEN
+        scheme, _, credentials = request.headers.get(
+            'Authorization', ''
+        ).partition(' ')
+        if (
+            token and scheme.lower() == 'bearer' and
+            hmac.compare_digest(credentials.encode(), token.encode())
+        ):
+            return view_func(request, *args, **kwargs)
+        return staff_view(request, *args, **kwargs)
+    return wrapper
+
+
+@require_GET
+@token_or_staff_required
+def metrics_view(request):
+    """
+    Export the metrics in the Prometheus text format, aggregated over the
+    worker processes in multiprocess mode.
+    """
+    return HttpResponse(
+        generate_latest(metrics_registry()),
+        content_type=CONTENT_TYPE_LATEST
+    )
@@ -18,6 +18,16 @@ class Http404Message(Schema):
     )
 
 
+class Http409Message(Schema):
+    detail: str = Field(
+        ...,
+        examples=[
+            ('A request with this Idempotency-Key is still '
+             'being processed. Please retry later.')
+        ]
+    )
+
+
 class Http422Message(Schema):
     detail: list[dict[str, str]] = Field(
         ...,
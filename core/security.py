@@ -0,0 +1,23 @@
+from typing import Any, Optional
+
+from django.conf import settings
+from django.http import HttpRequest
+from ninja.security import APIKeyCookie
+
+__all__ = ['StaffSessionAuth']
+
+
+class StaffSessionAuth(APIKeyCookie):
+    """
+    Ninja authentication that reuses Django's session authentication,
+    and verifies that the user is a staff.
+    """
+    param_name: str = settings.SESSION_COOKIE_NAME
+
+    def authenticate(
+        self, request: HttpRequest, key: Optional[str]
+    ) -> Optional[Any]:
+        user = request.user
+        if user.is_authenticated and user.is_active and user.is_staff:
+            return user
+        return None
@@ -0,0 +1,222 @@
+import hashlib
+import time
+from datetime import datetime, timedelta
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.sessions.backends.base import CreateError
+from django.contrib.sessions.backends.cached_db import (
+    SessionStore as CachedDBStore
+)
+from django.contrib.sessions.backends.db import SessionStore as DBStore
+from django.utils import timezone
+from loguru import logger
+
+from core.cache.backends import is_process_local
+
+__all__ = ['SessionStore']
+
+# Aliases of the process-local session caches already warned about.
+_warned_aliases = set()
+
+
+def _is_cache_shared(alias: str) -> bool:
+    """
+    Check if the session cache is shared by the worker processes,
+    warning (once) when it isn't.
+    """
+    if is_process_local(alias):
+        if alias not in _warned_aliases:
+            _warned_aliases.add(alias)
+            logger.warning(
+                f'The session cache "{alias}" is process-local, so the '
+                'sessions are kept in the database instead. Set a shared '
+                'cache (e.g. Redis) to keep them in the cache.'
+            )
+        return False
+    return True
+
+
+class SessionStore(CachedDBStore):
+    """
+    Cache-backed session store, with an optional write-through to the
+    database for durability.
+
+    - `SESSION_WRITE_THROUGH` (default: True) also writes the sessions
+      to the database, which is read on a cache miss. When disabled, the
+      sessions only live in the cache. (`SESSION_CACHE_ALIAS`)
+    - Saving a session whose data didn't change (e.g. with
+      `SESSION_SAVE_EVERY_REQUEST`) only refreshes its expiry once every
+      `SESSION_TOUCH_INTERVAL` seconds (default: 300), instead of
+      rewriting it on every request.
+    - Expired sessions are deleted in chunks. (see `clear_expired`)
+
+    The sessions are only kept in the database when the session cache
+    is process-local (e.g. `LocMemCache`), as a session deleted or
+    changed by one worker process (e.g. on logout) would otherwise stay
+    valid in the others.
+
+    NOTE: A coalesced session may expire up to `SESSION_TOUCH_INTERVAL`
+    seconds earlier than `SESSION_COOKIE_AGE` after its last request.
+    """
+    cache_key_prefix = 'core.sessions.backends'
+
+    def __init__(self, session_key=None):
+        super().__init__(session_key)
+        self.use_cache = _is_cache_shared(settings.SESSION_CACHE_ALIAS)
+        self.write_through = not self.use_cache or getattr(
+            settings, 'SESSION_WRITE_THROUGH', True
+        )
+        self.touch_interval = getattr(settings, 'SESSION_TOUCH_INTERVAL', 300)
+
+        # Digest of the data and expiry of the session, as last stored.
+        self._stored: tuple[bytes, datetime] | None = None
+
+    def _digest(self, data: dict) -> bytes:
+        return hashlib.sha256(self.serializer().dumps(data)).digest()
+
+    def _is_touch_only(self, data: dict) -> bool:
+        """
+        Check if saving would only postpone the expiry of the unchanged
+        session, by less than the touch interval.
+        """
+        if self._stored is None:
+            return False
+
+        digest, expires_at = self._stored
+        return (
+            digest == self._digest(data) and
+            self.get_expiry_date() - expires_at
+            < timedelta(seconds=self.touch_interval)
+        )
+
+    def load(self):
+        try:
+            entry = self._cache.get(self.cache_key) if self.use_cache else None
+        except Exception:
+            # Some backends (e.g. memcache) raise an exception on invalid
+            # cache keys. If this happens, reset the session.
+            entry = None
+
+        if entry is not None:
+            data, expires_at = entry
+        elif self.write_through and (s := self._get_session_from_db()):
+            data, expires_at = self.decode(s.session_data), s.expire_date
+            if self.use_cache:
+                self._cache.set(
+                    self.cache_key,
+                    (data, expires_at),
+                    self.get_expiry_age(expiry=expires_at)
+                )
+        else:
+            self._session_key = None
+            return {}
+
+        self._stored = (self._digest(data), expires_at)
+        return data
+
+    def exists(self, session_key):
+        if (
+            self.use_cache and session_key and
+            self.cache_key_prefix + session_key in self._cache
+        ):
+            return True
+        return self.write_through and DBStore.exists(self, session_key)
+
+    def save(self, must_create=False):
+        if self.session_key is None:
+            return self.create()
+
+        data = self._get_session(no_load=must_create)
+        if not must_create and self._is_touch_only(data):
+            return
+
+        expires_at = self.get_expiry_date()
+        if self.write_through:
+            DBStore.save(self, must_create)
+            if not self.use_cache:
+                self._stored = (self._digest(data), expires_at)
+                return
+        elif must_create:
+            if not self._cache.add(
+                self.cache_key, (data, expires_at), self.get_expiry_age()
+            ):
+                raise CreateError
+            self._stored = (self._digest(data), expires_at)
+            return
+
+        try:
+            self._cache.set(
+                self.cache_key, (data, expires_at), self.get_expiry_age()
+            )
+        except Exception:
+            logger.exception(f'Error saving to cache ({self._cache})')
+        self._stored = (self._digest(data), expires_at)
+
+    def delete(self, session_key=None):
+        if session_key is None:
+            if self.session_key is None:
+                return
+            session_key = self.session_key
+
+        if self.write_through:
+            DBStore.delete(self, session_key)
+        if self.use_cache:
+            self._cache.delete(self.cache_key_prefix + session_key)
+        self._stored = None
+
+    # NOTE: The async methods run their sync versions on a thread.
+
+    async def aload(self):
+        return await sync_to_async(self.load)()
+
+    async def aexists(self, session_key):
+        return await sync_to_async(self.exists)(session_key)
+
+    async def asave(self, must_create=False):
+        return await sync_to_async(self.save)(must_create)
+
+    async def adelete(self, session_key=None):
+        return await sync_to_async(self.delete)(session_key)
+
+    @classmethod
+    def clear_expired(
+        cls,
+        chunk_size: int | None = None,
+        pause: float = 0
+    ) -> int:
+        """
+        Delete the expired sessions from the database in chunks, so each
+        `DELETE` stays short instead of locking the whole table at once.
+        (used by the `clearsessions` command)
+
+        Args:
+            chunk_size (int | None): Number of sessions deleted per chunk.
+                Defaults to `SESSION_CLEAR_CHUNK_SIZE`, or 5000.
+            pause (float): Time in seconds to sleep between chunks.
+
+        Returns:
+            int: The number of deleted sessions.
+        """
+        model = cls.get_model_class()
+        chunk_size = chunk_size or getattr(
+            settings, 'SESSION_CLEAR_CHUNK_SIZE', 5000
+        )
+
+        now, deleted = timezone.now(), 0
+        while True:
+            keys = list(
+                model.objects
+                .filter(expire_date__lt=now)
+                .values_list('pk', flat=True)[:chunk_size]
+            )
+            if not keys:
+                return deleted
+
+            deleted += model.objects.filter(pk__in=keys).delete()[0]
+            if pause:
+                time.sleep(pause)
+
+    @classmethod
+    async def aclear_expired(cls) -> int:
+        return await sync_to_async(cls.clear_expired)()
@@ -44,6 +44,7 @@ INSTALLED_APPS = [
     'django.contrib.staticfiles',
 
     # Django Application(s)
+    'jobs.apps.JobsConfig',
     'shop.apps.ShopConfig',
     'users.apps.UsersConfig',
 
@@ -57,11 +58,14 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'core.db.middleware.ReplicaPinningMiddleware',
+    'core.instrumentation.middleware.ServerTimingMiddleware',
+    'core.instrumentation.middleware.MetricsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
-    'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'users.middleware.CachedAuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -70,7 +74,7 @@ ROOT_URLCONF = 'core.urls'
 
 TEMPLATES = [
     {
-        'BACKEND': 'django.template.backends.django.DjangoTemplates',
+        'BACKEND': 'core.instrumentation.templates.DjangoTemplates',
         'DIRS': [
             BASE_DIR / 'templates',  # Ensure the global templates directory is included  # noqa
         ],
@@ -99,10 +103,103 @@ DATABASES = {
         'USER': os.getenv('DB_USER'),
         'PASSWORD': os.getenv('DB_PASSWORD'),
         'HOST': os.getenv('DB_HOST'),
-        'PORT': os.getenv('DB_PORT')
+        'PORT': os.getenv('DB_PORT'),
+
+        # NOTE: Checks a pooled connection before handing it out.
+        'CONN_HEALTH_CHECKS': True,
     }
 }
 
+# Connection pool per worker process. (psycopg's pool)
+# NOTE: The database's connections are split between the worker processes
+# (`WEB_CONCURRENCY`, as read by gunicorn), so the pools never exceed them.
+if os.getenv('DB_POOL', 'true').lower() == 'true':
+    DB_POOL_MAX_SIZE = max(1, (
+        int(os.getenv('DB_POOL_MAX_CONNECTIONS', 20)) //
+        int(os.getenv('WEB_CONCURRENCY', 1))
+    ))
+    DATABASES['default']['OPTIONS'] = {
+        'pool': {
+            'min_size': max(1, DB_POOL_MAX_SIZE // 4),
+            'max_size': DB_POOL_MAX_SIZE,
+
+            # Time in seconds to wait for a connection before failing.
+            'timeout': float(os.getenv('DB_POOL_TIMEOUT', 10)),
+
+            # NOTE: Recycles connections, as poolers close idle ones.
+            'max_idle': 300,
+            'max_lifetime': 1800,
+        }
+    }
+
+# Read replicas, as comma-separated "host:port". (same credentials)
+# NOTE: Reads are routed to healthy replicas by `core.db.routers`.
+for index, replica in enumerate(filter(None, os.getenv(
+    'DB_REPLICA_HOSTS', ''
+).split(','))):
+    host, _, port = replica.strip().partition(':')
+    DATABASES[f'replica_{index + 1}'] = {
+        **DATABASES['default'],
+        'HOST': host,
+        'PORT': port or DATABASES['default']['PORT'],
+        'TEST': {'MIRROR': 'default'},
+    }
+
+DATABASE_ROUTERS = ['core.db.routers.ReplicaRouter']
+DB_REPLICAS = [alias for alias in DATABASES if alias != 'default']
+
+# Time in seconds to read from the primary after writing. (read-your-writes)
+DB_REPLICA_PIN_SECONDS = int(os.getenv('DB_REPLICA_PIN_SECONDS', 5))
+
+# Max replication lag in seconds of a replica to read from.
+DB_REPLICA_MAX_LAG = float(os.getenv('DB_REPLICA_MAX_LAG', 5))
+
+
+# Cache
+# https://docs.djangoproject.com/en/5.1/topics/cache/
+# NOTE: Defaults to a per-process local memory cache when not set.
+CACHES = {
+    'default': {
+        'BACKEND': os.getenv(
+            'CACHE_BACKEND',
+            'django.core.cache.backends.locmem.LocMemCache'
+        ),
+        'LOCATION': os.getenv('CACHE_LOCATION', 'expoph'),
+    }
+}
+
+# Two-tier cache (in-process LRU in front of the default cache).
+# NOTE: Invalidations are broadcasted through PostgreSQL's `NOTIFY`.
+CACHE_LOCAL_MAXSIZE = 1024
+CACHE_LOCAL_TIMEOUT = 60
+CACHE_INVALIDATION_CHANNEL = 'expoph_cache_invalidation'
+
+
+# Sessions
+# https://docs.djangoproject.com/en/5.1/topics/http/sessions/
+# NOTE: Sessions live in the cache, and are written through to the
+# database unless disabled. (requires a shared cache, e.g. Redis) With a
+# process-local cache (the default), they only live in the database.
+SESSION_ENGINE = 'core.sessions.backends'
+SESSION_WRITE_THROUGH = (
+    os.getenv('SESSION_WRITE_THROUGH', 'true').lower() == 'true'
+)
+SESSION_TOUCH_INTERVAL = 300
+SESSION_CLEAR_CHUNK_SIZE = 5000
+
+
+# Instrumentation
+# Share of the requests whose hot paths are timed and logged, besides the
+# ones sent with the `X-Server-Timing: 1` header. (see `core.instrumentation`)
+SERVER_TIMING_SAMPLE_RATE = float(
+    os.getenv('SERVER_TIMING_SAMPLE_RATE', 1.0 if DEBUG else 0.01)
+)
+
+# Bearer token of the Prometheus scraper, for `/metrics`. (or staff users)
+# NOTE: Set `PROMETHEUS_MULTIPROC_DIR` (an empty directory) with several
+# worker processes, so the metrics are aggregated over all of them.
+METRICS_TOKEN = os.getenv('METRICS_TOKEN')
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
@@ -167,6 +264,19 @@ LOGIN_URL = 'users:login'
 LOGIN_REDIRECT_URL = 'users:profile'
 LOGOUT_REDIRECT_URL = LOGIN_URL
 
+# Number of threads hashing the passwords of a bulk registration request.
+# NOTE: Bounded, as they share the CPUs with the other requests.
+BULK_REGISTER_HASH_THREADS = 2
+
+# Shop-related settings.
+# Max age (in seconds) of a process' shop autocomplete index before it's
+# rebuilt in the background, to pick up changes from other processes.
+SHOP_AUTOCOMPLETE_MAX_AGE = 300
+
+# Max wait (in seconds) of a request for the index on a cold start, before
+# falling back to a database query.
+SHOP_AUTOCOMPLETE_COLD_WAIT = 1.0
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.1/ref/settings/#default-auto-field
 
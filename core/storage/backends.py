@@ -1,20 +1,65 @@
+import hashlib
 import os
+from collections.abc import Iterable
+from functools import cached_property
 from typing import override
 
+from django.core.cache import cache
 from loguru import logger
 from storages.backends.s3 import S3Storage
 from storages.utils import clean_name
 from supabase import Client, create_client
 
+from core.instrumentation import instrumented
+from core.instrumentation.metrics import SIGNED_URL_CACHE, STORAGE_LATENCY
+
 from .exceptions import SupabaseObjectError
 
+# Counters of the signed URLs found, or not, in the cache.
+URL_CACHE_HITS = SIGNED_URL_CACHE.labels('hit')
+URL_CACHE_MISSES = SIGNED_URL_CACHE.labels('miss')
+
 
 class SupabaseS3Storage(S3Storage):
     """
     Overridden storage class for S3-compatible buckets on Supabase.
+
+    NOTE: Signed URLs are cached for half of their lifetime, so
+    rendering the same file twice doesn't sign it twice.
     """
 
+    @cached_property
+    def supabase(self) -> Client:
+        """
+        The `supabase` client, initialized once per storage instance.
+        """
+        return create_client(
+            supabase_url=os.getenv('SUPABASE_API_URL'),
+            supabase_key=os.getenv('SUPABASE_API_KEY'),
+        )
+
+    def _supabase_bucket(self):
+        # NOTE: The bucket ID is the storage bucket name from env.
+        bucket_id = os.getenv('SUPABASE_S3_STORAGE_BUCKET_NAME')
+        if not bucket_id:
+            raise SupabaseObjectError(
+                'Supabase S3 storage bucket name is not set.'
+            )
+        return self.supabase.storage.from_(bucket_id)
+
+    def _url_cache_key(self, name: str) -> str:
+        # NOTE: Hashed, as file names may contain spaces. (invalid keys)
+        digest = hashlib.sha256(name.encode()).hexdigest()
+        return f'storage:signed-url:{digest}'
+
+    def _cache_urls(self, urls: dict[str, str]) -> None:
+        cache.set_many(
+            {self._url_cache_key(name): url for name, url in urls.items()},
+            timeout=self.querystring_expire // 2
+        )
+
     @override
+    @instrumented('storage', STORAGE_LATENCY.labels('url'))
     def url(self, name, parameters=None, expire=None, http_method=None):
         """
         Generates a signed URL for accessing a file in the
@@ -37,21 +82,15 @@ class SupabaseS3Storage(S3Storage):
             # Normalize and clean the name of the file from params.
             name = self._normalize_name(clean_name(name))
 
-            # Initialize the `supabase` client.
-            sb: Client = create_client(
-                supabase_url=os.getenv('SUPABASE_API_URL'),
-                supabase_key=os.getenv('SUPABASE_API_KEY'),
-            )
-
-            # NOTE: The bucket ID is the storage bucket name from env.
-            bucket_id = os.getenv('SUPABASE_S3_STORAGE_BUCKET_NAME')
-            if not bucket_id:
-                raise SupabaseObjectError(
-                    'Supabase S3 storage bucket name is not set.'
-                )
+            # Reuse the URL signed recently, if any.
+            url = cache.get(self._url_cache_key(name))
+            if url is not None:
+                URL_CACHE_HITS.inc()
+                return url
+            URL_CACHE_MISSES.inc()
 
             # Make an API request to get the "signedURL" from the response.
-            response = sb.storage.from_(bucket_id).create_signed_url(
+            response = self._supabase_bucket().create_signed_url(
                 path=name,
                 expires_in=self.querystring_expire,  # 3600s = 1hr
             )
@@ -62,9 +101,63 @@ class SupabaseS3Storage(S3Storage):
                 raise SupabaseObjectError(
                     'Signed URL from supabase is empty or none.'
                 )
-            return response.get("signedURL")
+            self._cache_urls({name: url})
+            return url
 
         except Exception as e:
             # Call the original `S3Storage.url()` as fallback.
             logger.error(f'Error retrieving supabase-signed url: {e}')
             return super().url(name, parameters, expire, http_method)
+
+    @instrumented('storage', STORAGE_LATENCY.labels('urls'))
+    def urls(self, names: Iterable[str]) -> dict[str, str]:
+        """
+        Generates the signed URLs of many files, in a single request to
+        the Supabase storage API.
+
+        Args:
+            names (Iterable[str]): The names of the files.
+
+        Returns:
+            dict[str, str]: The signed URL per file name. Falls back to
+                `url()` for the files that couldn't be signed in batch.
+        """
+        names = {self._normalize_name(clean_name(n)): n for n in names}
+
+        # Reuse the URLs signed recently, if any.
+        cached = cache.get_many([self._url_cache_key(n) for n in names])
+        urls = {
+            original: cached[self._url_cache_key(name)]
+            for name, original in names.items()
+            if self._url_cache_key(name) in cached
+        }
+        missing = [name for name, original in names.items()
+                   if original not in urls]
+        URL_CACHE_HITS.inc(len(urls))
+        URL_CACHE_MISSES.inc(len(missing))
+
+        signed = {}
+        if missing:
+            try:
+                response = self._supabase_bucket().create_signed_urls(
+                    paths=missing,
+                    expires_in=self.querystring_expire,
+                )
+                signed = {
+                    item['path']: item['signedURL']
+                    for item in response
+                    if item.get('path') and not item.get('error')
+                }
+                self._cache_urls(signed)
+            except Exception as e:
+                logger.error(f'Error retrieving supabase-signed urls: {e}')
+
+        for name in missing:
+            urls[names[name]] = signed.get(name) or self.url(names[name])
+        return urls
+
+    @override
+    @instrumented('storage', STORAGE_LATENCY.labels('save'))
+    def _save(self, name, content):
+        # NOTE: Only overridden to time the uploads.
+        return super()._save(name, content)
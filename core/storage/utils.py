@@ -0,0 +1,25 @@
+from collections.abc import Iterable
+
+from django.core.files.storage import Storage
+
+__all__ = ['storage_urls']
+
+
+def storage_urls(storage: Storage, names: Iterable[str]) -> dict[str, str]:
+    """
+    Get the URLs of many files of a storage, in one batch when the
+    storage supports it. (see `SupabaseS3Storage.urls`)
+
+    Args:
+        storage (Storage): The storage of the files.
+        names (Iterable[str]): The names of the files.
+
+    Returns:
+        dict[str, str]: The URL per file name.
+    """
+    names = set(names)
+    if not names:
+        return {}
+    if hasattr(storage, 'urls'):
+        return storage.urls(names)
+    return {name: storage.url(name) for name in names}
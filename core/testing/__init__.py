@@ -0,0 +1,3 @@
+# flake8: noqa
+from core.testing.budgets import *
+from core.testing.explain import *
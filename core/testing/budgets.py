@@ -0,0 +1,201 @@
+import re
+import time
+from collections import Counter
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass, field, fields
+from functools import wraps
+
+from django.core.files.storage import storages
+from django.db import connections
+from django.test.utils import CaptureQueriesContext
+
+__all__ = [
+    'BUDGETS',
+    'Budget',
+    'BudgetExceeded',
+    'Usage',
+    'get_budget',
+    'measure'
+]
+
+# Storage methods that are counted as storage calls. (e.g. signed URLs)
+STORAGE_METHODS = ('url', 'urls', 'open', 'save', 'delete', 'exists', 'size')
+
+# Literals of a query, replaced to group the repeated queries. (N+1)
+LITERALS_RE = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+
+
+@dataclass(frozen=True)
+class Budget:
+    """
+    Maximum cost of a single request to a view or API route.
+
+    Attributes:
+        queries (int): Maximum number of database queries. (all aliases)
+        storage_calls (int): Maximum number of calls to the file storage.
+        wall_ms (float): Maximum wall time in milliseconds.
+    """
+    queries: int
+    storage_calls: int = 0
+    wall_ms: float = 250
+
+
+# Budgets per URL name, as resolved from the request path.
+# NOTE: Measured against the seeded fixtures of `conftest.py`, on a cold
+# cache. Lower a budget along with the fix of a regression, never raise it
+# without a reason in the commit.
+BUDGETS: dict[str, Budget] = {
+    # API routes. (`<api namespace>:<operation>`)
+    'api-1.0.1:catalog': Budget(queries=2),
+    'api-1.0.1:get_shop': Budget(queries=1),
+
+    # Admin pages.
+    'admin:index': Budget(queries=2),
+    'admin:shop_shop_changelist': Budget(queries=4),
+    'admin:shop_shop_change': Budget(queries=7, wall_ms=500),
+    'admin:shop_shopfollower_changelist': Budget(queries=4),
+    'admin:shop_product_changelist': Budget(queries=4),
+    'admin:users_customuser_changelist': Budget(queries=4),
+
+    # Site pages.
+    'users:login': Budget(queries=0),
+    'users:profile': Budget(queries=2),
+}
+
+
+class BudgetExceeded(AssertionError):
+    """
+    Raised when a request costs more than the budget of its view.
+    """
+
+
+@dataclass
+class Usage:
+    """
+    Measured cost of a block of code. (see `measure()`)
+    """
+    queries: int = 0
+    storage_calls: int = 0
+    wall_ms: float = 0
+    sql: list[str] = field(default_factory=list)
+    storage: Counter = field(default_factory=Counter)
+
+    def exceeded(self, budget: Budget) -> list[str]:
+        """
+        Get the names of the limits of the budget that were exceeded.
+        """
+        return [
+            f.name for f in fields(Budget)
+            if getattr(self, f.name) > getattr(budget, f.name)
+        ]
+
+    def report(self, budget: Budget, title: str) -> str:
+        """
+        Format the differences between the budget and the usage, with the
+        queries grouped by shape so repeated queries stand out.
+        """
+        lines = [title]
+        for f in fields(Budget):
+            limit, actual = getattr(budget, f.name), getattr(self, f.name)
+            marker = '!' if actual > limit else ' '
+            lines.append(
+                f'  {marker} {f.name:<14}'
+                f'budget {limit:>8g}  actual {actual:>8.6g}  '
+                f'({actual - limit:+.6g})'
+            )
+
+        if self.storage:
+            lines.append('  Storage calls:')
+            lines.extend(
+                f'    {count}x {method}()'
+                for method, count in self.storage.most_common()
+            )
+
+        if self.sql:
+            lines.append('  Queries:')
+            shapes = Counter(LITERALS_RE.sub('?', sql) for sql in self.sql)
+            lines.extend(
+                f'    {count}x {shape}'
+                for shape, count in shapes.most_common()
+            )
+        return '\n'.join(lines)
+
+
+def get_budget(view_name: str) -> Budget:
+    """
+    Get the budget of a view, given its URL name.
+
+    Raises:
+        LookupError: If the view has no budget.
+    """
+    try:
+        return BUDGETS[view_name]
+    except KeyError:
+        raise LookupError(
+            f'No budget for "{view_name}", add one to `BUDGETS`.'
+        ) from None
+
+
+def _count_calls(cls: type, name: str, usage: Usage):
+    method = getattr(cls, name)
+
+    @wraps(method)
+    def wrapper(*args, **kwargs):
+        usage.storage[name] += 1
+        usage.storage_calls += 1
+        return method(*args, **kwargs)
+
+    return wrapper
+
+
+@contextmanager
+def _patched(cls: type, name: str, value):
+    original = cls.__dict__.get(name)
+    setattr(cls, name, value)
+    try:
+        yield
+    finally:
+        if original is None:
+            delattr(cls, name)
+        else:
+            setattr(cls, name, original)
+
+
+@contextmanager
+def measure():
+    """
+    Context manager that measures the queries (on every database), the
+    file storage calls and the wall time of its block.
+
+    NOTE: Only the calls of the current thread are counted for the
+    queries, as Django's connections are per thread.
+
+    Examples:
+        >>> with measure() as usage:
+        >>>     client.get('/api/products/')
+        >>> usage.queries
+        2
+    """
+    usage = Usage()
+    storage_cls = type(storages['default'])
+
+    with ExitStack() as stack:
+        captures = [
+            stack.enter_context(CaptureQueriesContext(connection))
+            for connection in connections.all()
+        ]
+        for name in STORAGE_METHODS:
+            if hasattr(storage_cls, name):
+                stack.enter_context(_patched(
+                    storage_cls, name, _count_calls(storage_cls, name, usage)
+                ))
+
+        start = time.perf_counter()
+        try:
+            yield usage
+        finally:
+            usage.wall_ms = (time.perf_counter() - start) * 1000
+
+    for capture in captures:
+        usage.sql.extend(query['sql'] for query in capture.captured_queries)
+    usage.queries = len(usage.sql)
@@ -0,0 +1,100 @@
+import json
+from collections.abc import Iterator
+from unittest import skipUnless
+
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db.models import QuerySet
+
+__all__ = [
+    'PlanAssertionsMixin',
+    'explain',
+    'plan_nodes',
+    'requires_postgres'
+]
+
+# Plan nodes that a query served by an index shouldn't have.
+FORBIDDEN_NODES = ('Seq Scan', 'Sort')
+
+# Skips a test (or test case) on non-postgres databases. (e.g. SQLite)
+requires_postgres = skipUnless(
+    connections[DEFAULT_DB_ALIAS].vendor == 'postgresql',
+    'Query plans are only tested on PostgreSQL.'
+)
+
+
+def explain(queryset: QuerySet) -> dict:
+    """
+    Get the plan of a queryset, from PostgreSQL's `EXPLAIN (FORMAT JSON)`.
+
+    NOTE: The planner runs with its default settings, so the plan is the
+    one chosen for the tables' statistics. (see `PlanAssertionsMixin`)
+
+    Args:
+        queryset (QuerySet): The queryset to explain. (e.g. a page)
+
+    Returns:
+        dict: The root node of the plan.
+    """
+    plan = json.loads(queryset.explain(format='json'))
+    return plan[0]['Plan']
+
+
+def plan_nodes(plan: dict) -> Iterator[dict]:
+    """
+    Iterate over the nodes of a plan, depth first.
+    """
+    yield plan
+    for child in plan.get('Plans', ()):
+        yield from plan_nodes(child)
+
+
+class PlanAssertionsMixin:
+    """
+    Test case mixin to assert that querysets are served by indexes, given
+    their `EXPLAIN` plans on PostgreSQL.
+
+    NOTE: Seed the tables with a representative dataset and `ANALYZE`
+    them in `setUpTestData()`, as the planner rightly prefers sequential
+    scans and sorts on small tables.
+
+    Examples:
+        >>> @requires_postgres
+        >>> class CatalogPlanTests(PlanAssertionsMixin, TestCase):
+        >>>     def test_catalog_page(self):
+        >>>         self.assertIndexedPlan(
+        >>>             Product.objects.filter(is_listed=True)[:24],
+        >>>             index='product_listed_recent_idx'
+        >>>         )
+    """
+
+    def assertIndexedPlan(
+        self,
+        queryset: QuerySet,
+        index: str | None = None,
+        forbidden: tuple[str, ...] = FORBIDDEN_NODES
+    ) -> dict:
+        """
+        Assert that the plan of a queryset has no sequential scan nor
+        sort, and uses the given index if any.
+
+        Returns:
+            dict: The root node of the plan.
+        """
+        plan = explain(queryset)
+        nodes = list(plan_nodes(plan))
+        formatted = json.dumps(plan, indent=2)
+
+        for node in nodes:
+            node_type = node['Node Type']
+            if node_type in forbidden:
+                relation = node.get('Relation Name', '-')
+                self.fail(
+                    f'Plan has a "{node_type}" node (on "{relation}"):\n'
+                    f'{formatted}'
+                )
+
+        if index is not None and not any(
+            node.get('Index Name') == index for node in nodes
+        ):
+            self.fail(f'Plan doesn\'t use index "{index}":\n{formatted}')
+        return plan
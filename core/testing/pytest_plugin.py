@@ -0,0 +1,93 @@
+"""
+Pytest plugin that enforces the per-view budgets of `BUDGETS`.
+
+Requests made through the `budget_client` fixture are measured, and
+fail with a report when they cost more than the budget of their view.
+Every measured request is summarized at the end of the session.
+
+Examples:
+    >>> @pytest.mark.django_db
+    >>> def test_catalog(budget_client, catalog_data):
+    >>>     budget_client.get('/api/products/')
+"""
+import pytest
+from django.core.cache import caches
+from django.test import Client
+from django.urls import resolve
+
+from .budgets import Budget, BudgetExceeded, Usage, get_budget, measure
+
+# Measured requests of the session, as (title, budget, usage).
+_measured: list[tuple[str, Budget, Usage]] = []
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup('budgets')
+    group.addoption(
+        '--no-wall-budgets',
+        action='store_true',
+        default=False,
+        help='Don\'t enforce the wall time budgets. (e.g. slow CI runners)'
+    )
+
+
+class BudgetClient(Client):
+    """
+    Test client that measures each request against the budget of the view
+    it resolves to.
+    """
+    check_wall_time = True
+
+    def request(self, **request):
+        view_name = resolve(request['PATH_INFO']).view_name
+        budget = get_budget(view_name)
+
+        with measure() as usage:
+            response = super().request(**request)
+
+        title = (
+            f'{request["REQUEST_METHOD"]} {request["PATH_INFO"]} '
+            f'({view_name})'
+        )
+        _measured.append((title, budget, usage))
+
+        exceeded = usage.exceeded(budget)
+        if not self.check_wall_time and 'wall_ms' in exceeded:
+            exceeded.remove('wall_ms')
+        if exceeded:
+            raise BudgetExceeded(
+                usage.report(budget, f'Budget exceeded for {title}:')
+            )
+        return response
+
+
+@pytest.fixture
+def budget_client(request, db) -> BudgetClient:
+    """
+    A `BudgetClient`, starting on cold caches.
+    """
+    from core.cache.tiered import tiered_cache
+
+    for cache in caches.all(initialized_only=True):
+        cache.clear()
+    tiered_cache.local.clear()
+
+    client = BudgetClient()
+    client.check_wall_time = not request.config.getoption('no_wall_budgets')
+    return client
+
+
+def pytest_terminal_summary(terminalreporter):
+    if not _measured:
+        return
+
+    terminalreporter.section('budgets')
+    for title, budget, usage in _measured:
+        exceeded = usage.exceeded(budget)
+        status = 'EXCEEDED' if exceeded else 'ok'
+        terminalreporter.write_line(
+            f'{status:<8} {title}: '
+            f'{usage.queries}/{budget.queries} queries, '
+            f'{usage.storage_calls}/{budget.storage_calls} storage calls, '
+            f'{usage.wall_ms:.1f}/{budget.wall_ms:g} ms'
+        )
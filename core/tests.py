@@ -0,0 +1,311 @@
+import json
+import threading
+import time
+
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.test import RequestFactory
+from ninja import Router, Schema
+from ninja.testing import TestClient
+
+from core.cache import broadcast, tiered
+from core.cache.idempotency import idempotent
+from core.cache.response import bump_version, versioned_cache
+from core.cache.tiered import LRUCache, TieredCache
+from core.sessions import backends as session_backends
+from core.utilities import snowflake
+from core.utilities.snowflake import SnowflakeGenerator
+
+# Response cache. (see `core.cache.response`)
+
+
+def _cached_view(scopes=('things',), delay: float = 0):
+    """
+    A view cached by `versioned_cache()`, counting its calls.
+    """
+    calls = []
+
+    @versioned_cache(scopes)
+    def view(request):
+        calls.append(request)
+        time.sleep(delay)
+        return HttpResponse(f'call {len(calls)}')
+
+    return view, calls
+
+
+def test_response_cache_version_bump():
+    cache.clear()
+    view, calls = _cached_view()
+    request = RequestFactory().get('/things/')
+
+    assert view(request).content == b'call 1'
+    assert view(request).content == b'call 1'
+
+    bump_version('things')
+    assert view(request).content == b'call 2'
+    assert len(calls) == 2
+
+
+def test_response_cache_etag():
+    cache.clear()
+    view, calls = _cached_view()
+    etag = view(RequestFactory().get('/things/'))['ETag']
+
+    response = view(
+        RequestFactory().get('/things/', headers={'If-None-Match': etag})
+    )
+    assert response.status_code == 304
+    assert response['ETag'] == etag
+
+    # NOTE: A stale ETag gets the new response.
+    bump_version('things')
+    response = view(
+        RequestFactory().get('/things/', headers={'If-None-Match': etag})
+    )
+    assert response.status_code == 200
+    assert response['ETag'] != etag
+    assert len(calls) == 2
+
+
+def test_response_cache_single_flight():
+    cache.clear()
+    view, calls = _cached_view(delay=0.2)
+    responses = []
+
+    def get():
+        responses.append(view(RequestFactory().get('/things/')))
+
+    threads = [threading.Thread(target=get) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert {response.content for response in responses} == {b'call 1'}
+
+
+def test_response_cache_uncacheable():
+    cache.clear()
+    view, calls = _cached_view(scopes=lambda request: None)
+    view(RequestFactory().get('/things/'))
+    view(RequestFactory().get('/things/'))
+    assert len(calls) == 2
+
+
+# Idempotency keys. (see `core.cache.idempotency`)
+
+
+class _ThingIn(Schema):
+    name: str
+
+
+def _idempotent_client(lock_timeout: int = 30, delay: float = 0):
+    """
+    A test client of an idempotent operation, counting its calls.
+    """
+    router = Router()
+    calls = []
+
+    @router.post('/things', response={201: dict})
+    @idempotent(lock_timeout=lock_timeout)
+    def create_thing(request, payload: _ThingIn):
+        calls.append(payload)
+        time.sleep(delay)
+        return 201, {'call': len(calls)}
+
+    client = TestClient(router)
+
+    def post(name: str, key: str | None = None):
+        return client.post(
+            '/things',
+            data=json.dumps({'name': name}).encode(),
+            headers={'Idempotency-Key': key} if key else {},
+            content_type='application/json'
+        )
+
+    return post, calls
+
+
+def test_idempotency_replay():
+    cache.clear()
+    post, calls = _idempotent_client()
+
+    first = post('a', key='key-1')
+    retry = post('a', key='key-1')
+    assert (first.status_code, retry.status_code) == (201, 201)
+    assert retry.json() == first.json() == {'call': 1}
+    assert retry['Idempotent-Replayed'] == 'true'
+    assert len(calls) == 1
+
+    # NOTE: Requests without the header always run.
+    post('a')
+    assert len(calls) == 2
+
+
+def test_idempotency_fingerprint_mismatch():
+    cache.clear()
+    post, calls = _idempotent_client()
+
+    post('a', key='key-1')
+    response = post('b', key='key-1')
+    assert response.status_code == 422
+    assert response.json()['detail'][0]['loc'] == [
+        'header', 'Idempotency-Key'
+    ]
+    assert len(calls) == 1
+
+
+def test_idempotency_in_flight():
+    cache.clear()
+    post, calls = _idempotent_client(lock_timeout=1, delay=1.5)
+    responses = []
+
+    def retry():
+        responses.append(post('a', key='key-1'))
+
+    threads = [threading.Thread(target=retry) for _ in range(2)]
+    threads[0].start()
+    time.sleep(0.2)
+    threads[1].start()
+    for thread in threads:
+        thread.join()
+
+    # NOTE: The lock outlives its timeout while the view runs.
+    assert sorted(r.status_code for r in responses) == [201, 409]
+    assert len(calls) == 1
+
+
+# Two-tier cache. (see `core.cache.tiered`)
+
+
+def test_lru_cache_bounds_and_expiry(monkeypatch):
+    lru = LRUCache(maxsize=2, timeout=60)
+    lru.set('a', 1)
+    lru.set('b', 2)
+    lru.get('a')
+    lru.set('c', 3)
+    assert lru.get('b', None) is None  # least recently used
+    assert (lru.get('a'), lru.get('c')) == (1, 3)
+
+    now = time.monotonic()
+    monkeypatch.setattr(time, 'monotonic', lambda: now + 61)
+    assert lru.get('a', None) is None
+
+
+def test_tiered_cache_stats():
+    cache.clear()
+    tiered = TieredCache(maxsize=10)
+    tiered.set('key', 'value')
+    tiered.local.clear()
+
+    assert tiered.get('key') == 'value'  # filled from the shared tier
+    assert tiered.get('key') == 'value'
+    assert tiered.get('missing') is None
+    assert tiered.get_stats() == {
+        'local': {'hits': 1, 'misses': 2, 'hit_rate': 1 / 3},
+        'shared': {'hits': 1, 'misses': 1, 'hit_rate': 0.5},
+    }
+
+
+def test_tiered_cache_broadcast_invalidation():
+    cache.clear()
+    tiered = TieredCache(maxsize=10)
+    tiered.local.set('a', 1)
+    tiered.local.set('b', 2)
+
+    tiered._on_invalidation('a')
+    assert tiered.local.get('a', None) is None
+    tiered._on_invalidation(None)  # e.g. after a reconnect
+    assert len(tiered.local) == 0
+
+
+def test_broadcast_payloads_are_bounded():
+    keys = [f'key:{i:04}' for i in range(2000)]
+    payloads = list(broadcast._payloads(keys))
+
+    assert len(payloads) > 1
+    assert all(len(p) <= broadcast.MAX_PAYLOAD_SIZE for p in payloads)
+    assert '\n'.join(payloads).split('\n') == keys
+
+
+def test_cached_accessor_broadcasts_once_on_commit(
+    seeded, monkeypatch, django_capture_on_commit_callbacks
+):
+    from shop.models import Shop
+
+    published = []
+    monkeypatch.setattr(tiered, 'publish_invalidation', published.append)
+    shop = Shop.cached.get(shop_id=seeded['shops'][0].shop_id)
+
+    with django_capture_on_commit_callbacks() as callbacks:
+        shop.shop_name = 'Renamed Shop'
+        shop.save()
+    assert published == []
+
+    for callback in callbacks:
+        callback()
+    assert published == [Shop.cached._key('pk', shop.pk)]
+    assert Shop.cached.get(shop_id=shop.shop_id).shop_name == 'Renamed Shop'
+
+
+# Sessions. (see `core.sessions.backends`)
+
+
+def test_session_store_on_local_cache(db, monkeypatch):
+    cache.clear()
+    monkeypatch.setattr(
+        session_backends, 'is_process_local', lambda alias: True
+    )
+    session = session_backends.SessionStore()
+    session['key'] = 'value'
+    session.save()
+
+    # NOTE: Only kept in the database, seen by every worker process.
+    assert not session.use_cache and session.write_through
+    assert cache.get(session.cache_key) is None
+    assert session_backends.SessionStore(session.session_key)['key'] == (
+        'value'
+    )
+
+    session.delete()
+    assert not session_backends.SessionStore().exists(session.session_key)
+
+
+def test_session_store_on_shared_cache(db, settings):
+    cache.clear()
+    settings.SESSION_WRITE_THROUGH = False
+    session = session_backends.SessionStore()
+    session['key'] = 'value'
+    session.save()
+
+    assert session.use_cache and not session.write_through
+    assert cache.get(session.cache_key) is not None
+    assert session_backends.SessionStore(session.session_key)['key'] == (
+        'value'
+    )
+
+
+# Snowflake IDs. (see `core.utilities.snowflake`)
+
+
+def test_snowflake_on_wait():
+    waits = []
+    generator = SnowflakeGenerator(
+        worker_id=1, process_id=1, on_wait=waits.append
+    )
+
+    # NOTE: A clock stuck on the same millisecond for a few more reads
+    # than the sequence allows, then ticking.
+    reads = []
+
+    def clock():
+        reads.append(None)
+        return snowflake.EPOCH + (len(reads) > snowflake.MAX_SEQUENCE + 3)
+
+    generator._current_timestamp = clock
+    ids = generator.generate_ids(snowflake.MAX_SEQUENCE + 2)
+
+    assert len(set(ids)) == len(ids) and ids == sorted(ids)
+    assert waits == [1]  # spun once, until the clock ticked
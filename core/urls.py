@@ -20,11 +20,13 @@ from django.contrib import admin
 from django.urls import include, path
 
 from .api import api
+from .instrumentation.views import metrics_view
 
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('api/', api.urls),
     path('users/', include('users.urls')),
+    path('metrics', metrics_view, name='metrics'),
 ]
 
 # Add handling for serving static files in development mode.
@@ -1,5 +1,6 @@
 import threading
 import time
+from collections.abc import Callable
 from dataclasses import dataclass, field
 
 # Define constants.
@@ -28,6 +29,7 @@ class SnowflakeGenerator:
 
     worker_id: int
     process_id: int
+    on_wait: Callable[[int], None] | None = field(default=None, repr=False)
     sequence: int = field(default=0, init=False)
     last_timestamp: int = field(default=-1, init=False)
     lock: threading.Lock = field(default_factory=threading.Lock, init=False)
@@ -39,6 +41,9 @@ class SnowflakeGenerator:
         Args:
             worker_id (int): Identifier for the worker (0-31).
             process_id (int): Identifier for the process (0-31).
+            on_wait (Callable[[int], None] | None): Called with the number
+                of spins whenever the sequence is exhausted, and the
+                generator waits for the next millisecond. (e.g. metrics)
         """
         if not (0 <= self.worker_id <= MAX_WORKER_ID):
             raise ValueError(
@@ -56,10 +61,50 @@ class SnowflakeGenerator:
     def _wait_for_next_millis(self, last_timestamp: int) -> int:
         """Wait until the next millisecond."""
         timestamp = self._current_timestamp()
+        spins = 0
         while timestamp <= last_timestamp:
             timestamp = self._current_timestamp()
+            spins += 1
+
+        if self.on_wait is not None:
+            self.on_wait(spins)
         return timestamp
 
+    def _next_id(self) -> int:
+        """
+        Generate the next Snowflake ID.
+
+        NOTE: Must be called while holding the lock.
+        """
+        timestamp = self._current_timestamp()
+
+        if timestamp < self.last_timestamp:
+            raise SnowFlakeError(
+                'Clock moved backwards. Refusing to generate ID.'
+            )
+
+        if self.last_timestamp == timestamp:
+            # Same millisecond, increment the sequence.
+            self.sequence = (self.sequence + 1) & MAX_SEQUENCE
+
+            if self.sequence == 0:
+                # Sequence exhausted, wait for next millisecond.
+                timestamp = self._wait_for_next_millis(self.last_timestamp)
+        else:
+            # Reset sequence for a new millisecond.
+            self.sequence = 0
+
+        self.last_timestamp = timestamp
+
+        # Construct the Snowflake ID.
+        snowflake_id = (
+            ((timestamp - EPOCH) << TIMESTAMP_SHIFT) |
+            (self.process_id << PROCESS_ID_SHIFT) |
+            (self.worker_id << WORKER_ID_SHIFT) |
+            self.sequence
+        )
+        return snowflake_id
+
     def generate_id(self) -> int:
         """
         Generate a unique Snowflake ID.
@@ -72,31 +117,21 @@ class SnowflakeGenerator:
             >>> generator.generate_id()  # 12525664079873
         """
         with self.lock:
-            timestamp = self._current_timestamp()
+            return self._next_id()
 
-            if timestamp < self.last_timestamp:
-                raise SnowFlakeError(
-                    'Clock moved backwards. Refusing to generate ID.'
-                )
-
-            if self.last_timestamp == timestamp:
-                # Same millisecond, increment the sequence.
-                self.sequence = (self.sequence + 1) & MAX_SEQUENCE
-
-                if self.sequence == 0:
-                    # Sequence exhausted, wait for next millisecond.
-                    timestamp = self._wait_for_next_millis(self.last_timestamp)
-            else:
-                # Reset sequence for a new millisecond.
-                self.sequence = 0
-
-            self.last_timestamp = timestamp
-
-            # Construct the Snowflake ID.
-            snowflake_id = (
-                ((timestamp - EPOCH) << TIMESTAMP_SHIFT) |
-                (self.process_id << PROCESS_ID_SHIFT) |
-                (self.worker_id << WORKER_ID_SHIFT) |
-                self.sequence
-            )
-            return snowflake_id
+    def generate_ids(self, n: int) -> list[int]:
+        """
+        Generate a batch of unique Snowflake IDs, acquiring the lock once.
+
+        Args:
+            n (int): Number of IDs to generate.
+
+        Returns:
+            list[int]: The unique 64-bit IDs, in ascending order.
+
+        Examples:
+            >>> generator = SnowflakeGenerator(worker_id=1, process_id=1)
+            >>> generator.generate_ids(2)  # [12525664079873, 12525664079874]
+        """
+        with self.lock:
+            return [self._next_id() for _ in range(n)]
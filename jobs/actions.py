@@ -0,0 +1,146 @@
+import pickle
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import wraps
+
+from django.contrib import admin, messages
+from django.db.models import Count, Max, QuerySet
+from django.urls import reverse
+from django.utils.html import format_html
+
+from .models import AdminJob
+
+__all__ = [
+    'ChunkedAction',
+    'chunked_action',
+    'enqueue_job',
+    'get_action'
+]
+
+
+@dataclass(frozen=True)
+class ChunkedAction:
+    """
+    Handler of a background admin action, run once per chunk.
+    """
+    name: str
+    func: Callable[[QuerySet], int | None]
+    description: str
+    chunk_size: int
+
+
+# Registered handlers by name. (see `chunked_action`)
+_registry: dict[str, ChunkedAction] = {}
+
+
+def get_action(name: str) -> ChunkedAction:
+    """
+    Get a registered handler by name.
+
+    Raises:
+        LookupError: When no handler is registered with the name.
+    """
+    try:
+        return _registry[name]
+    except KeyError:
+        raise LookupError(f'Action "{name}" is not registered.') from None
+
+
+def enqueue_job(
+    action: ChunkedAction,
+    queryset: QuerySet,
+    user=None
+) -> AdminJob:
+    """
+    Create the job of an action over the objects of a queryset.
+
+    NOTE: Only the queryset's query is stored, bounded by its current
+    last primary key, so the objects created afterwards aren't part of
+    the job. The runner walks it in chunks, by primary key.
+    """
+    bounds = queryset.order_by().aggregate(
+        total=Count('pk'),
+        max_pk=Max('pk')
+    )
+    if bounds['max_pk'] is None:
+        selection = queryset.none()
+    else:
+        selection = queryset.filter(pk__lte=bounds['max_pk'])
+
+    return AdminJob.objects.create(
+        action=action.name,
+        description=action.description,
+        model=queryset.model._meta.label,
+        query=pickle.dumps(selection.order_by('pk').query),
+        chunk_size=action.chunk_size,
+        total=bounds['total'],
+        created_by=user if user and user.is_authenticated else None
+    )
+
+
+def chunked_action(
+    description: str,
+    chunk_size: int = 500,
+    name: str | None = None,
+    permissions: list[str] | None = None
+):
+    """
+    Decorator that turns a function over a queryset into an admin
+    action that runs in the background, one chunk of the selected
+    objects at a time. (see the `run_jobs` command)
+
+    The function gets a queryset of one chunk, and runs within the
+    chunk's transaction. It may return the number of affected objects.
+
+    NOTE: Handlers are registered when their module is imported, so
+    define them in (or import them from) the app's `admin.py`, which
+    workers import on startup.
+
+    Args:
+        description (str): The action's description on the admin.
+        chunk_size (int): Number of objects per chunk.
+        name (str | None): The registered name of the handler. Defaults
+            to "<app>.<function name>".
+        permissions (list[str] | None): The permissions required to run
+            the action. (e.g. `['change']`)
+
+    Returns:
+        Callable: A decorator that returns the admin action.
+
+    Examples:
+        >>> @chunked_action(description='Approve selected shops')
+        >>> def approve_shops(queryset):
+        >>>     return queryset.update(is_active=True)
+        >>>
+        >>> class ShopAdmin(admin.ModelAdmin):
+        >>>     actions = [approve_shops]
+    """
+    def decorator(func):
+        app_label = func.__module__.split('.')[0]
+        action = ChunkedAction(
+            name=name or f'{app_label}.{func.__name__}',
+            func=func,
+            description=description,
+            chunk_size=chunk_size
+        )
+        _registry[action.name] = action
+
+        @admin.action(description=description, permissions=permissions)
+        @wraps(func)
+        def admin_action(modeladmin, request, queryset):
+            job = enqueue_job(action, queryset, request.user)
+            modeladmin.message_user(
+                request,
+                format_html(
+                    '{} object(s) will be processed in the background. '
+                    '<a href="{}">See the progress of job #{}.</a>',
+                    job.total,
+                    reverse('admin:jobs_adminjob_change', args=[job.pk]),
+                    job.pk
+                ),
+                messages.INFO
+            )
+
+        admin_action.chunked_action = action
+        return admin_action
+    return decorator
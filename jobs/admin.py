@@ -0,0 +1,143 @@
+from django.contrib import admin, messages
+from django.utils import timezone
+from django.utils.html import format_html
+
+from core.admin import EstimatedCountPaginator
+
+from .models import AdminJob, JobStatus
+
+
+@admin.register(AdminJob)
+class AdminJobAdmin(admin.ModelAdmin):
+    """
+    Custom admin configuration for the `AdminJob` model, used as the
+    status page of the background admin actions.
+    """
+    list_display = (
+        'id',
+        'description',
+        'progress',
+        'status',
+        'created_by',
+        'created_at',
+        'finished_at'
+    )
+
+    list_filter = (
+        'status',
+        'action',
+        'created_at'
+    )
+
+    fieldsets = (
+        (
+            'Job Details', {
+                'fields': (
+                    'action',
+                    'description',
+                    'model',
+                    'chunk_size',
+                    'created_by'
+                )
+            }
+        ),
+        (
+            'Progress', {
+                'fields': (
+                    'status',
+                    'progress',
+                    'affected',
+                    'attempts',
+                    'error'
+                )
+            }
+        ),
+        (
+            'Timestamps', {
+                'fields': (
+                    'created_at',
+                    'started_at',
+                    'heartbeat_at',
+                    'finished_at'
+                )
+            }
+        ),
+    )
+
+    list_per_page = 25
+
+    # NOTE: Keep the number of queries per page constant.
+    list_select_related = ('created_by',)
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+    actions = [
+        'resume_jobs',
+        'cancel_jobs'
+    ]
+
+    def get_queryset(self, request):
+        # NOTE: The query of the selected objects isn't displayed.
+        return super().get_queryset(request).defer('query')
+
+    def get_readonly_fields(self, request, obj=None):
+        return [
+            field for fieldset in self.fieldsets
+            for field in fieldset[1]['fields']
+        ]
+
+    def has_add_permission(self, request):
+        # NOTE: Jobs are created by the admin actions.
+        return False
+
+    @admin.display(description='Progress')
+    def progress(self, obj: AdminJob):
+        """
+        Display the progress of the job as a progress bar.
+        """
+        return format_html(
+            '<progress value="{}" max="{}"></progress> {} / {} ({}%)',
+            obj.processed,
+            obj.total or 1,
+            obj.processed,
+            obj.total,
+            obj.percent
+        )
+
+    @admin.action(description='Resume selected jobs')
+    def resume_jobs(self, request, queryset):
+        """
+        Admin action to resume the failed or canceled jobs, from their
+        last completed chunk.
+        """
+        updated = queryset.filter(
+            status__in=[JobStatus.FAILED, JobStatus.CANCELED]
+        ).update(
+            status=JobStatus.PENDING,
+            attempts=0,
+            error='',
+            finished_at=None
+        )
+        self.message_user(
+            request,
+            f'{updated} job(s) successfully resumed.',
+            messages.SUCCESS
+        )
+
+    @admin.action(description='Cancel selected jobs')
+    def cancel_jobs(self, request, queryset):
+        """
+        Admin action to cancel the pending or running jobs, after
+        their current chunk.
+        """
+        updated = queryset.filter(
+            status__in=[JobStatus.PENDING, JobStatus.RUNNING]
+        ).update(
+            status=JobStatus.CANCELED,
+            finished_at=timezone.now()
+        )
+        self.message_user(
+            request,
+            f'{updated} job(s) successfully canceled.',
+            messages.WARNING
+        )
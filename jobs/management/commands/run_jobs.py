@@ -0,0 +1,50 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from jobs.runner import STALE_AFTER, claim_job, run_job
+
+
+class Command(BaseCommand):
+    help = (
+        'Run the background admin jobs. (e.g. chunked admin actions) '
+        'Start as many workers as needed.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Exit once there are no more jobs to run.'
+        )
+        parser.add_argument(
+            '--poll',
+            type=float,
+            default=2,
+            help='Time in seconds to sleep when there are no jobs.'
+        )
+        parser.add_argument(
+            '--stale-after',
+            type=int,
+            default=STALE_AFTER,
+            help=(
+                'Time in seconds without progress after which a running '
+                'job is resumed. Should exceed the time of a chunk.'
+            )
+        )
+
+    def handle(self, *args, **options):
+        ran = 0
+        while True:
+            job = claim_job(stale_after=options['stale_after'])
+            if job is None:
+                if options['once']:
+                    break
+                time.sleep(options['poll'])
+                continue
+
+            job = run_job(job)
+            ran += 1
+            self.stdout.write(f'Job {job}: {job.get_status_display()}.')
+
+        self.stdout.write(self.style.SUCCESS(f'Ran {ran} job(s).'))
@@ -0,0 +1,47 @@
+# Generated by Django 5.1 on 2026-10-18 23:35
+
+import django.core.serializers.json
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AdminJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('action', models.CharField(max_length=100, verbose_name='Action')),
+                ('description', models.CharField(max_length=255, verbose_name='Description')),
+                ('model', models.CharField(help_text='The label of the model. (e.g. "shop.Shop")', max_length=100, verbose_name='Model')),
+                ('query', models.BinaryField(help_text='The pickled query of the selected objects.', verbose_name='Query')),
+                ('last_pk', models.JSONField(blank=True, encoder=django.core.serializers.json.DjangoJSONEncoder, help_text='The primary key of the last processed object.', null=True, verbose_name='Last Primary Key')),
+                ('chunk_size', models.PositiveIntegerField(default=500, verbose_name='Chunk Size')),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('running', 'Running'), ('succeeded', 'Succeeded'), ('failed', 'Failed'), ('canceled', 'Canceled')], default='pending', max_length=10, verbose_name='Status')),
+                ('total', models.PositiveIntegerField(default=0, verbose_name='Total')),
+                ('processed', models.PositiveIntegerField(default=0, help_text='The number of objects of the completed chunks.', verbose_name='Processed')),
+                ('affected', models.PositiveIntegerField(default=0, help_text='The number of objects changed by the action.', verbose_name='Affected')),
+                ('attempts', models.PositiveSmallIntegerField(default=0, verbose_name='Attempts')),
+                ('error', models.TextField(blank=True, verbose_name='Error')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Created At')),
+                ('started_at', models.DateTimeField(blank=True, null=True, verbose_name='Started At')),
+                ('heartbeat_at', models.DateTimeField(blank=True, help_text='The last time a worker reported progress on the job.', null=True, verbose_name='Heartbeat At')),
+                ('finished_at', models.DateTimeField(blank=True, null=True, verbose_name='Finished At')),
+                ('created_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='admin_jobs', to=settings.AUTH_USER_MODEL, verbose_name='Created By')),
+            ],
+            options={
+                'verbose_name': 'Admin Job',
+                'verbose_name_plural': 'Admin Jobs',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['status', 'created_at'], name='jobs_status_created_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,147 @@
+from typing import override
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+
+__all__ = ['AdminJob', 'JobStatus']
+
+
+class JobStatus(models.TextChoices):
+    """
+    Status choice(s) for background jobs.
+    """
+    PENDING = 'pending', 'Pending'
+    RUNNING = 'running', 'Running'
+    SUCCEEDED = 'succeeded', 'Succeeded'
+    FAILED = 'failed', 'Failed'
+    CANCELED = 'canceled', 'Canceled'
+
+
+class AdminJob(models.Model):
+    """
+    Model representing an admin action that runs in the background,
+    over the selected objects split into chunks.
+
+    NOTE: The progress is saved with each chunk, so a job whose worker
+    died is resumed from its last completed chunk.
+    NOTE: The `total` is counted when the job is created, so objects
+    deleted (or changed) in the meantime may not be processed.
+    """
+    # Registered handler of the job. (e.g. "shop.approve_shops")
+    action = models.CharField(
+        max_length=100,
+        verbose_name='Action'
+    )
+    description = models.CharField(
+        max_length=255,
+        verbose_name='Description'
+    )
+
+    # Objects to process, by model label and query.
+    model = models.CharField(
+        max_length=100,
+        verbose_name='Model',
+        help_text='The label of the model. (e.g. "shop.Shop")'
+    )
+    query = models.BinaryField(
+        verbose_name='Query',
+        help_text='The pickled query of the selected objects.'
+    )
+    last_pk = models.JSONField(
+        null=True,
+        blank=True,
+        encoder=DjangoJSONEncoder,
+        verbose_name='Last Primary Key',
+        help_text='The primary key of the last processed object.'
+    )
+    chunk_size = models.PositiveIntegerField(
+        default=500,
+        verbose_name='Chunk Size'
+    )
+
+    # Progress
+    status = models.CharField(
+        max_length=10,
+        choices=JobStatus.choices,
+        default=JobStatus.PENDING,
+        verbose_name='Status'
+    )
+    total = models.PositiveIntegerField(
+        default=0,
+        verbose_name='Total'
+    )
+    processed = models.PositiveIntegerField(
+        default=0,
+        verbose_name='Processed',
+        help_text='The number of objects of the completed chunks.'
+    )
+    affected = models.PositiveIntegerField(
+        default=0,
+        verbose_name='Affected',
+        help_text='The number of objects changed by the action.'
+    )
+    attempts = models.PositiveSmallIntegerField(
+        default=0,
+        verbose_name='Attempts'
+    )
+    error = models.TextField(
+        blank=True,
+        verbose_name='Error'
+    )
+
+    created_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='admin_jobs',
+        verbose_name='Created By'
+    )
+
+    # Timestamps
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+        verbose_name='Created At'
+    )
+    started_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name='Started At'
+    )
+    heartbeat_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name='Heartbeat At',
+        help_text='The last time a worker reported progress on the job.'
+    )
+    finished_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name='Finished At'
+    )
+
+    @property
+    def percent(self) -> int:
+        """
+        The progress of the job, in percent.
+        """
+        if not self.total:
+            return 100 if self.status == JobStatus.SUCCEEDED else 0
+        return min(self.processed * 100 // self.total, 100)
+
+    @override
+    def __str__(self):
+        return f'#{self.pk} {self.description}'
+
+    class Meta:
+        ordering = ['-created_at']
+        verbose_name = 'Admin Job'
+        verbose_name_plural = 'Admin Jobs'
+        indexes = [
+            # NOTE: For workers claiming the next job.
+            models.Index(
+                fields=['status', 'created_at'],
+                name='jobs_status_created_idx'
+            ),
+        ]
@@ -0,0 +1,184 @@
+import pickle
+import traceback
+from datetime import timedelta
+
+from django.apps import apps
+from django.db import transaction
+from django.db.models import Q, QuerySet
+from django.utils import timezone
+from loguru import logger
+
+from .actions import get_action
+from .models import AdminJob, JobStatus
+
+__all__ = [
+    'claim_job',
+    'run_job'
+]
+
+# Time in seconds without heartbeat after which a running job is
+# considered abandoned (e.g. its worker died), and resumed.
+STALE_AFTER = 300
+
+# Max number of times a job is claimed before it's failed.
+MAX_ATTEMPTS = 5
+
+
+def claim_job(stale_after: int = STALE_AFTER) -> AdminJob | None:
+    """
+    Claim the oldest pending (or abandoned) job, if any.
+
+    NOTE: Locked jobs are skipped, so concurrent workers never
+    claim the same job.
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        job = (
+            AdminJob.objects
+            .select_for_update(skip_locked=True)
+            .filter(
+                Q(status=JobStatus.PENDING) |
+                Q(
+                    status=JobStatus.RUNNING,
+                    heartbeat_at__lt=now - timedelta(seconds=stale_after)
+                )
+            )
+            .order_by('created_at')
+            .first()
+        )
+        if job is None:
+            return None
+
+        job.attempts += 1
+        job.heartbeat_at = now
+        job.started_at = job.started_at or now
+        if job.attempts > MAX_ATTEMPTS:
+            job.status = JobStatus.FAILED
+            job.error = f'Abandoned after {MAX_ATTEMPTS} attempts.'
+            job.finished_at = now
+        else:
+            job.status = JobStatus.RUNNING
+        job.save(update_fields=[
+            'status',
+            'attempts',
+            'error',
+            'heartbeat_at',
+            'started_at',
+            'finished_at'
+        ])
+    return job
+
+
+def _get_selection(job: AdminJob) -> QuerySet:
+    """
+    Get the queryset of the objects selected for a job.
+    """
+    queryset = apps.get_model(job.model)._default_manager.all()
+    queryset.query = pickle.loads(bytes(job.query))
+    return queryset
+
+
+def _run_chunk(job: AdminJob, func, selection: QuerySet) -> int | None:
+    """
+    Run the next chunk of a job, saving its progress in the same
+    transaction.
+
+    The chunk is made of the next selected objects after the last
+    processed one, by primary key.
+
+    Returns:
+        int | None: The number of objects of the chunk (0 when there
+            are no more), or None when the job was canceled or taken
+            over by another worker.
+    """
+    with transaction.atomic():
+        locked = (
+            AdminJob.objects
+            .select_for_update()
+            .defer('query')
+            .get(pk=job.pk)
+        )
+        if (
+            locked.status != JobStatus.RUNNING or
+            locked.processed != job.processed
+        ):
+            return None
+
+        # Get the primary keys of the next chunk, after the last one.
+        if job.last_pk is not None:
+            selection = selection.filter(pk__gt=job.last_pk)
+        object_ids = list(
+            selection.values_list('pk', flat=True)[:job.chunk_size]
+        )
+        if not object_ids:
+            return 0
+
+        affected = func(
+            selection.model._default_manager.filter(pk__in=object_ids)
+        )
+
+        locked.processed += len(object_ids)
+        locked.affected += (
+            len(object_ids) if affected is None else affected
+        )
+        locked.last_pk = object_ids[-1]
+        locked.heartbeat_at = timezone.now()
+        locked.save(update_fields=[
+            'processed',
+            'affected',
+            'last_pk',
+            'heartbeat_at'
+        ])
+
+    job.processed = locked.processed
+    job.affected = locked.affected
+    job.last_pk = locked.last_pk
+    job.heartbeat_at = locked.heartbeat_at
+    return len(object_ids)
+
+
+def run_job(job: AdminJob) -> AdminJob:
+    """
+    Run the remaining chunks of a claimed job.
+
+    A failing chunk is rolled back, and fails the job. Resuming the job
+    runs it again from that chunk.
+    """
+    if job.status != JobStatus.RUNNING:
+        return job
+
+    logger.info(f'Running job {job} from {job.processed}/{job.total}.')
+    try:
+        func = get_action(job.action).func
+        selection = _get_selection(job)
+
+        while True:
+            count = _run_chunk(job, func, selection)
+            if count is None:
+                logger.warning(f'Job {job} was canceled or taken over.')
+                return job
+            if count < job.chunk_size:
+                break
+
+    except Exception:
+        logger.exception(f'Job {job} failed.')
+        AdminJob.objects.filter(pk=job.pk).update(
+            status=JobStatus.FAILED,
+            error=traceback.format_exc(limit=5),
+            finished_at=timezone.now()
+        )
+        job.refresh_from_db(fields=['status', 'error', 'finished_at'])
+        return job
+
+    AdminJob.objects.filter(pk=job.pk, status=JobStatus.RUNNING).update(
+        status=JobStatus.SUCCEEDED,
+        finished_at=timezone.now()
+    )
+    job.refresh_from_db(fields=['status', 'finished_at'])
+
+    # Log the event.
+    logger.success(
+        f'Job {job} processed {job.processed} object(s), '
+        f'changed {job.affected}.'
+    )
+    return job
@@ -0,0 +1,176 @@
+import threading
+from dataclasses import replace
+from datetime import timedelta
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.db import connection, transaction
+from django.utils import timezone
+
+from . import runner
+from .actions import chunked_action, enqueue_job
+from .models import AdminJob, JobStatus
+from .runner import (
+    MAX_ATTEMPTS,
+    _get_selection,
+    _run_chunk,
+    claim_job,
+    run_job
+)
+
+# Chunks of primary keys seen by the test action.
+chunks = []
+
+
+@chunked_action(
+    description='Verify selected users',
+    chunk_size=2,
+    name='jobs.tests.verify_users'
+)
+def verify_users(queryset):
+    chunks.append(sorted(queryset.values_list('pk', flat=True)))
+    return queryset.filter(is_verified=False).update(is_verified=True)
+
+
+@pytest.fixture
+def job(db, django_user_model) -> AdminJob:
+    """
+    A pending job verifying 5 users, in 3 chunks.
+    """
+    chunks.clear()
+    for i in range(5):
+        django_user_model.objects.create_user(
+            email=f'user{i}@example.com',
+            password='password'
+        )
+    return enqueue_job(
+        verify_users.chunked_action, django_user_model.objects.all()
+    )
+
+
+def _make_stale(job: AdminJob, **fields) -> None:
+    AdminJob.objects.filter(pk=job.pk).update(
+        status=JobStatus.RUNNING,
+        heartbeat_at=timezone.now() - timedelta(hours=1),
+        **fields
+    )
+
+
+# Claiming jobs. (see `jobs.runner.claim_job`)
+
+
+def test_claim_job(job):
+    claimed = claim_job()
+    assert claimed.pk == job.pk
+    assert (claimed.status, claimed.attempts) == (JobStatus.RUNNING, 1)
+
+    # NOTE: A running job with a recent heartbeat isn't claimed again.
+    assert claim_job() is None
+
+
+def test_claim_job_after_max_attempts(job):
+    _make_stale(job, attempts=MAX_ATTEMPTS)
+
+    failed = claim_job()
+    assert failed.status == JobStatus.FAILED
+    assert failed.error == f'Abandoned after {MAX_ATTEMPTS} attempts.'
+    assert run_job(failed).processed == 0
+    assert claim_job() is None
+
+
+@pytest.mark.skipif(
+    connection.vendor != 'postgresql',
+    reason='SKIP LOCKED is only supported on PostgreSQL.'
+)
+@pytest.mark.django_db(transaction=True)
+def test_claim_job_skips_locked(job):
+    other = enqueue_job(
+        verify_users.chunked_action, get_user_model().objects.all()
+    )
+    locked, claimed = threading.Event(), threading.Event()
+
+    def hold_lock():
+        with transaction.atomic():
+            AdminJob.objects.select_for_update().get(pk=job.pk)
+            locked.set()
+            claimed.wait(timeout=5)
+        connection.close()
+
+    thread = threading.Thread(target=hold_lock)
+    thread.start()
+    try:
+        locked.wait(timeout=5)
+        assert claim_job().pk == other.pk
+    finally:
+        claimed.set()
+        thread.join()
+
+
+# Running jobs. (see `jobs.runner.run_job`)
+
+
+def test_run_job_in_chunks(job):
+    job = run_job(claim_job())
+    assert job.status == JobStatus.SUCCEEDED
+    assert (job.processed, job.affected) == (5, 5)
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    assert sum(chunks, []) == sorted(
+        get_user_model().objects.values_list('pk', flat=True)
+    )
+    assert job.last_pk == chunks[-1][-1]
+
+
+def test_run_job_selection(job, django_user_model):
+    # NOTE: Objects created after the job aren't part of it.
+    django_user_model.objects.create_user(email='new@example.com')
+
+    # NOTE: Deleted objects are skipped, without stalling the job.
+    django_user_model.objects.filter(email='user4@example.com').delete()
+
+    job = run_job(claim_job())
+    assert job.status == JobStatus.SUCCEEDED
+    assert (job.total, job.processed, job.affected) == (5, 4, 4)
+    assert not django_user_model.objects.get(
+        email='new@example.com'
+    ).is_verified
+
+
+def test_run_job_empty_selection(db, django_user_model):
+    job = enqueue_job(
+        verify_users.chunked_action, django_user_model.objects.none()
+    )
+    job = run_job(claim_job())
+    assert job.status == JobStatus.SUCCEEDED
+    assert (job.total, job.processed, job.percent) == (0, 0, 100)
+
+
+def test_run_job_resumes_after_stale_heartbeat(job):
+    claimed = claim_job()
+    _run_chunk(
+        claimed, verify_users.chunked_action.func, _get_selection(claimed)
+    )
+    _make_stale(claimed)  # e.g. the worker died
+
+    resumed = claim_job()
+    assert (resumed.processed, resumed.attempts) == (2, 2)
+
+    job = run_job(resumed)
+    assert job.status == JobStatus.SUCCEEDED
+    assert (job.processed, job.affected) == (5, 5)
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+
+
+def test_run_job_failing_chunk(job, monkeypatch):
+    def fail_on_second_chunk(queryset):
+        if chunks:
+            raise RuntimeError('Chunk failed.')
+        return verify_users.chunked_action.func(queryset)
+
+    action = replace(verify_users.chunked_action, func=fail_on_second_chunk)
+    monkeypatch.setattr(runner, 'get_action', lambda name: action)
+    job = run_job(claim_job())
+
+    # NOTE: The failed chunk is rolled back, the previous ones are kept.
+    assert job.status == JobStatus.FAILED
+    assert 'Chunk failed.' in job.error
+    assert AdminJob.objects.get(pk=job.pk).processed == 2
@@ -1,31 +1,95 @@
-from django.contrib import admin, messages
+from typing import override
+
+from django.contrib import admin
+from django.urls import reverse
+from django.utils import timezone
 from django.utils.html import format_html
 
-from .models import Shop, ShopFollower
+from core.admin import (
+    EstimatedCountPaginator,
+    ExactSearchMixin,
+    PaginatedTabularInline,
+    SignedURLMixin
+)
+from jobs.actions import chunked_action
+
+from .models import Product, ProductInventory, Shop, ShopFollower
+from .signals import shops_updated
+
+
+def _set_shops_active(queryset, is_active: bool) -> int:
+    """
+    Activate or deactivate the shops of a chunk with a single `UPDATE`,
+    then batch their cache and autocomplete invalidations.
+    """
+    shops = list(
+        queryset
+        .filter(is_active=not is_active)
+        .select_for_update()
+    )
+    queryset.filter(pk__in=[shop.pk for shop in shops]).update(
+        is_active=is_active,
+        modified_at=timezone.now()
+    )
+    for shop in shops:
+        shop.is_active = is_active
+    shops_updated(shops)
+    return len(shops)
+
 
+@chunked_action(description='Approve selected shops', chunk_size=200)
+def approve_shops(queryset):
+    """
+    Admin action to approve selected shops.
 
-class ShopFollowerInline(admin.TabularInline):
+    NOTE: Shops are updated per chunk (unlike saving them one by one),
+    and their caches and autocomplete entries refreshed together.
+    """
+    return _set_shops_active(queryset, True)
+
+
+@chunked_action(description='Reject selected shops', chunk_size=200)
+def reject_shops(queryset):
+    """
+    Admin action to reject selected shops by deactivating them.
+    Optionally, you can prompt for reasons or handle document removal.
+    """
+    return _set_shops_active(queryset, False)
+
+
+class ShopFollowerInline(PaginatedTabularInline):
     """
     Inline admin interface for ShopFollower model within Shop admin.
+
+    NOTE: Followers are paginated, as popular shops have too many to
+    render at once. (see `ShopAdmin.view_followers` for the changelist)
     """
     model = ShopFollower
     fk_name = 'fk_shop'
     extra = 0  # No extra blank forms
+    fields = (
+        'fk_user_display',
+        'date_followed'
+    )
     readonly_fields = (
-        'fk_user',
+        'fk_user_display',
         'date_followed'
     )
     can_delete = True  # Allow deletion of followers
     verbose_name = 'Follower'
     verbose_name_plural = 'Followers'
-    search_fields = (
-        'fk_user__email',
-        'fk_user__display_name'
-    )
-    list_display = (
-        'fk_user_display',
-        'date_followed'
-    )
+
+    per_page = 25  # Number of followers to display per page
+    page_param = 'followers_page'
+
+    @override
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('fk_user')
+
+    @override
+    def get_total_count(self, obj: Shop):
+        # NOTE: Denormalized, to skip counting the followers.
+        return obj.follower_count
 
     @admin.display(description='User')
     def fk_user_display(self, obj: ShopFollower):
@@ -36,7 +100,7 @@ class ShopFollowerInline(admin.TabularInline):
 
 
 @admin.register(Shop)
-class ShopAdmin(admin.ModelAdmin):
+class ShopAdmin(ExactSearchMixin, SignedURLMixin, admin.ModelAdmin):
     """
     Custom admin configuration for the `Shop` model.
     """
@@ -58,15 +122,20 @@ class ShopAdmin(admin.ModelAdmin):
     )
 
     search_fields = (
-        'shop_id',
-        'user__username',
+        'shop_name',
+        'user__email',
         'user__display_name',
         'description'
     )
 
+    # NOTE: IDs and emails are matched exactly. (see `ExactSearchMixin`)
+    search_uuid_field = 'shop_id'
+    search_email_field = 'user__email'
+
     readonly_fields = (
         'shop_id',
         'follower_count',
+        'view_followers',
         'created_at',
         'modified_at',
         'verification_status'
@@ -86,7 +155,8 @@ class ShopAdmin(admin.ModelAdmin):
                     'shop_id',
                     'shop_name',
                     'description',
-                    'follower_count'
+                    'follower_count',
+                    'view_followers'
                 )
             }
         ),
@@ -117,9 +187,18 @@ class ShopAdmin(admin.ModelAdmin):
 
     list_per_page = 25  # Number of shops to display per page
 
+    # NOTE: Keep the number of queries per page constant.
+    list_select_related = ('user',)
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+    # File URLs signed in one batch per page.
+    signed_url_fields = ('legal_id', 'verification_document')
+
+    # NOTE: Run in the background, in chunks. (see `jobs.actions`)
     actions = [
-        'approve_shops',
-        'reject_shops'
+        approve_shops,
+        reject_shops
     ]
 
     @admin.display(description='Shop Description')
@@ -140,6 +219,19 @@ class ShopAdmin(admin.ModelAdmin):
         """
         return f'{obj.user.display_name} ({obj.user.email})'
 
+    @admin.display(description='Followers')
+    def view_followers(self, obj: Shop):
+        """
+        Provide a link to the followers of the shop, on their changelist.
+        """
+        if obj.pk is None:
+            return '-'
+        return format_html(
+            '<a href="{}?fk_shop={}">View all followers</a>',
+            reverse('admin:shop_shopfollower_changelist'),
+            obj.shop_id
+        )
+
     @admin.display(description='Verification Status', ordering='is_active')
     def verification_status(self, obj: Shop):
         """
@@ -160,7 +252,7 @@ class ShopAdmin(admin.ModelAdmin):
         Provide a link to view the uploaded legal ID.
         """
         if obj.legal_id:
-            legal_id_url = obj.legal_id.url
+            legal_id_url = self.signed_url(obj, 'legal_id')
             return format_html(
                 '<a href="{}" target="_blank">View ID</a>',
                 legal_id_url
@@ -173,43 +265,18 @@ class ShopAdmin(admin.ModelAdmin):
         Provide links to view the uploaded verification documents.
         """
         if obj.verification_document:
-            verification_doc_url = obj.verification_document.url
+            verification_doc_url = self.signed_url(
+                obj, 'verification_document'
+            )
             return format_html(
                 '<a href="{}" target="_blank">View Document</a>',
                 verification_doc_url
             )
         return format_html('<span style="color: red;">No Document</span>')
 
-    @admin.action(description='Approve selected shops')
-    def approve_shops(self, request, queryset):
-        """
-        Admin action to approve selected shops.
-        """
-        updated = queryset.filter(is_active=False).update(
-            is_active=True
-        )
-        self.message_user(
-            request,
-            f'{updated} shop(s) successfully approved.',
-            messages.SUCCESS
-        )
-
-    @admin.action(description='Reject selected shops')
-    def reject_shops(self, request, queryset):
-        """
-        Admin action to reject selected shops by deactivating them.
-        Optionally, you can prompt for reasons or handle document removal.
-        """
-        updated = queryset.filter(is_active=True).update(is_active=False)
-        self.message_user(
-            request,
-            f'{updated} shop(s) successfully rejected/deactivated.',
-            messages.WARNING
-        )
-
 
 @admin.register(ShopFollower)
-class ShopFollowerAdmin(admin.ModelAdmin):
+class ShopFollowerAdmin(ExactSearchMixin, admin.ModelAdmin):
     """
     Custom admin configuration for the `ShopFollower` model.
     """
@@ -226,10 +293,13 @@ class ShopFollowerAdmin(admin.ModelAdmin):
     search_fields = (
         'fk_user__email',
         'fk_user__display_name',
-        'fk_shop__shop_id',
-        'fk_shop__name'
+        'fk_shop__shop_name'
     )
 
+    # NOTE: IDs and emails are matched exactly. (see `ExactSearchMixin`)
+    search_uuid_field = 'fk_shop__shop_id'
+    search_email_field = 'fk_user__email'
+
     readonly_fields = (
         'date_followed',
     )
@@ -238,6 +308,11 @@ class ShopFollowerAdmin(admin.ModelAdmin):
 
     list_per_page = 25
 
+    # NOTE: Keep the number of queries per page constant.
+    list_select_related = ('fk_user', 'fk_shop')
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
     @admin.display(description='Shop Following Status')
     def following_status(self, obj: ShopFollower):
         """
@@ -247,3 +322,94 @@ class ShopFollowerAdmin(admin.ModelAdmin):
         return (
             f'{obj.fk_user.display_name} followed {obj.fk_shop.shop_name}'
         )
+
+
+class ProductInventoryInline(admin.StackedInline):
+    """
+    Inline admin interface for ProductInventory model within Product admin.
+    """
+    model = ProductInventory
+    can_delete = False
+    readonly_fields = (
+        'last_updated',
+        'total_units_sold',
+        'total_revenue'
+    )
+
+
+@admin.register(Product)
+class ProductAdmin(SignedURLMixin, admin.ModelAdmin):
+    """
+    Custom admin configuration for the `Product` model.
+    """
+    list_display = (
+        'sku',
+        'name',
+        'product_type',
+        'price',
+        'listed_by',
+        'stock',
+        'view_image',
+        'is_listed',
+        'created_at'
+    )
+
+    list_filter = (
+        'product_type',
+        'is_listed',
+        'created_at'
+    )
+
+    search_fields = (
+        'sku',
+        'name'
+    )
+
+    readonly_fields = (
+        'created_at',
+        'updated_at'
+    )
+
+    # NOTE: Avoid rendering every shop as a select option.
+    raw_id_fields = ('fk_shop',)
+
+    inlines = [ProductInventoryInline]
+
+    list_per_page = 25
+
+    # NOTE: Keep the number of queries per page constant.
+    list_select_related = ('fk_shop', 'inventory')
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+    # File URLs signed in one batch per page.
+    signed_url_fields = ('img',)
+
+    @admin.display(description='Shop', ordering='fk_shop__shop_name')
+    def listed_by(self, obj: Product):
+        """
+        Display the name of the shop that lists the product.
+        """
+        return obj.fk_shop.shop_name
+
+    @admin.display(description='Stock', ordering='inventory__qty')
+    def stock(self, obj: Product):
+        """
+        Display the stock quantity of the product, if tracked.
+        """
+        try:
+            return obj.inventory.qty
+        except ProductInventory.DoesNotExist:
+            return '-'
+
+    @admin.display(description='Image')
+    def view_image(self, obj: Product):
+        """
+        Provide a link to view the product's image.
+        """
+        if obj.img:
+            return format_html(
+                '<a href="{}" target="_blank">View Image</a>',
+                self.signed_url(obj, 'img')
+            )
+        return '-'
@@ -0,0 +1,116 @@
+from django.db.models import Q
+from ninja import Query, Router
+from ninja.decorators import decorate_view
+
+from core.cache.response import versioned_cache
+from core.renderers import SchemaSerializer, values_fields
+from core.schemas.error import Http422Message
+
+from ..models.product import Product
+from ..models.utils import PriceBucket, ProductType
+from ..resources.facets import get_facet_counts
+from ..resources.scopes import shop_catalog_scope
+from .schemas import CatalogFilterSchema, CatalogSchemaOut, ProductSchemaOut
+
+# Define the products API route.
+router = Router(tags=['products'])
+
+# Number of products per catalog page.
+CATALOG_PAGE_SIZE = 24
+
+# Precompiled serializer of the catalog page's response.
+catalog_serializer = SchemaSerializer(CatalogSchemaOut)
+
+
+def _filter_catalog(filters: CatalogFilterSchema):
+    """
+    Apply the catalog filters to the listed products' queryset.
+    """
+    queryset = Product.objects.filter(is_listed=True)
+
+    if filters.product_type is not None:
+        queryset = queryset.filter(product_type=filters.product_type)
+
+    if filters.price_bucket is not None:
+        lower, upper = PriceBucket(filters.price_bucket).bounds
+        queryset = queryset.filter(price__gte=lower)
+        if upper is not None:
+            queryset = queryset.filter(price__lt=upper)
+
+    if filters.in_stock is not None:
+        # NOTE: Mirrors the `ProductInventory.is_in_stock` property.
+        in_stock = (
+            Q(product_type=ProductType.DIGITAL) |
+            Q(product_type=ProductType.PHYSICAL, inventory__qty__gt=0)
+        )
+        queryset = queryset.filter(in_stock if filters.in_stock else ~in_stock)
+
+    if filters.shop_id is not None:
+        queryset = queryset.filter(fk_shop_id=filters.shop_id)
+
+    return queryset
+
+
+def _facet_value(value) -> str:
+    """
+    Format a facet value the same way it's passed as a query parameter.
+    """
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    return str(value)
+
+
+def _catalog_scopes(request) -> list[str] | None:
+    """
+    Get the cache scopes of a catalog page, or None if the shop ID is
+    invalid. (not cached)
+
+    NOTE: A page filtered by shop is only invalidated by that shop.
+    """
+    shop_id = request.GET.get('shop_id')
+    if not shop_id:
+        return ['catalog']
+    try:
+        return [shop_catalog_scope(shop_id)]
+    except ValueError:
+        return None
+
+
+@router.get(
+    '/',
+    response={
+        200: CatalogSchemaOut,
+        422: Http422Message
+    }
+)
+@decorate_view(versioned_cache(_catalog_scopes))
+def catalog(
+    request,
+    filters: Query[CatalogFilterSchema],
+    page: int = Query(1, ge=1)
+):
+    """
+    List a page of listed products along with the facet counts.
+    """
+    # NOTE: The count comes from the precomputed facets, not `COUNT(*)`.
+    count, facets = get_facet_counts(filters.model_dump())
+
+    # NOTE: Rows are serialized as is, without building model instances.
+    offset = (page - 1) * CATALOG_PAGE_SIZE
+    items = (
+        _filter_catalog(filters)
+        .values(*values_fields(ProductSchemaOut))
+        [offset:offset + CATALOG_PAGE_SIZE]
+    )
+
+    return catalog_serializer.response({
+        'count': count,
+        'items': items,
+        'facets': {
+            dim: [
+                {'value': _facet_value(value), 'count': value_count}
+                for value, value_count in counts.items()
+            ]
+            for dim, counts in facets.items()
+        }
+    })
@@ -0,0 +1,140 @@
+from datetime import datetime
+from decimal import Decimal
+from uuid import UUID
+
+from ninja import Field, Schema
+
+from ..models.utils import PriceBucket, ProductType
+
+
+class ShopSuggestionOut(Schema):
+    """
+    Schema for defining the response data for a shop suggestion.
+    """
+    shop_id: UUID = Field(
+        ...,
+        description='Unique identifier of the shop.'
+    )
+    shop_name: str = Field(
+        ...,
+        description='Name of the shop.',
+        examples=['Juan\'s Shop']
+    )
+    follower_count: int = Field(
+        ...,
+        description='Number of users following the shop.'
+    )
+
+
+class ShopSchemaOut(Schema):
+    """
+    Schema for defining the response data for shop representation.
+    """
+    shop_id: UUID = Field(
+        ...,
+        description='Unique identifier of the shop.'
+    )
+    shop_name: str = Field(
+        ...,
+        description='Name of the shop.',
+        examples=['Juan\'s Shop']
+    )
+    description: str | None = Field(
+        None,
+        description='A brief description of the shop.'
+    )
+    follower_count: int = Field(
+        ...,
+        description='Number of users following the shop.'
+    )
+    created_at: datetime = Field(
+        ...,
+        description='Time of creation for the shop.'
+    )
+
+
+class CatalogFilterSchema(Schema):
+    """
+    Schema for validating the catalog's filter query parameters.
+    """
+    product_type: ProductType | None = Field(
+        None,
+        description='Type of the product.'
+    )
+    price_bucket: PriceBucket | None = Field(
+        None,
+        description='Price range of the product.'
+    )
+    in_stock: bool | None = Field(
+        None,
+        description='Whether the product is in stock.'
+    )
+    shop_id: UUID | None = Field(
+        None,
+        description='Shop that lists the product.'
+    )
+
+
+class ProductSchemaOut(Schema):
+    """
+    Schema for defining the response data for a catalog product.
+    """
+    sku: str = Field(
+        ...,
+        description='Stock Keeping Unit (SKU) of the product.',
+        examples=['XYZSHOP-PHY-000001']
+    )
+    name: str = Field(
+        ...,
+        description='Name of the product.'
+    )
+    product_type: ProductType = Field(
+        ...,
+        description='Type of the product.',
+        examples=ProductType.values
+    )
+    price: Decimal = Field(
+        ...,
+        description='Price of the product. (in PHP)'
+    )
+    shop_id: UUID = Field(
+        ...,
+        alias='fk_shop_id',
+        description='Shop that lists the product.'
+    )
+    created_at: datetime = Field(
+        ...,
+        description='Time of creation for the product.'
+    )
+
+
+class FacetCountOut(Schema):
+    """
+    Schema for defining a single facet value and its product count.
+    """
+    value: str = Field(
+        ...,
+        description='Value of the filter.'
+    )
+    count: int = Field(
+        ...,
+        description='Number of products matching the value.'
+    )
+
+
+class CatalogSchemaOut(Schema):
+    """
+    Schema for defining the response data for a catalog page.
+    """
+    count: int = Field(
+        ...,
+        description='Number of products matching the filters.'
+    )
+    items: list[ProductSchemaOut] = Field(
+        ...,
+        description='Products of the requested page.'
+    )
+    facets: dict[str, list[FacetCountOut]] = Field(
+        ...,
+        description='Product counts per value of each filter.'
+    )
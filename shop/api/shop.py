@@ -0,0 +1,66 @@
+from uuid import UUID
+
+from django.shortcuts import get_object_or_404
+from ninja import Query, Router
+from ninja.decorators import decorate_view
+
+from core.cache.response import versioned_cache
+from core.renderers import SchemaSerializer
+from core.schemas.error import Http404Message, Http422Message
+
+from ..models import Shop
+from ..resources.autocomplete import MAX_SUGGESTIONS, autocomplete_shops
+from ..resources.scopes import shop_scope
+from .schemas import ShopSchemaOut, ShopSuggestionOut
+
+# Define the shops API route.
+router = Router(tags=['shops'])
+
+# Precompiled serializer of the shop suggestions.
+suggestions_serializer = SchemaSerializer(ShopSuggestionOut, many=True)
+
+
+@router.get(
+    '/autocomplete',
+    response={
+        200: list[ShopSuggestionOut],
+        422: Http422Message
+    }
+)
+def autocomplete(
+    request,
+    q: str = Query(..., min_length=1, max_length=50),
+    limit: int = Query(10, ge=1, le=MAX_SUGGESTIONS)
+):
+    """
+    Suggest active shops whose name starts with the query string.
+
+    NOTE: Not response-cached, as the in-memory index serves it faster
+    than the shared cache would, and follows keep changing the ranking.
+    """
+    return suggestions_serializer.response(autocomplete_shops(q, limit))
+
+
+def _shop_scopes(request, shop_id: str) -> list[str] | None:
+    """
+    Get the cache scopes of a shop, or None if the shop ID is invalid.
+    """
+    try:
+        return [shop_scope(shop_id)]
+    except ValueError:
+        return None
+
+
+@router.get(
+    '/{shop_id}',
+    response={
+        200: ShopSchemaOut,
+        404: Http404Message
+    }
+)
+@decorate_view(versioned_cache(_shop_scopes))
+def get_shop(request, shop_id: UUID):
+    """
+    Retrieve an active shop by its shop ID.
+    """
+    return get_object_or_404(Shop, shop_id=shop_id, is_active=True)
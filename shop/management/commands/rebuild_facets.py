@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+
+from shop.resources.facets import rebuild_facets
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the catalog facet counts in a single pass over products.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=5000,
+            help='Number of rows fetched / inserted per batch.'
+        )
+
+    def handle(self, *args, **options):
+        written = rebuild_facets(chunk_size=options['chunk_size'])
+        self.stdout.write(
+            self.style.SUCCESS(f'Rebuilt {written} product facet(s).')
+        )
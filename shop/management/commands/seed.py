@@ -0,0 +1,78 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from shop.resources.seed import seed_data
+
+
+class Command(BaseCommand):
+    help = (
+        'Generate synthetic users, shops, products and followers for load '
+        'tests and benchmarks, with a Zipf distribution of the followers.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--users',
+            type=int,
+            default=10_000,
+            help='Number of users.'
+        )
+        parser.add_argument(
+            '--shops',
+            type=int,
+            default=1_000,
+            help='Number of shops, each owned by a different user.'
+        )
+        parser.add_argument(
+            '--products',
+            type=int,
+            default=50_000,
+            help='Number of products.'
+        )
+        parser.add_argument(
+            '--followers',
+            type=int,
+            default=100_000,
+            help='Number of follower edges.'
+        )
+        parser.add_argument(
+            '--seed',
+            type=int,
+            default=0,
+            help='Seed of the random generator, unique per dataset.'
+        )
+        parser.add_argument(
+            '--skew',
+            type=float,
+            default=1.1,
+            help='Exponent of the Zipf distribution of the followers.'
+        )
+        parser.add_argument(
+            '--password',
+            default=None,
+            help='Password of the seeded users. (default: unusable)'
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=10_000,
+            help='Number of rows per insert, when not on PostgreSQL.'
+        )
+
+    def handle(self, *args, **options):
+        try:
+            counts = seed_data(
+                users=options['users'],
+                shops=options['shops'],
+                products=options['products'],
+                followers=options['followers'],
+                seed=options['seed'],
+                skew=options['skew'],
+                password=options['password'],
+                chunk_size=options['chunk_size']
+            )
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        for model, count in counts.items():
+            self.stdout.write(f'{model}: {count} row(s)')
+        self.stdout.write(self.style.SUCCESS('Seeded the database.'))
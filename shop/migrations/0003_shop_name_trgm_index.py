@@ -0,0 +1,27 @@
+from django.db import migrations
+
+from core.db.operations import RunPostgresSQL
+
+
+class Migration(migrations.Migration):
+
+    # NOTE: Indexes are built concurrently to avoid locking the table.
+    atomic = False
+
+    dependencies = [
+        ('shop', '0002_initial'),
+    ]
+
+    operations = [
+        RunPostgresSQL(
+            sql='CREATE EXTENSION IF NOT EXISTS pg_trgm;',
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        RunPostgresSQL(
+            sql=(
+                'CREATE INDEX CONCURRENTLY IF NOT EXISTS shop_name_trgm_idx '
+                'ON shop_shop USING gin (UPPER(shop_name) gin_trgm_ops);'
+            ),
+            reverse_sql='DROP INDEX CONCURRENTLY IF EXISTS shop_name_trgm_idx;',
+        ),
+    ]
@@ -0,0 +1,71 @@
+# Generated by Django 5.1 on 2026-10-18 23:06
+
+import django.db.models.deletion
+import shop.models.product
+from decimal import Decimal
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('shop', '0003_shop_name_trgm_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Product',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('sku', models.CharField(blank=True, help_text='Unique Stock Keeping Unit (SKU) for product identification.', max_length=50, unique=True)),
+                ('product_type', models.CharField(choices=[('DIG', 'Digital'), ('PHY', 'Physical')], default='DIG', max_length=10)),
+                ('name', models.CharField(help_text='The name of the product.', max_length=255, verbose_name='Name')),
+                ('description', models.TextField(blank=True, help_text='The description of the product.', null=True, verbose_name='Description')),
+                ('img', models.ImageField(blank=True, default=None, help_text='The image of the product.', null=True, upload_to=shop.models.product.product_img_upload_to, verbose_name='Image')),
+                ('price', models.DecimalField(decimal_places=2, default=Decimal('0.00'), help_text='The price of the product. Defaults to ₱0.00.', max_digits=10, verbose_name='Price')),
+                ('file', models.FileField(blank=True, default=None, null=True, upload_to=shop.models.product.product_file_upload_to)),
+                ('is_listed', models.BooleanField(default=True, help_text='Designates whether this product is listed or not.', verbose_name='Listed')),
+                ('created_at', models.DateTimeField(auto_now_add=True, help_text='The date and time when the product was created.', verbose_name='Created At')),
+                ('updated_at', models.DateTimeField(auto_now=True, help_text='The date and time when the product was last updated.', verbose_name='Updated At')),
+                ('fk_shop', models.ForeignKey(help_text='The shop that owns / lists the product.', on_delete=django.db.models.deletion.CASCADE, related_name='products', to='shop.shop', to_field='shop_id', verbose_name='Shop')),
+            ],
+            options={
+                'verbose_name': 'Product',
+                'verbose_name_plural': 'Products',
+                'ordering': ['-created_at', '-updated_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='ProductFacet',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(max_length=100, unique=True, verbose_name='Key')),
+                ('dims', models.PositiveSmallIntegerField(verbose_name='Dimensions')),
+                ('product_type', models.CharField(blank=True, choices=[('DIG', 'Digital'), ('PHY', 'Physical')], max_length=10, null=True)),
+                ('price_bucket', models.CharField(blank=True, choices=[('0-99', 'Under ₱100'), ('100-499', '₱100 - ₱499'), ('500-999', '₱500 - ₱999'), ('1000-4999', '₱1,000 - ₱4,999'), ('5000+', '₱5,000 & Above')], max_length=10, null=True)),
+                ('in_stock', models.BooleanField(blank=True, null=True)),
+                ('shop_id', models.UUIDField(blank=True, null=True, verbose_name='Shop ID')),
+                ('count', models.IntegerField(default=0, verbose_name='Product Count')),
+            ],
+            options={
+                'verbose_name': 'Product Facet',
+                'verbose_name_plural': 'Product Facets',
+                'indexes': [models.Index(fields=['dims', 'shop_id'], name='shop_facet_dims_shop_idx')],
+            },
+        ),
+        migrations.CreateModel(
+            name='ProductInventory',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('qty', models.PositiveIntegerField(default=0, help_text='The available quantity of the product in stock.', verbose_name='Stock Quantity')),
+                ('last_updated', models.DateTimeField(auto_now=True, verbose_name='Last Updated')),
+                ('total_units_sold', models.PositiveIntegerField(default=0, help_text='The total number of units the product has sold.', verbose_name='Total Units Sold')),
+                ('total_revenue', models.DecimalField(decimal_places=2, default=Decimal('0.00'), help_text='The total revenue generated from the product.', max_digits=10, verbose_name='Total Revenue')),
+                ('product', models.OneToOneField(help_text='The product whose stock is being tracked.', on_delete=django.db.models.deletion.CASCADE, related_name='inventory', to='shop.product', verbose_name='Product')),
+            ],
+            options={
+                'verbose_name': 'Product Inventory',
+                'verbose_name_plural': 'Product Inventories',
+            },
+        ),
+    ]
@@ -0,0 +1,32 @@
+from django.db import migrations
+
+from core.db.operations import RunPostgresSQL
+
+
+class Migration(migrations.Migration):
+
+    # NOTE: Indexes are built concurrently to avoid locking the table.
+    atomic = False
+
+    dependencies = [
+        ('shop', '0004_product_productinventory_productfacet'),
+    ]
+
+    # NOTE: The indexed expression matches the SQL of Django's `icontains`
+    # lookup. (e.g. `UPPER("description"::text) LIKE UPPER('%term%')`)
+    operations = [
+        RunPostgresSQL(
+            sql='CREATE EXTENSION IF NOT EXISTS pg_trgm;',
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        RunPostgresSQL(
+            sql=(
+                'CREATE INDEX CONCURRENTLY IF NOT EXISTS '
+                'shop_description_trgm_idx ON shop_shop '
+                'USING gin (UPPER(description::text) gin_trgm_ops);'
+            ),
+            reverse_sql=(
+                'DROP INDEX CONCURRENTLY IF EXISTS shop_description_trgm_idx;'
+            ),
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.1 on 2026-10-18 23:43
+
+from django.conf import settings
+from django.db import migrations, models
+
+from core.db.operations import AddIndexConcurrently
+
+
+class Migration(migrations.Migration):
+
+    # NOTE: Indexes are built concurrently to avoid locking the table.
+    atomic = False
+
+    dependencies = [
+        ('shop', '0005_shop_description_trgm_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='product',
+            index=models.Index(condition=models.Q(('is_listed', True)), fields=['-created_at', '-updated_at'], name='product_listed_recent_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='product',
+            index=models.Index(condition=models.Q(('is_listed', True)), fields=['fk_shop', '-created_at', '-updated_at'], name='product_shop_recent_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='shopfollower',
+            index=models.Index(fields=['fk_shop', '-date_followed'], name='follower_shop_recent_idx'),
+        ),
+    ]
@@ -1,3 +1,4 @@
 # flake8: noqa
-# TODO: Import product model(s) then migrate tables into DB.
+from shop.models.facet import *
+from shop.models.product import *
 from shop.models.shop import *
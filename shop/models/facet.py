@@ -0,0 +1,75 @@
+from typing import override
+
+from django.db import models
+
+from .utils import PriceBucket, ProductType
+
+__all__ = ['ProductFacet']
+
+
+class ProductFacet(models.Model):
+    """
+    Precomputed count of listed products for a combination of
+    catalog filter values.
+
+    Each listed product is counted once on every subset of its facet
+    dimensions (product type, price bucket, stock status and shop), so
+    the counts for any combination of selected filters is a lookup of
+    rows instead of a `COUNT ... GROUP BY` over the products table.
+
+    NOTE: Rows are maintained by the signals of `Product` and
+    `ProductInventory`, and can be rebuilt via `rebuild_facets`.
+    """
+    # Canonical key of the combination. (e.g. "pt=PHY|st=1")
+    key = models.CharField(
+        max_length=100,
+        unique=True,
+        verbose_name='Key'
+    )
+
+    # Bitmask of the dimensions set on this combination.
+    dims = models.PositiveSmallIntegerField(
+        verbose_name='Dimensions'
+    )
+
+    # Dimension values, null when not part of the combination.
+    product_type = models.CharField(
+        max_length=10,
+        choices=ProductType.choices,
+        null=True,
+        blank=True
+    )
+    price_bucket = models.CharField(
+        max_length=10,
+        choices=PriceBucket.choices,
+        null=True,
+        blank=True
+    )
+    in_stock = models.BooleanField(
+        null=True,
+        blank=True
+    )
+    shop_id = models.UUIDField(
+        null=True,
+        blank=True,
+        verbose_name='Shop ID'
+    )
+
+    count = models.IntegerField(
+        default=0,
+        verbose_name='Product Count'
+    )
+
+    @override
+    def __str__(self):
+        return f'{self.key or "*"} ({self.count})'
+
+    class Meta:
+        verbose_name = 'Product Facet'
+        verbose_name_plural = 'Product Facets'
+        indexes = [
+            models.Index(
+                fields=['dims', 'shop_id'],
+                name='shop_facet_dims_shop_idx'
+            ),
+        ]
@@ -6,7 +6,7 @@ from django.db import models
 
 from .utils import ProductType
 
-__all__ = ['Product']
+__all__ = ['Product', 'ProductInventory']
 
 
 def product_file_upload_to(instance: 'Product', filename: str):
@@ -171,6 +171,20 @@ class Product(models.Model):
         verbose_name = 'Product'
         verbose_name_plural = 'Products'
         ordering = ['-created_at', '-updated_at']
+        indexes = [
+            # NOTE: For the catalog pages. (listed products, newest first)
+            models.Index(
+                fields=['-created_at', '-updated_at'],
+                condition=models.Q(is_listed=True),
+                name='product_listed_recent_idx'
+            ),
+            # NOTE: For the catalog pages of a shop.
+            models.Index(
+                fields=['fk_shop', '-created_at', '-updated_at'],
+                condition=models.Q(is_listed=True),
+                name='product_shop_recent_idx'
+            ),
+        ]
 
 
 class ProductInventory(models.Model):
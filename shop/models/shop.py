@@ -7,6 +7,8 @@ from django.core.exceptions import ValidationError
 from django.core.validators import FileExtensionValidator
 from django.db import models
 
+from core.cache.accessor import CachedAccessor
+
 __all__ = ['Shop', 'ShopFollower']
 
 
@@ -45,6 +47,9 @@ class Shop(models.Model):
 
     TODO: Add field(s) for social links (e.g. "X", "Facebook", etc.)
     """
+    # Read-through cache accessor. (e.g. `Shop.cached.get(shop_id=...)`)
+    cached = CachedAccessor(lookups=('shop_id',))
+
     # Client Owner of the Shop
     user = models.OneToOneField(
         settings.AUTH_USER_MODEL,
@@ -223,3 +228,10 @@ class ShopFollower(models.Model):
     class Meta:
         ordering = ['-date_followed']
         unique_together = ('fk_user', 'fk_shop')
+        indexes = [
+            # NOTE: For the followers of a shop, newest first.
+            models.Index(
+                fields=['fk_shop', '-date_followed'],
+                name='follower_shop_recent_idx'
+            ),
+        ]
@@ -1,3 +1,5 @@
+from decimal import Decimal
+
 from django.db.models import TextChoices
 from django.utils.translation import gettext_lazy as _
 
@@ -8,3 +10,36 @@ class ProductType(TextChoices):
     """
     DIGITAL = 'DIG', _('Digital')
     PHYSICAL = 'PHY', _('Physical')
+
+
+class PriceBucket(TextChoices):
+    """
+    Price range choice(s) for filtering products. (in PHP)
+    """
+    UNDER_100 = '0-99', _('Under ₱100')
+    FROM_100 = '100-499', _('₱100 - ₱499')
+    FROM_500 = '500-999', _('₱500 - ₱999')
+    FROM_1000 = '1000-4999', _('₱1,000 - ₱4,999')
+    FROM_5000 = '5000+', _('₱5,000 & Above')
+
+    @property
+    def bounds(self) -> tuple[Decimal, Decimal | None]:
+        """
+        The price range of the bucket as `(lower, upper)` where the
+        lower bound is inclusive and the upper bound is exclusive.
+        """
+        lower, _, upper = self.value.rstrip('+').partition('-')
+        return (
+            Decimal(lower),
+            Decimal(upper) + 1 if upper else None
+        )
+
+    @classmethod
+    def for_price(cls, price: Decimal) -> 'PriceBucket':
+        """
+        Get the bucket that the given price falls into.
+        """
+        for bucket in reversed(cls):
+            if price >= bucket.bounds[0]:
+                return bucket
+        return cls.UNDER_100
@@ -0,0 +1,5 @@
+# flake8: noqa
+from shop.resources.autocomplete import *
+from shop.resources.facets import *
+from shop.resources.seed import *
+from shop.resources.scopes import *
@@ -0,0 +1,385 @@
+import heapq
+import re
+import threading
+import time
+import unicodedata
+import uuid
+from bisect import bisect_left, insort
+from collections import OrderedDict
+from typing import NamedTuple
+
+from django.conf import settings
+from django.db.models.functions import Upper
+from loguru import logger
+
+__all__ = [
+    'ShopSuggestion',
+    'ShopNameIndex',
+    'shop_name_index',
+    'normalize_shop_name',
+    'autocomplete_shops'
+]
+
+# Maximum number of suggestions returned (and memoized) per prefix.
+MAX_SUGGESTIONS = 20
+
+# Maximum number of memoized prefixes, the least recently used are evicted.
+# NOTE: Bounds the memory, as the prefixes are typed by the clients.
+MAX_MEMOIZED_PREFIXES = 4096
+
+# Highest code point, used as the upper bound of a prefix range.
+_PREFIX_UPPER_BOUND = '\U0010ffff'
+
+
+class ShopSuggestion(NamedTuple):
+    """
+    Compact entry of a shop kept inside the autocomplete index.
+    """
+    shop_id: uuid.UUID
+    shop_name: str
+    follower_count: int
+
+
+def normalize_shop_name(value: str) -> str:
+    """
+    Normalize a shop name (or a search prefix) for matching.
+
+    This case-folds the value, strips accents and collapses
+    whitespaces. (e.g. "  Café  Manila " -> "cafe manila")
+
+    Args:
+        value (str): The shop name or search prefix to normalize.
+
+    Returns:
+        str: The normalized value.
+    """
+    decomposed = unicodedata.normalize('NFKD', value.casefold())
+    stripped = ''.join(
+        c for c in decomposed if not unicodedata.combining(c)
+    )
+    return ' '.join(stripped.split())
+
+
+class ShopNameIndex:
+    """
+    In-memory prefix index of active shop names ranked by followers.
+
+    The index is a sorted array of `(normalized_name, pk)` keys, so a
+    prefix lookup is two binary searches followed by a top-k selection
+    on the matched range. Results are memoized per prefix, and only
+    the prefixes of a changed shop name are patched on updates.
+
+    NOTE: Each process keeps its own index. Updates are applied through
+    the `Shop` signals of the process that saved the shop, while other
+    processes catch up on their next periodic rebuild.
+    """
+
+    def __init__(self):
+        self._keys: list[tuple[str, int]] = []
+        self._entries: dict[int, tuple[str, ShopSuggestion]] = {}
+        self._memo: OrderedDict[str, list[ShopSuggestion]] = OrderedDict()
+        self._lock = threading.RLock()
+        self._ready = threading.Event()
+
+        # Build state; updates received mid-build are replayed after.
+        self._building = False
+        self._pending: dict[int, ShopSuggestion | None] = {}
+        self.built_at: float | None = None
+
+    @property
+    def is_ready(self) -> bool:
+        """Whether the index has been built at least once."""
+        return self.built_at is not None
+
+    @property
+    def is_stale(self) -> bool:
+        """Whether the index is older than the configured max age."""
+        max_age = getattr(settings, 'SHOP_AUTOCOMPLETE_MAX_AGE', 300)
+        return (
+            self.built_at is None or
+            time.monotonic() - self.built_at > max_age
+        )
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def build(self) -> None:
+        """
+        (Re)build the whole index from the database in a single query.
+        """
+        from ..models import Shop
+
+        with self._lock:
+            if self._building:
+                return  # another thread is already building
+            self._building = True
+            self._pending = {}
+
+        try:
+            rows = (
+                Shop.objects
+                .filter(is_active=True)
+                .values_list('pk', 'shop_id', 'shop_name', 'follower_count')
+                .iterator(chunk_size=5000)
+            )
+            entries = {}
+            for pk, shop_id, shop_name, follower_count in rows:
+                entries[pk] = (
+                    normalize_shop_name(shop_name),
+                    ShopSuggestion(shop_id, shop_name, follower_count)
+                )
+            keys = sorted((key, pk) for pk, (key, _) in entries.items())
+
+            with self._lock:
+                self._keys, self._entries = keys, entries
+                self._memo = OrderedDict()
+                for pk, entry in self._pending.items():
+                    self._apply(pk, entry)
+                self.built_at = time.monotonic()
+                self._ready.set()
+
+            # Warm up the widest (single character) prefixes.
+            for initial in {key[0] for key, _ in keys}:
+                self.lookup(initial)
+
+            logger.info(f'Built shop autocomplete index ({len(keys)} shops).')
+
+        finally:
+            with self._lock:
+                self._building = False
+                self._pending = {}
+
+    def build_in_background(self) -> None:
+        """
+        Build the index on a daemon thread, if not yet building.
+        """
+        if self._building:
+            return
+        threading.Thread(
+            target=self._safe_build,
+            name='shop-autocomplete-build',
+            daemon=True
+        ).start()
+
+    def _safe_build(self) -> None:
+        from django.db import connection
+
+        try:
+            self.build()
+        except Exception as e:
+            logger.error(f'Error building shop autocomplete index: {e}')
+        finally:
+            connection.close()  # the thread owns its own DB connection
+
+    def update(self, pk: int, entry: ShopSuggestion | None) -> None:
+        """
+        Insert, replace or remove (when `entry` is None) a single shop.
+
+        Args:
+            pk (int): The primary key of the shop.
+            entry (ShopSuggestion | None): The shop's current entry,
+                or None if the shop should no longer be suggested.
+        """
+        with self._lock:
+            if self._building:
+                self._pending[pk] = entry
+            if self.is_ready:
+                self._apply(pk, entry)
+
+    def _apply(self, pk: int, entry: ShopSuggestion | None) -> None:
+        # Remove the previous key of the shop, if indexed.
+        old_key, old_entry = '', None
+        previous = self._entries.pop(pk, None)
+        if previous is not None:
+            old_key, old_entry = previous
+            i = bisect_left(self._keys, (old_key, pk))
+            if i < len(self._keys) and self._keys[i] == (old_key, pk):
+                del self._keys[i]
+
+        # Insert the new key of the shop.
+        new_key = ''
+        if entry is not None:
+            new_key = normalize_shop_name(entry.shop_name)
+            self._entries[pk] = (new_key, entry)
+            insort(self._keys, (new_key, pk))
+
+        # Nothing to patch when an unindexed shop is removed.
+        if entry is None and old_entry is None:
+            return
+        shop_id = (entry or old_entry).shop_id
+        self._patch_memo(old_key, new_key, shop_id, entry)
+
+    def _patch_memo(
+        self,
+        old_key: str,
+        new_key: str,
+        shop_id: uuid.UUID,
+        entry: ShopSuggestion | None
+    ) -> None:
+        """
+        Patch the memoized results of the prefixes of a changed shop
+        in place, evicting a prefix only when its top results can no
+        longer be derived from the memoized ones.
+        """
+        new_prefixes = {new_key[:i] for i in range(1, len(new_key) + 1)}
+        old_prefixes = {old_key[:i] for i in range(1, len(old_key) + 1)}
+
+        for prefix in old_prefixes | new_prefixes:
+            results = self._memo.get(prefix)
+            if results is None:
+                continue
+
+            # NOTE: A full result list may hide lower-ranked matches.
+            is_full = len(results) >= MAX_SUGGESTIONS
+            kept = [e for e in results if e.shop_id != shop_id]
+            was_present = len(kept) != len(results)
+
+            # The shop no longer matches this prefix.
+            if prefix not in new_prefixes:
+                if was_present and is_full:
+                    del self._memo[prefix]
+                elif was_present:
+                    self._memo[prefix] = kept
+                continue
+
+            # The shop still doesn't rank within the top results.
+            if (
+                not was_present and is_full and
+                entry.follower_count <= results[-1].follower_count
+            ):
+                continue
+
+            merged = sorted(
+                kept + [entry],
+                key=lambda e: e.follower_count,
+                reverse=True
+            )
+
+            # The shop dropped to the last rank, and a hidden match
+            # might now outrank it.
+            if was_present and is_full and merged[-1] is entry:
+                del self._memo[prefix]
+                continue
+
+            self._memo[prefix] = merged[:MAX_SUGGESTIONS]
+
+    def lookup(self, prefix: str, limit: int = 10) -> list[ShopSuggestion]:
+        """
+        Get the most followed shops whose name starts with `prefix`.
+
+        Args:
+            prefix (str): The (un-normalized) prefix typed by the user.
+            limit (int): Maximum number of suggestions to return.
+
+        Returns:
+            list[ShopSuggestion]: Matching shops, most followed first.
+        """
+        key = normalize_shop_name(prefix)
+        if not key:
+            return []
+
+        limit = min(limit, MAX_SUGGESTIONS)
+        with self._lock:
+            results = self._memo.get(key)
+            if results is not None:
+                self._memo.move_to_end(key)
+            else:
+                lo = bisect_left(self._keys, (key,))
+                hi = bisect_left(self._keys, (key + _PREFIX_UPPER_BOUND,))
+                matches = (
+                    self._entries[pk][1] for _, pk in self._keys[lo:hi]
+                )
+                results = heapq.nlargest(
+                    MAX_SUGGESTIONS,
+                    matches,
+                    key=lambda e: e.follower_count
+                )
+                self._memo[key] = results
+                if len(self._memo) > MAX_MEMOIZED_PREFIXES:
+                    self._memo.popitem(last=False)
+
+        return results[:limit]
+
+    def wait_until_ready(self, timeout: float) -> bool:
+        """
+        Wait for the index to be built, for up to `timeout` seconds.
+
+        Returns:
+            bool: Whether the index is ready.
+        """
+        return self._ready.wait(timeout)
+
+
+# Process-wide shop autocomplete index.
+shop_name_index = ShopNameIndex()
+
+
+def _fallback_queryset(key: str):
+    """
+    Get the active shops whose name may start with a normalized key,
+    most followed first.
+
+    NOTE: Filters on `UPPER(shop_name)`, the expression of the `pg_trgm`
+    index. (see `shop_name_trgm_idx`) Any run of whitespaces matches a
+    single space of the key.
+    """
+    from ..models import Shop
+
+    pattern = r'^\s*' + r'\s+'.join(
+        re.escape(word.upper()) for word in key.split(' ')
+    )
+    return (
+        Shop.objects
+        .annotate(upper_name=Upper('shop_name'))
+        .filter(is_active=True, upper_name__regex=pattern)
+        .order_by('-follower_count')
+        .values_list('shop_id', 'shop_name', 'follower_count')
+    )
+
+
+def autocomplete_shops(prefix: str, limit: int = 10) -> list[ShopSuggestion]:
+    """
+    Suggest active shops whose name starts with the given prefix.
+
+    Served from the in-memory index when built. On a cold start, the
+    index is built in the background, and the request waits for it up
+    to `SHOP_AUTOCOMPLETE_COLD_WAIT` seconds before falling back to a
+    database query. (backed by the `pg_trgm` index on the shop name)
+
+    NOTE: The fallback folds the case and whitespaces like the index,
+    but not the accents, so it may miss accented names until the index
+    is built. It never suggests a shop the index wouldn't.
+
+    Args:
+        prefix (str): The prefix typed by the user.
+        limit (int): Maximum number of suggestions to return.
+
+    Returns:
+        list[ShopSuggestion]: Matching shops, most followed first.
+    """
+    # Refresh the index in the background when it's missing or stale.
+    if shop_name_index.is_stale:
+        shop_name_index.build_in_background()
+
+    if not shop_name_index.is_ready:
+        shop_name_index.wait_until_ready(
+            getattr(settings, 'SHOP_AUTOCOMPLETE_COLD_WAIT', 1.0)
+        )
+    if shop_name_index.is_ready:
+        return shop_name_index.lookup(prefix, limit)
+
+    # Cold start, fallback to a database query.
+    key = normalize_shop_name(prefix)
+    if not key:
+        return []
+
+    # NOTE: Limited after filtering, as the query may match a few more
+    # names than the index would. (e.g. other case foldings)
+    limit = min(limit, MAX_SUGGESTIONS)
+    suggestions = []
+    for row in _fallback_queryset(key).iterator(chunk_size=limit):
+        if normalize_shop_name(row[1]).startswith(key):
+            suggestions.append(ShopSuggestion(*row))
+            if len(suggestions) == limit:
+                break
+    return suggestions
@@ -0,0 +1,256 @@
+from collections import Counter
+from decimal import Decimal
+from itertools import combinations
+from typing import NamedTuple
+from uuid import UUID
+
+from django.db import transaction
+from django.db.models import Case, F, Q, Value, When
+from loguru import logger
+
+from ..models.facet import ProductFacet
+from ..models.utils import PriceBucket, ProductType
+
+__all__ = [
+    'FACET_DIMENSIONS',
+    'FacetState',
+    'product_facet_state',
+    'apply_facet_change',
+    'rebuild_facets',
+    'get_facet_counts'
+]
+
+# Facet dimensions, in the order used by the facet keys.
+FACET_DIMENSIONS = ('product_type', 'price_bucket', 'in_stock', 'shop_id')
+
+# Short names of the dimensions used on the facet keys.
+_KEY_NAMES = {
+    'product_type': 'pt',
+    'price_bucket': 'pb',
+    'in_stock': 'st',
+    'shop_id': 'sh'
+}
+
+
+class FacetState(NamedTuple):
+    """
+    Facet dimension values of a single listed product.
+    """
+    product_type: str
+    price_bucket: str
+    in_stock: bool
+    shop_id: UUID
+
+    @classmethod
+    def from_row(
+        cls,
+        product_type: str,
+        price: Decimal,
+        shop_id: UUID,
+        qty: int | None
+    ) -> 'FacetState':
+        """
+        Build the facet state from the raw product and inventory values.
+
+        NOTE: Mirrors `ProductInventory.is_in_stock`, where a physical
+        product without an inventory record is out of stock.
+        """
+        in_stock = (
+            product_type == ProductType.DIGITAL or
+            (product_type == ProductType.PHYSICAL and (qty or 0) > 0)
+        )
+        return cls(
+            product_type=str(product_type),
+            price_bucket=PriceBucket.for_price(price).value,
+            in_stock=in_stock,
+            shop_id=shop_id
+        )
+
+
+def _dims_mask(dims) -> int:
+    return sum(1 << FACET_DIMENSIONS.index(d) for d in dims)
+
+
+def _facet_key(values: dict) -> str:
+    parts = []
+    for dim in FACET_DIMENSIONS:
+        if dim in values:
+            value = values[dim]
+            if isinstance(value, bool):
+                value = int(value)
+            parts.append(f'{_KEY_NAMES[dim]}={value}')
+    return '|'.join(parts)
+
+
+def _facet(values: dict, count: int = 0) -> ProductFacet:
+    return ProductFacet(
+        key=_facet_key(values),
+        dims=_dims_mask(values),
+        count=count,
+        **values
+    )
+
+
+def _combinations(state: FacetState):
+    """
+    Yield every subset of the state's dimension values.
+    """
+    values = state._asdict()
+    for size in range(len(FACET_DIMENSIONS) + 1):
+        for dims in combinations(FACET_DIMENSIONS, size):
+            yield {d: values[d] for d in dims}
+
+
+def product_facet_state(product_id: int | None) -> FacetState | None:
+    """
+    Get the current facet state of a product from the database.
+
+    Args:
+        product_id (int | None): The primary key of the product.
+
+    Returns:
+        FacetState | None: The facet state, or None when the product
+            doesn't exist or isn't listed.
+    """
+    from ..models.product import Product
+
+    if product_id is None:
+        return None
+
+    row = (
+        Product.objects
+        .filter(pk=product_id, is_listed=True)
+        .values_list('product_type', 'price', 'fk_shop_id', 'inventory__qty')
+        .first()
+    )
+    return FacetState.from_row(*row) if row else None
+
+
+def apply_facet_change(
+    before: FacetState | None,
+    after: FacetState | None
+) -> None:
+    """
+    Incrementally update the facet counts of a changed product.
+
+    Only the combinations that differ between both states are touched,
+    using an upsert of missing rows and a single `UPDATE` query.
+
+    Args:
+        before (FacetState | None): The product's state before the change.
+        after (FacetState | None): The product's state after the change.
+    """
+    if before == after:
+        return
+
+    deltas = Counter()
+    for values in _combinations(before) if before else ():
+        deltas[_facet_key(values)] -= 1
+    for values in _combinations(after) if after else ():
+        deltas[_facet_key(values)] += 1
+
+    # Drop the combinations shared by both states.
+    deltas = {key: delta for key, delta in deltas.items() if delta}
+    if not deltas:
+        return
+
+    with transaction.atomic():
+
+        # Make sure the rows to be incremented exist.
+        if after:
+            ProductFacet.objects.bulk_create(
+                [
+                    _facet(values)
+                    for values in _combinations(after)
+                    if deltas.get(_facet_key(values), 0) > 0
+                ],
+                ignore_conflicts=True
+            )
+
+        ProductFacet.objects.filter(key__in=deltas).update(
+            count=F('count') + Case(
+                *[When(key=key, then=Value(d)) for key, d in deltas.items()],
+                default=Value(0)
+            )
+        )
+
+
+def rebuild_facets(chunk_size: int = 5000) -> int:
+    """
+    Rebuild all facet counts in a single pass over the products table.
+
+    Args:
+        chunk_size (int): Number of rows fetched / inserted per batch.
+
+    Returns:
+        int: The number of facet rows written.
+    """
+    from ..models.product import Product
+
+    counts = Counter()
+    rows = (
+        Product.objects
+        .filter(is_listed=True)
+        .values_list('product_type', 'price', 'fk_shop_id', 'inventory__qty')
+        .order_by()
+        .iterator(chunk_size=chunk_size)
+    )
+    for row in rows:
+        for values in _combinations(FacetState.from_row(*row)):
+            counts[tuple(values.items())] += 1
+
+    facets = [_facet(dict(items), count) for items, count in counts.items()]
+
+    with transaction.atomic():
+        ProductFacet.objects.all().delete()
+        ProductFacet.objects.bulk_create(facets, batch_size=chunk_size)
+
+    logger.info(f'Rebuilt {len(facets)} product facet(s).')
+    return len(facets)
+
+
+def get_facet_counts(filters: dict) -> tuple[int, dict[str, dict]]:
+    """
+    Get the facet counts for the given selected filters.
+
+    For each dimension, the counts are computed with every *other*
+    selected filter applied, so a client can switch a filter's value
+    without losing the counts of its alternatives. All of it is read
+    in one indexed query.
+
+    Args:
+        filters (dict): Selected filter values keyed by dimension.
+
+    Returns:
+        tuple[int, dict[str, dict]]: The number of products matching
+            all filters, and the `{value: count}` map per dimension.
+    """
+    filters = {d: v for d, v in filters.items() if v is not None}
+
+    # The totals row, then one group of rows per dimension.
+    query = Q(dims=_dims_mask(filters), **filters)
+    for dim in FACET_DIMENSIONS:
+        others = {d: v for d, v in filters.items() if d != dim}
+        query |= Q(dims=_dims_mask([*others, dim]), **others)
+
+    total = 0
+    facets = {dim: {} for dim in FACET_DIMENSIONS}
+    rows = (
+        ProductFacet.objects
+        .filter(query, count__gt=0)
+        .values_list('dims', 'count', *FACET_DIMENSIONS)
+    )
+    total_mask = _dims_mask(filters)
+    for dims, count, *values in rows:
+        row = dict(zip(FACET_DIMENSIONS, values))
+        if dims == total_mask and all(row[d] == v for d, v in filters.items()):
+            total = count
+        for dim in FACET_DIMENSIONS:
+            others = {d: v for d, v in filters.items() if d != dim}
+            if (
+                dims == _dims_mask([*others, dim]) and
+                all(row[d] == v for d, v in others.items())
+            ):
+                facets[dim][row[dim]] = count
+
+    return total, facets
@@ -0,0 +1,31 @@
+from uuid import UUID
+
+__all__ = [
+    'shop_catalog_scope',
+    'shop_scope'
+]
+
+
+def _shop_id(shop_id: UUID | str) -> str:
+    """
+    Normalize a shop ID, so the scopes of the same shop always match.
+    (e.g. an uppercase or unhyphenated UUID from a query string)
+
+    Raises:
+        ValueError: If the shop ID isn't a valid UUID.
+    """
+    return str(shop_id if isinstance(shop_id, UUID) else UUID(shop_id))
+
+
+def shop_scope(shop_id: UUID | str) -> str:
+    """
+    Get the cache scope of a shop's own responses. (e.g. its details)
+    """
+    return f'shop:{_shop_id(shop_id)}'
+
+
+def shop_catalog_scope(shop_id: UUID | str) -> str:
+    """
+    Get the cache scope of the catalog pages filtered by a shop.
+    """
+    return f'catalog:{_shop_id(shop_id)}'
@@ -0,0 +1,323 @@
+import random
+import time
+import uuid
+from collections.abc import Iterable, Iterator
+from datetime import datetime, timedelta
+from decimal import Decimal
+from itertools import islice
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.management.color import no_style
+from django.db import connection, transaction
+from django.db.models import Max
+from django.utils import timezone
+from loguru import logger
+
+from core.cache.response import bump_version
+
+__all__ = ['seed_data']
+
+# Words of the generated display and shop names.
+FIRST_NAMES = (
+    'Andrea', 'Bea', 'Carlo', 'Dianne', 'Enzo', 'Faith', 'Gab', 'Hannah',
+    'Isko', 'Jasmine', 'Kiko', 'Lara', 'Migo', 'Nina', 'Paolo', 'Rica'
+)
+LAST_NAMES = (
+    'Aquino', 'Bautista', 'Cruz', 'Dela Cruz', 'Garcia', 'Mendoza',
+    'Ramos', 'Reyes', 'Santos', 'Tan', 'Torres', 'Villanueva'
+)
+SHOP_ADJECTIVES = (
+    'Golden', 'Island', 'Little', 'Manila', 'Modern', 'Rustic', 'Sunny',
+    'Tropical', 'Urban', 'Vintage'
+)
+SHOP_NOUNS = (
+    'Books', 'Crafts', 'Designs', 'Finds', 'Goods', 'Prints', 'Studio',
+    'Supply', 'Threads', 'Works'
+)
+PRODUCT_NOUNS = (
+    'Bag', 'Candle', 'Card', 'Ebook', 'Mug', 'Notebook', 'Poster', 'Shirt',
+    'Sticker', 'Template', 'Tote', 'Wallet'
+)
+
+# Share of the digital products, and of the physical ones out of stock.
+DIGITAL_RATIO = 0.3
+OUT_OF_STOCK_RATIO = 0.1
+
+# Time span of the generated timestamps, before the time of seeding.
+SPAN = timedelta(days=365)
+
+
+def _zipf_counts(total: int, n: int, skew: float, cap: int) -> list[int]:
+    """
+    Split a total over `n` ranks following Zipf's law, so the first ranks
+    get most of it. (e.g. a few mega-shops) Each count is capped.
+    """
+    weights = [1 / rank ** skew for rank in range(1, n + 1)]
+    scale = total / sum(weights)
+    return [min(cap, round(weight * scale)) for weight in weights]
+
+
+def _chunks(rows: Iterable, size: int) -> Iterator[list]:
+    iterator = iter(rows)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def _insert(
+    model,
+    columns: list[str],
+    rows: Iterable[tuple],
+    chunk_size: int
+) -> None:
+    """
+    Insert rows of raw column values into the model's table, with `COPY`
+    on PostgreSQL, or batched `INSERT`s otherwise.
+
+    NOTE: Skips the models' `save()`, signals and field defaults.
+    """
+    fields = [model._meta.get_field(name) for name in columns]
+    table = connection.ops.quote_name(model._meta.db_table)
+    names = ', '.join(connection.ops.quote_name(f.column) for f in fields)
+
+    with connection.cursor() as cursor:
+        if connection.vendor == 'postgresql':
+            with cursor.copy(f'COPY {table} ({names}) FROM STDIN') as copy:
+                for row in rows:
+                    copy.write_row(row)
+            return
+
+        placeholders = ', '.join(['%s'] * len(fields))
+        sql = f'INSERT INTO {table} ({names}) VALUES ({placeholders})'
+        for chunk in _chunks(rows, chunk_size):
+            cursor.executemany(sql, [
+                [
+                    field.get_db_prep_save(value, connection)
+                    for field, value in zip(fields, row)
+                ]
+                for row in chunk
+            ])
+
+
+def _next_pk(model) -> int:
+    return (model._base_manager.aggregate(pk=Max('pk'))['pk'] or 0) + 1
+
+
+def _timestamp(rng: random.Random, now: datetime) -> datetime:
+    return now - SPAN * rng.random()
+
+
+def seed_data(
+    users: int = 10_000,
+    shops: int = 1_000,
+    products: int = 50_000,
+    followers: int = 100_000,
+    seed: int = 0,
+    skew: float = 1.1,
+    password: str | None = None,
+    chunk_size: int = 10_000
+) -> dict[str, int]:
+    """
+    Generate a synthetic dataset of users, shops, products (with their
+    inventories) and follower edges, for load tests and benchmarks.
+
+    The follower edges and the products are split over the shops
+    following Zipf's law, so a few mega-shops get most of them. The rows
+    are inserted with `COPY` on PostgreSQL, with the primary keys, the
+    `uid`s and the SKUs allocated upfront, so rows reference each other
+    without reading anything back.
+
+    NOTE: The same `seed` generates the same dataset, except for the
+    `uid`s (time-based snowflakes) and the timestamps, which are spread
+    over the year before the time of seeding.
+
+    NOTE: Meant for empty or offline databases, as concurrent inserts of
+    users, shops or products would conflict with the allocated keys.
+
+    Args:
+        users (int): Number of users, of which the first `shops` own one.
+        shops (int): Number of shops.
+        products (int): Number of products.
+        followers (int): Number of follower edges, before the caps of
+            the mega-shops. (a shop can't have more followers than users)
+        seed (int): Seed of the random generator.
+        skew (float): Exponent of the Zipf distribution of the followers.
+            The products are split with half of it.
+        password (str | None): Password of every seeded user. Defaults to
+            None, for an unusable password.
+        chunk_size (int): Number of rows per `INSERT` when not on
+            PostgreSQL, and of `uid`s generated at once.
+
+    Returns:
+        dict[str, int]: The number of rows inserted per model.
+
+    Raises:
+        ValueError: If there are fewer users than shops, or the seed was
+            already used on the database.
+    """
+    from users.models.user import generate_uids
+
+    from ..models import Product, ProductInventory, Shop, ShopFollower
+    from ..models.utils import ProductType
+    from .facets import rebuild_facets
+
+    User = get_user_model()
+    if users < shops:
+        raise ValueError('Every shop needs an owner, seed more users.')
+
+    def email(index: int) -> str:
+        return f'seed{seed}.user{index}@example.com'
+
+    if User.objects.filter(email=email(0)).exists():
+        raise ValueError(f'The seed {seed} was already used, pick another.')
+
+    rng = random.Random(seed)
+    now = timezone.now()
+    counts = {}
+    started = time.perf_counter()
+
+    with transaction.atomic():
+        user_pk, shop_pk, product_pk = map(
+            _next_pk, (User, Shop, Product)
+        )
+
+        # Users, with a single password hash for all of them.
+        password_hash = make_password(password)
+
+        def user_rows():
+            for start in range(0, users, chunk_size):
+                uids = generate_uids(min(chunk_size, users - start))
+                for offset, uid in enumerate(uids):
+                    index = start + offset
+                    joined = _timestamp(rng, now)
+                    yield (
+                        user_pk + index, uid, email(index), password_hash,
+                        f'{rng.choice(FIRST_NAMES)} '
+                        f'{rng.choice(LAST_NAMES)}',
+                        False, False, True, False, '', '',
+                        joined, joined, joined
+                    )
+
+        _insert(User, [
+            'id', 'uid', 'email', 'password', 'display_name', 'is_superuser',
+            'is_staff', 'is_active', 'is_verified', 'first_name',
+            'last_name', 'date_joined', 'created_at', 'modified_at'
+        ], user_rows(), chunk_size)
+        counts['users'] = users
+
+        # Shops, ranked by popularity in a random order.
+        follower_counts = _zipf_counts(followers, shops, skew, users)
+        product_counts = _zipf_counts(products, shops, skew / 2, products)
+        ranks = list(range(shops))
+        rng.shuffle(ranks)
+
+        shop_ids = [
+            uuid.UUID(int=rng.getrandbits(128), version=4)
+            for _ in range(shops)
+        ]
+        shop_names = [
+            f'{rng.choice(SHOP_ADJECTIVES)} {rng.choice(SHOP_NOUNS)} {index}'
+            for index in range(shops)
+        ]
+
+        def shop_rows():
+            for index in range(shops):
+                created = _timestamp(rng, now)
+                yield (
+                    shop_pk + index, email(index), shop_ids[index],
+                    shop_names[index],
+                    f'Handpicked {rng.choice(PRODUCT_NOUNS).lower()}s '
+                    f'and more from {shop_names[index]}.',
+                    follower_counts[ranks[index]], None, None, True,
+                    created, created
+                )
+
+        _insert(Shop, [
+            'id', 'user', 'shop_id', 'shop_name', 'description',
+            'follower_count', 'legal_id', 'verification_document',
+            'is_active', 'created_at', 'modified_at'
+        ], shop_rows(), chunk_size)
+        counts['shops'] = shops
+
+        # Products, with the SKUs that `Product.save()` would generate.
+        product_types = []
+
+        def product_rows():
+            index = 0
+            for shop in range(shops):
+                prefix = shop_names[shop].replace(' ', '').upper()
+                for number in range(1, product_counts[ranks[shop]] + 1):
+                    product_type = (
+                        ProductType.DIGITAL
+                        if rng.random() < DIGITAL_RATIO
+                        else ProductType.PHYSICAL
+                    )
+                    product_types.append(product_type)
+                    created = _timestamp(rng, now)
+                    yield (
+                        product_pk + index, shop_ids[shop],
+                        f'{prefix}-{product_type.value}-{number:06}',
+                        product_type.value,
+                        f'{rng.choice(SHOP_ADJECTIVES)} '
+                        f'{rng.choice(PRODUCT_NOUNS)}',
+                        None, None, None,
+                        Decimal(rng.randrange(50, 500_000)) / 100,
+                        rng.random() > 0.05, created, created
+                    )
+                    index += 1
+
+        _insert(Product, [
+            'id', 'fk_shop', 'sku', 'product_type', 'name',
+            'description', 'img', 'file', 'price', 'is_listed',
+            'created_at', 'updated_at'
+        ], product_rows(), chunk_size)
+        counts['products'] = len(product_types)
+
+        # Inventories of the physical products.
+        def inventory_rows():
+            for index, product_type in enumerate(product_types):
+                if product_type != ProductType.PHYSICAL:
+                    continue
+                qty = (
+                    0 if rng.random() < OUT_OF_STOCK_RATIO
+                    else rng.randint(1, 200)
+                )
+                yield product_pk + index, qty, now, 0, Decimal(0)
+
+        counts['inventories'] = product_types.count(ProductType.PHYSICAL)
+        _insert(ProductInventory, [
+            'product', 'qty', 'last_updated', 'total_units_sold',
+            'total_revenue'
+        ], inventory_rows(), chunk_size)
+
+        # Follower edges, each shop followed by distinct users.
+        def follower_rows():
+            for shop in range(shops):
+                for user in rng.sample(
+                    range(users), follower_counts[ranks[shop]]
+                ):
+                    yield (
+                        user_pk + user, shop_ids[shop], _timestamp(rng, now)
+                    )
+
+        _insert(ShopFollower, [
+            'fk_user', 'fk_shop', 'date_followed'
+        ], follower_rows(), chunk_size)
+        counts['followers'] = sum(follower_counts)
+
+        # NOTE: The primary keys were set explicitly.
+        with connection.cursor() as cursor:
+            for sql in connection.ops.sequence_reset_sql(
+                no_style(), [User, Shop, Product]
+            ):
+                cursor.execute(sql)
+
+    logger.info(
+        f'Seeded {counts} in {time.perf_counter() - started:.1f}s, '
+        f'mega-shop followers: {sorted(follower_counts)[-3:][::-1]}'
+    )
+
+    # NOTE: The inserts skipped the signals that maintain these.
+    rebuild_facets(chunk_size=chunk_size)
+    bump_version('catalog')
+    return counts
@@ -1,7 +1,20 @@
-from django.db.models.signals import post_delete, post_save
+from django.db import transaction
+from django.db.models import QuerySet
+from django.db.models.signals import (
+    post_delete,
+    post_save,
+    pre_delete,
+    pre_save,
+)
 from django.dispatch import receiver
 
-from .models.shop import ShopFollower
+from core.cache.response import bump_version
+
+from .models.product import Product, ProductInventory
+from .models.shop import Shop, ShopFollower
+from .resources.autocomplete import ShopSuggestion, shop_name_index
+from .resources.facets import apply_facet_change, product_facet_state
+from .resources.scopes import shop_catalog_scope, shop_scope
 
 
 @receiver(post_save, sender=ShopFollower)
@@ -14,7 +27,7 @@ def increment_follower_count(
     """
     if created:
         instance.fk_shop.follower_count += 1
-        instance.fk_shop.save()
+        instance.fk_shop.save(update_fields=['follower_count', 'modified_at'])
 
 
 @receiver(post_delete, sender=ShopFollower)
@@ -26,4 +39,169 @@ def decrement_follower_count(
     upon creating a `ShopFollower` instance.
     """
     instance.fk_shop.follower_count -= 1
-    instance.fk_shop.save()
+    instance.fk_shop.save(update_fields=['follower_count', 'modified_at'])
+
+
+@receiver(post_save, sender=Shop)
+def update_shop_name_index(sender, instance: Shop, **kwargs):
+    """
+    Updates the shop's entry in the autocomplete index
+    once the saving transaction commits.
+    """
+    entry = None
+    if instance.is_active:
+        entry = ShopSuggestion(
+            instance.shop_id,
+            instance.shop_name,
+            instance.follower_count
+        )
+    transaction.on_commit(
+        lambda: shop_name_index.update(instance.pk, entry)
+    )
+
+
+def shops_updated(shops: list[Shop]) -> None:
+    """
+    Runs the `post_save` handlers of shops updated in bulk, with their
+    invalidations batched. (e.g. by `QuerySet.update()`)
+
+    NOTE: Unlike saving each shop, the cached shops are broadcast with a
+    single `NOTIFY`, and each version is bumped once.
+    """
+    Shop.cached.invalidate(*(shop.pk for shop in shops))
+
+    entries = {
+        shop.pk: ShopSuggestion(
+            shop.shop_id,
+            shop.shop_name,
+            shop.follower_count
+        ) if shop.is_active else None
+        for shop in shops
+    }
+    scopes = [shop_scope(shop.shop_id) for shop in shops]
+
+    def on_commit():
+        for pk, entry in entries.items():
+            shop_name_index.update(pk, entry)
+        bump_version(*scopes)
+
+    transaction.on_commit(on_commit)
+
+
+@receiver(post_delete, sender=Shop)
+def remove_from_shop_name_index(sender, instance: Shop, **kwargs):
+    """
+    Removes the deleted shop from the autocomplete index
+    once the deleting transaction commits.
+    """
+    pk = instance.pk
+    transaction.on_commit(lambda: shop_name_index.update(pk, None))
+
+
+@receiver(pre_save, sender=Product)
+@receiver(pre_delete, sender=Product)
+def capture_product_facet_state(sender, instance: Product, **kwargs):
+    """
+    Captures the product's facet state before it gets changed.
+    """
+    instance._facet_state = product_facet_state(instance.pk)
+
+
+@receiver(post_save, sender=Product)
+@receiver(post_delete, sender=Product)
+def update_product_facets(sender, instance: Product, **kwargs):
+    """
+    Updates the facet counts upon changing a `Product` instance.
+    """
+    apply_facet_change(
+        getattr(instance, '_facet_state', None),
+        product_facet_state(instance.pk)
+    )
+
+
+def _deleted_with_product(origin) -> bool:
+    """
+    Whether an inventory is deleted along with its product, by a cascade.
+    (e.g. deleting the product, or its shop)
+
+    NOTE: The product's own deletion accounts for its facets, from the
+    state captured before any row of the cascade got deleted.
+    """
+    if origin is None:
+        return False  # e.g. saved
+    model = origin.model if isinstance(origin, QuerySet) else type(origin)
+    return not issubclass(model, ProductInventory)
+
+
+@receiver(pre_save, sender=ProductInventory)
+@receiver(pre_delete, sender=ProductInventory)
+def capture_inventory_facet_state(
+    sender, instance: ProductInventory, origin=None, **kwargs
+):
+    """
+    Captures the inventory's product facet state before it gets changed.
+    """
+    if not _deleted_with_product(origin):
+        instance._facet_state = product_facet_state(instance.product_id)
+
+
+@receiver(post_save, sender=ProductInventory)
+@receiver(post_delete, sender=ProductInventory)
+def update_inventory_facets(
+    sender, instance: ProductInventory, origin=None, **kwargs
+):
+    """
+    Updates the facet counts upon changing a `ProductInventory`
+    instance, as it changes the product's stock status.
+    """
+    if _deleted_with_product(origin):
+        return
+    apply_facet_change(
+        getattr(instance, '_facet_state', None),
+        product_facet_state(instance.product_id)
+    )
+
+
+@receiver(post_save, sender=Shop)
+@receiver(post_delete, sender=Shop)
+def invalidate_shop_responses(sender, instance: Shop, **kwargs):
+    """
+    Invalidates the cached API responses of the shop, once the
+    transaction commits.
+
+    NOTE: The catalog shows no field of the shops, so a follow (which
+    saves the follower count) keeps it cached. Deleting a shop deletes
+    its products, which invalidate the catalog.
+    """
+    scope = shop_scope(instance.shop_id)
+    transaction.on_commit(lambda: bump_version(scope))
+
+
+@receiver(post_save, sender=Product)
+@receiver(post_delete, sender=Product)
+def invalidate_product_responses(sender, instance: Product, **kwargs):
+    """
+    Invalidates the cached catalog responses of the product's
+    shop, and of the whole catalog, once the transaction commits.
+    """
+    scope = shop_catalog_scope(instance.fk_shop_id)
+    transaction.on_commit(lambda: bump_version(scope, 'catalog'))
+
+
+@receiver(post_save, sender=ProductInventory)
+@receiver(post_delete, sender=ProductInventory)
+def invalidate_inventory_responses(
+    sender, instance: ProductInventory, **kwargs
+):
+    """
+    Invalidates the cached catalog responses of the inventory's
+    product, as its stock status is part of the catalog filters.
+    """
+    shop_id = (
+        Product.objects
+        .filter(pk=instance.product_id)
+        .values_list('fk_shop_id', flat=True)
+        .first()
+    )
+    scopes = ['catalog'] + ([shop_catalog_scope(shop_id)] if shop_id else [])
+    transaction.on_commit(lambda: bump_version(*scopes))
@@ -1,3 +1,390 @@
+
+import pytest
+from django.db import connection
 from django.test import TestCase
+from django.urls import reverse
+
+from core.cache import tiered
+from core.cache.response import get_versions
+from core.testing import PlanAssertionsMixin, requires_postgres
+
+from jobs.actions import enqueue_job
+from jobs.runner import claim_job, run_job
+
+from . import signals
+from .admin import approve_shops
+from .api.product import _filter_catalog
+from .api.schemas import CatalogFilterSchema
+from .models.facet import ProductFacet
+from .models.product import Product
+from .models.shop import Shop, ShopFollower
+from .resources import autocomplete
+from .resources.autocomplete import (
+    ShopNameIndex,
+    ShopSuggestion,
+    normalize_shop_name
+)
+from .resources.facets import rebuild_facets
+from .resources.scopes import shop_catalog_scope, shop_scope
+from .resources.seed import seed_data
+
+# Size of the seeded dataset, close enough to production's for the
+# planner to pick the same plans. (see `shop.resources.seed_data`)
+PLAN_DATASET = {
+    'users': 20_000,
+    'shops': 10_000,
+    'products': 50_000,
+    'followers': 100_000
+}
+
+
+@requires_postgres
+class ShopQueryPlanTests(PlanAssertionsMixin, TestCase):
+    """
+    Plan regression tests of the hot shop & catalog queries, which should
+    be served by an index, with no sequential scan nor sort.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        seed_data(**PLAN_DATASET)
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE')
+
+        # NOTE: The most followed shop, with the most products.
+        cls.shop = Shop.objects.order_by('-follower_count').first()
+        cls.sku = Product.objects.values_list('sku', flat=True).first()
+
+    def test_catalog_page(self):
+        self.assertIndexedPlan(
+            _filter_catalog(CatalogFilterSchema())[:24],
+            index='product_listed_recent_idx'
+        )
+
+    def test_shop_catalog_page(self):
+        filters = CatalogFilterSchema(shop_id=self.shop.shop_id)
+        self.assertIndexedPlan(
+            _filter_catalog(filters)[:24],
+            index='product_shop_recent_idx'
+        )
+
+    def test_shop_followers(self):
+        self.assertIndexedPlan(
+            ShopFollower.objects.filter(fk_shop=self.shop)[:25],
+            index='follower_shop_recent_idx'
+        )
+
+    def test_autocomplete_fallback(self):
+        # NOTE: The matched shops are sorted by popularity, once found.
+        self.assertIndexedPlan(
+            autocomplete._fallback_queryset('golden books'),
+            index='shop_name_trgm_idx',
+            forbidden=('Seq Scan',)
+        )
+
+    def test_product_by_sku(self):
+        # NOTE: Unordered like `get()`, as `Meta.ordering` adds a sort.
+        self.assertIndexedPlan(
+            Product.objects.filter(sku=self.sku).order_by()
+        )
+
+
+# Per-view budgets. (see `core.testing.budgets.BUDGETS`)
+
+
+def test_catalog_budget(budget_client, seeded):
+    budget_client.get('/api/products/')
+    budget_client.get('/api/products/', {'in_stock': 'true', 'page': 2})
+
+
+def test_shop_catalog_budget(budget_client, seeded):
+    shop = seeded['shops'][0]
+    budget_client.get('/api/products/', {'shop_id': shop.shop_id})
+
+
+def test_get_shop_budget(budget_client, seeded):
+    budget_client.get(f'/api/shops/{seeded['shops'][0].shop_id}')
+
+
+@pytest.mark.parametrize('url_name', [
+    'admin:index',
+    'admin:shop_shop_changelist',
+    'admin:shop_shopfollower_changelist',
+    'admin:shop_product_changelist'
+])
+def test_admin_changelist_budget(budget_client, seeded, staff_user, url_name):
+    budget_client.force_login(staff_user)
+    budget_client.get(reverse(url_name))
+
+
+def test_admin_shop_change_budget(budget_client, seeded, staff_user):
+    budget_client.force_login(staff_user)
+    shop = seeded['shops'][0]
+    budget_client.get(reverse('admin:shop_shop_change', args=[shop.pk]))
+    budget_client.get(
+        reverse('admin:shop_shop_change', args=[shop.pk]),
+        {'followers_page': 2}
+    )
+
+
+# Shop name autocomplete. (see `shop.resources.autocomplete`)
+
+
+@pytest.fixture
+def ranked_shops(db, django_user_model) -> list[Shop]:
+    """
+    More shops named "Shop <i>" than the memoized suggestions per prefix,
+    the first ones being the most followed.
+    """
+    count = autocomplete.MAX_SUGGESTIONS + 5
+    users = django_user_model.objects.bulk_create([
+        django_user_model(email=f'owner{i}@example.com')
+        for i in range(count)
+    ])
+    return Shop.objects.bulk_create([
+        Shop(
+            user=users[i],
+            shop_name=f'Shop {i}',
+            follower_count=1000 - i,
+            is_active=True
+        )
+        for i in range(count)
+    ])
+
+
+def _update_shop(index: ShopNameIndex, shop: Shop, **fields) -> None:
+    """
+    Update a shop in the database, and in the index like the signals do.
+    """
+    Shop.objects.filter(pk=shop.pk).update(**fields)
+    shop.refresh_from_db()
+    index.update(
+        shop.pk,
+        ShopSuggestion(shop.shop_id, shop.shop_name, shop.follower_count)
+        if shop.is_active else None
+    )
+
+
+def _assert_matches_rebuild(index: ShopNameIndex, *prefixes: str) -> None:
+    rebuilt = ShopNameIndex()
+    rebuilt.build()
+    for prefix in prefixes:
+        assert index.lookup(prefix, autocomplete.MAX_SUGGESTIONS) == (
+            rebuilt.lookup(prefix, autocomplete.MAX_SUGGESTIONS)
+        ), prefix
+
+
+def test_autocomplete_rename(ranked_shops):
+    index = ShopNameIndex()
+    index.build()
+    index.lookup('shop 1')
+
+    _update_shop(index, ranked_shops[1], shop_name='Café  Manila')
+    _assert_matches_rebuild(index, 's', 'shop', 'shop 1', 'c', 'cafe m')
+    assert index.lookup('CAFE manila')[0].shop_id == ranked_shops[1].shop_id
+
+
+def test_autocomplete_deactivate(ranked_shops):
+    index = ShopNameIndex()
+    index.build()
+    index.lookup('shop 2')
+
+    _update_shop(index, ranked_shops[2], is_active=False)
+    _assert_matches_rebuild(index, 's', 'shop', 'shop 2')
+
+
+def test_autocomplete_rank_drop_in_full_list(ranked_shops):
+    index = ShopNameIndex()
+    index.build()
+    assert len(index.lookup('shop', autocomplete.MAX_SUGGESTIONS)) == (
+        autocomplete.MAX_SUGGESTIONS
+    )
+
+    # NOTE: The unmemoized shops now outrank it.
+    _update_shop(index, ranked_shops[0], follower_count=0)
+    _assert_matches_rebuild(index, 's', 'shop')
+
+    _update_shop(index, ranked_shops[-1], follower_count=5000)
+    _assert_matches_rebuild(index, 's', 'shop')
+
+
+def test_autocomplete_replays_updates_during_build(ranked_shops, monkeypatch):
+    index = ShopNameIndex()
+    shop = ranked_shops[0]
+
+    # Rename the shop once the build read the shops.
+    def normalize(value):
+        if not index._pending:
+            _update_shop(index, shop, shop_name='Renamed Shop')
+        return normalize_shop_name(value)
+
+    monkeypatch.setattr(autocomplete, 'normalize_shop_name', normalize)
+    index.build()
+    monkeypatch.undo()
+
+    assert index.lookup('renamed')[0].shop_id == shop.shop_id
+    _assert_matches_rebuild(index, 's', 'shop', 'r')
+
+
+def test_autocomplete_memo_is_bounded(ranked_shops, monkeypatch):
+    monkeypatch.setattr(autocomplete, 'MAX_MEMOIZED_PREFIXES', 10)
+    index = ShopNameIndex()
+    index.build()
+
+    for i in range(50):
+        index.lookup(f'shop {i}')
+    assert len(index._memo) == 10
+
+
+def test_autocomplete_cold_start(ranked_shops, settings, monkeypatch):
+    settings.SHOP_AUTOCOMPLETE_COLD_WAIT = 0
+    index = ShopNameIndex()
+    monkeypatch.setattr(index, 'build_in_background', lambda: None)
+    monkeypatch.setattr(autocomplete, 'shop_name_index', index)
+
+    # NOTE: Served from the database, folded like the index would.
+    suggestions = autocomplete.autocomplete_shops('  SHOP   1', 10)
+    assert not index.is_ready
+
+    index.build()
+    assert suggestions == index.lookup('shop 1', 10)
+    assert autocomplete.autocomplete_shops('  SHOP   1', 10) == suggestions
+
+
+def test_autocomplete_cold_start_limit(ranked_shops, settings, monkeypatch):
+    settings.SHOP_AUTOCOMPLETE_COLD_WAIT = 0
+    index = ShopNameIndex()
+    monkeypatch.setattr(index, 'build_in_background', lambda: None)
+    monkeypatch.setattr(autocomplete, 'shop_name_index', index)
+
+    # NOTE: The most followed shops match the query, but not the index.
+    dropped = {'Shop 0', 'Shop 1', 'Shop 2'}
+    normalize = autocomplete.normalize_shop_name
+    monkeypatch.setattr(
+        autocomplete,
+        'normalize_shop_name',
+        lambda value: 'dropped' if value in dropped else normalize(value)
+    )
+
+    suggestions = autocomplete.autocomplete_shops('shop', 10)
+    assert [s.shop_name for s in suggestions] == [
+        f'Shop {i}' for i in range(3, 13)
+    ]
+
+
+# Facet counts. (see `shop.resources.facets`)
+
+
+def _facet_counts() -> dict[str, int]:
+    return dict(
+        ProductFacet.objects
+        .filter(count__gt=0)
+        .values_list('key', 'count')
+    )
+
+
+def _assert_facets_match_rebuild() -> None:
+    counts = _facet_counts()
+    assert not ProductFacet.objects.filter(count__lt=0).exists()
+    rebuild_facets()
+    assert counts == _facet_counts()
+
+
+def test_facets_on_inventory_change(seeded):
+    inventory = seeded['products'][0].inventory
+    inventory.qty = 10
+    inventory.save()
+    _assert_facets_match_rebuild()
+
+    inventory.delete()
+    _assert_facets_match_rebuild()
+
+
+def test_facets_on_product_delete(seeded):
+    # NOTE: In stock, the inventory is deleted first by the cascade.
+    product = seeded['products'][1]
+    assert product.inventory.qty > 0
+
+    product.delete()
+    _assert_facets_match_rebuild()
+
+
+def test_facets_on_shop_delete(seeded):
+    seeded['shops'][0].delete()
+    _assert_facets_match_rebuild()
+
+
+# Cached responses. (see `core.cache.response`)
+
+
+def test_get_shop_invalidated_by_any_uuid_format(
+    client, seeded, django_capture_on_commit_callbacks
+):
+    shop = seeded['shops'][0]
+    url = f'/api/shops/{shop.shop_id.hex.upper()}'
+    assert client.get(url).json()['shop_name'] == shop.shop_name
+
+    with django_capture_on_commit_callbacks(execute=True):
+        shop.shop_name = 'Renamed Shop'
+        shop.save()
+    assert client.get(url).json()['shop_name'] == 'Renamed Shop'
+
+
+def test_shop_catalog_invalidated_by_any_uuid_format(
+    client, seeded, django_capture_on_commit_callbacks
+):
+    shop = seeded['shops'][0]
+    params = {'shop_id': shop.shop_id.hex.upper()}
+    count = client.get('/api/products/', params).json()['count']
+
+    with django_capture_on_commit_callbacks(execute=True):
+        shop.products.first().delete()
+    assert client.get('/api/products/', params).json()['count'] == count - 1
+
+
+def test_follow_keeps_catalog_cached(
+    seeded, django_capture_on_commit_callbacks
+):
+    shop, user = seeded['shops'][0], seeded['users'][0]
+    scopes = ['catalog', shop_catalog_scope(shop.shop_id)]
+    versions = get_versions(scopes)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        user.unfollow_shop(str(shop.shop_id))
+        user.follow_shop(str(shop.shop_id))
+    assert get_versions(scopes) == versions
+
+
+# Admin actions. (see `shop.admin`)
+
+
+def test_approve_shops_batches_invalidations(
+    seeded, monkeypatch, django_capture_on_commit_callbacks
+):
+    published, bumped = [], []
+    monkeypatch.setattr(
+        tiered, 'publish_invalidation', lambda *keys: published.append(keys)
+    )
+    monkeypatch.setattr(
+        signals, 'bump_version', lambda *scopes: bumped.append(scopes)
+    )
+    shops = seeded['shops']
+    Shop.objects.update(is_active=False)
+    for shop in shops:
+        Shop.cached.get(shop_id=shop.shop_id)  # cached as inactive
+
+    job = enqueue_job(approve_shops.chunked_action, Shop.objects.all())
+    with django_capture_on_commit_callbacks(execute=True):
+        job = run_job(claim_job())
+    assert (job.processed, job.affected) == (len(shops), len(shops))
 
-# Create your tests here.
+    # NOTE: A single chunk, so a single broadcast and version bump.
+    assert [set(keys) for keys in published] == [
+        {Shop.cached._key('pk', shop.pk) for shop in shops}
+    ]
+    assert [set(scopes) for scopes in bumped] == [
+        {shop_scope(shop.shop_id) for shop in shops}
+    ]
+    assert all(
+        Shop.cached.get(shop_id=shop.shop_id).is_active for shop in shops
+    )
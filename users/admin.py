@@ -2,12 +2,14 @@ from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin
 from django.utils.html import format_html
 
+from core.admin import EstimatedCountPaginator, ExactSearchMixin
+
 from .forms import CustomUserChangeForm, CustomUserCreationForm
 from .models import CustomUser
 from .models.utils import UserStatus
 
 
-class CustomUserAdmin(UserAdmin):
+class CustomUserAdmin(ExactSearchMixin, UserAdmin):
 
     add_form = CustomUserCreationForm
     form = CustomUserChangeForm
@@ -73,14 +75,21 @@ class CustomUserAdmin(UserAdmin):
         ),
     )
     search_fields = (
-        'uid',
         'email',
         'display_name'
     )
+
+    # NOTE: IDs and emails are matched exactly. (see `ExactSearchMixin`)
+    search_uid_field = 'uid'
+    search_email_field = 'email'
     ordering = (
         'email',
     )
 
+    # NOTE: Keep the number of queries per page constant.
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
     @admin.display(description='Current Status')
     def current_status(self, obj: CustomUser):
         """
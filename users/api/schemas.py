@@ -1,4 +1,5 @@
 from datetime import datetime
+from typing import Any
 
 from ninja import Field, Schema
 from pydantic import EmailStr, field_serializer
@@ -64,3 +65,63 @@ class UserSchemaOut(Schema):
     @field_serializer('status')
     def serialize_status_label(self, v: UserStatus):
         return v.label
+
+
+class BulkRegisterSchemaIn(Schema):
+    """
+    Schema for validating the bulk user registration payload data.
+
+    NOTE: Rows are validated one by one on registration, so an invalid
+    row is reported back instead of rejecting the whole batch.
+
+    NOTE: Batches are small, as the passwords are hashed while the
+    request waits. Use the `bulk_register` command for larger ones.
+    """
+    is_staff: bool = Field(
+        False,
+        description='Register the users as staff.'
+    )
+    users: list[dict[str, Any]] = Field(
+        ...,
+        description=(
+            'Users to register, each with an "email", "password" '
+            'and an optional "display_name".'
+        ),
+        min_length=1,
+        max_length=100,
+        examples=[[
+            {'email': 'johndoe@expoph.com', 'password': 'Pa$$w0rd'}
+        ]]
+    )
+
+
+class BulkRegisterErrorOut(Schema):
+    """
+    Schema for defining a row that couldn't be registered.
+    """
+    row: int = Field(
+        ...,
+        description='Position of the row in the batch. (starts at 1)'
+    )
+    email: str | None = Field(
+        None,
+        description='Email of the row, if any.'
+    )
+    errors: list[str] = Field(
+        ...,
+        description='Reasons why the row wasn\'t registered.'
+    )
+
+
+class BulkRegisterSchemaOut(Schema):
+    """
+    Schema for defining the response data for a bulk registration.
+    """
+    created: int = Field(
+        ...,
+        description='Number of registered users.'
+    )
+    errors: list[BulkRegisterErrorOut] = Field(
+        ...,
+        description='Rows that weren\'t registered.'
+    )
@@ -3,11 +3,25 @@ from ninja import File, Form, Router
 from ninja.errors import HttpError
 from ninja.files import UploadedFile
 
-from core.schemas.error import Http422Message, Http500Message
+from core.cache.idempotency import idempotent
+from core.schemas.error import (
+    Http403Message,
+    Http409Message,
+    Http422Message,
+    Http500Message
+)
+from core.security import StaffSessionAuth
 
 from ..models import CustomUser
-from ..resources.register import register_user as reg_user
-from .schemas import UserSchemaIn, UserSchemaOut
+from ..resources.bulk import bulk_register_users
+from ..resources.register import aregister_user
+from ..resources.schemas import RegisterUser
+from .schemas import (
+    BulkRegisterSchemaIn,
+    BulkRegisterSchemaOut,
+    UserSchemaIn,
+    UserSchemaOut
+)
 
 # Define the users API route.
 router = Router(tags=['users'])
@@ -17,17 +31,26 @@ router = Router(tags=['users'])
     '/',
     response={
         201: UserSchemaOut,
+        409: Http409Message,
         422: Http422Message,
         500: Http500Message
     }
 )
-def register_user(
+@idempotent()
+async def register_user(
     request,
     details: Form[UserSchemaIn],
     avatar: UploadedFile | None = File(None)
 ):
     """
     Register a user into the system.
+
+    Send an `Idempotency-Key` header to safely retry the request:
+    retries with the same key replay the first response.
+
+    NOTE: This is an async view, so under ASGI the password hashing and
+    avatar upload run on worker threads instead of blocking the event
+    loop (or serializing on the sync adapter's single thread).
     """
     try:
 
@@ -35,8 +58,11 @@ def register_user(
         # `model_dump()` with secrets. (See `ClientSchemaIn`)
 
         # Create the client record using the details.
-        client: CustomUser = reg_user(
-            avatar=avatar, **details.model_dump()
+        # NOTE: Constructed without validation, as Ninja already
+        # validated the details. (trusted by `aregister_user`)
+        client: CustomUser = await aregister_user(
+            RegisterUser.model_construct(**dict(details)),
+            avatar=avatar
         )
 
         return 201, client
@@ -48,3 +74,45 @@ def register_user(
             ('Something went wrong while processing your request. '
              'Please contact the system administrator.')
         )
+
+
+@router.post(
+    '/bulk',
+    auth=StaffSessionAuth(),
+    response={
+        200: BulkRegisterSchemaOut,
+        403: Http403Message,
+        409: Http409Message,
+        422: Http422Message,
+        500: Http500Message
+    }
+)
+@idempotent()
+def bulk_register_users_view(request, payload: BulkRegisterSchemaIn):
+    """
+    Register users into the system in bulk. (staff only)
+
+    Rows that fail validation (or are already registered) are reported
+    in `errors`, while the rest are registered. Send an
+    `Idempotency-Key` header to safely retry the request.
+    NOTE: For larger batches, use the `bulk_register` command.
+    NOTE: Only superusers can register staff users.
+    """
+    # Only superusers can grant the staff access.
+    if payload.is_staff and not request.auth.is_superuser:
+        raise HttpError(403, 'Only superusers can register staff users.')
+
+    try:
+        result = bulk_register_users(
+            payload.users,
+            is_staff=payload.is_staff
+        )
+        return 200, result
+
+    except Exception as e:
+        logger.exception(e)
+        raise HttpError(
+            500,
+            ('Something went wrong while processing your request. '
+             'Please contact the system administrator.')
+        )
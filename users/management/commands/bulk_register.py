@@ -0,0 +1,62 @@
+import csv
+
+from django.core.management.base import BaseCommand, CommandError
+
+from users.resources.bulk import bulk_register_users
+
+
+class Command(BaseCommand):
+    help = (
+        'Register users in bulk from a CSV file with the columns '
+        '"email", "password" and an optional "display_name".'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'path',
+            help='Path of the CSV file, with a header row.'
+        )
+        parser.add_argument(
+            '--staff',
+            action='store_true',
+            help='Register the users as staff.'
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=1000,
+            help='Number of users inserted per batch.'
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=None,
+            help='Number of password hashing processes. (default: CPUs)'
+        )
+
+    def handle(self, *args, **options):
+        try:
+            with open(options['path'], newline='', encoding='utf-8') as f:
+                rows = [
+                    {k: v for k, v in row.items() if v}
+                    for row in csv.DictReader(f)
+                ]
+        except OSError as e:
+            raise CommandError(f'Cannot read "{options['path']}": {e}')
+
+        result = bulk_register_users(
+            rows,
+            is_staff=options['staff'],
+            chunk_size=options['chunk_size'],
+            workers=options['workers'],
+            processes=True
+        )
+
+        for error in result.errors:
+            self.stderr.write(
+                f'Row {error.row} ({error.email}): {'; '.join(error.errors)}'
+            )
+        self.stdout.write(self.style.SUCCESS(
+            f'Registered {result.created} user(s), '
+            f'skipped {len(result.errors)} row(s).'
+        ))
@@ -0,0 +1,43 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.module_loading import import_module
+
+from core.sessions.backends import SessionStore
+
+
+class Command(BaseCommand):
+    help = (
+        'Delete the expired sessions in chunks. '
+        '(a throttled alternative to "clearsessions")'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=None,
+            help='Number of sessions deleted per chunk.'
+        )
+        parser.add_argument(
+            '--pause',
+            type=float,
+            default=0,
+            help='Time in seconds to sleep between chunks.'
+        )
+
+    def handle(self, *args, **options):
+        engine = import_module(settings.SESSION_ENGINE)
+        if not issubclass(engine.SessionStore, SessionStore):
+            raise CommandError(
+                f'Session engine "{settings.SESSION_ENGINE}" doesn\'t '
+                'support chunked deletes.'
+            )
+
+        deleted = engine.SessionStore.clear_expired(
+            chunk_size=options['chunk_size'],
+            pause=options['pause']
+        )
+
+        self.stdout.write(
+            self.style.SUCCESS(f'Deleted {deleted} expired session(s).')
+        )
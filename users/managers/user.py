@@ -1,11 +1,94 @@
+from asgiref.sync import sync_to_async
 from django.contrib.auth.base_user import BaseUserManager
+from django.contrib.auth.hashers import make_password
+from django.db import models, transaction
 from django.utils.translation import gettext_lazy as _
 
+__all__ = ['CustomUserManager', 'CustomUserQuerySet', 'staff_fields']
 
-__all__ = ['CustomUserManager']
+# Number of users updated (and forgotten) at a time by `update()`.
+UPDATE_BATCH_SIZE = 1000
 
 
-class CustomUserManager(BaseUserManager):
+def staff_fields(**extra_fields) -> dict:
+    """
+    Set and validate the boolean fields needed for a staff user.
+
+    Args:
+        **extra_fields: Extra field parameters for creating a staff user.
+
+    Returns:
+        dict: The extra fields, with the staff user's defaults.
+
+    Raises:
+        ValueError: If `is_staff` is False, or when `is_superuser`
+            is set to True.
+    """
+    # Set defaults for the boolean fields for a staff user.
+    extra_fields.setdefault('is_staff', True)
+    extra_fields.setdefault('is_superuser', False)
+    extra_fields.setdefault('is_active', True)
+
+    # Validate the boolean fields needed for a staff user.
+    if extra_fields.get('is_superuser') is True:
+        raise ValueError(_('Superuser must have is_superuser=False.'))
+    if extra_fields.get('is_staff') is not True:
+        raise ValueError(_('Superuser must have is_staff=True.'))
+
+    return extra_fields
+
+
+class CustomUserQuerySet(models.QuerySet):
+    """
+    The queryset class for a custom user model.
+    """
+
+    def update(self, **kwargs):
+        """
+        Update the users, forgetting their cached snapshots.
+        (see `users.middleware`)
+
+        The users are updated in batches of `UPDATE_BATCH_SIZE`, walking
+        the primary keys, so that only a batch of them is held at a time.
+
+        NOTE: `update()` sends no `post_save` signal, so without this a
+        deactivated user (e.g. `update(is_active=False)`) would stay
+        authenticated until its snapshot expires.
+        """
+        from users.middleware import forget_users, is_user_cache_enabled
+
+        # NOTE: Nothing to forget when the snapshots aren't cached.
+        if not is_user_cache_enabled():
+            return super().update(**kwargs)
+
+        queryset = self.order_by('pk')
+        updated, last_pk = 0, None
+        with transaction.atomic(using=self.db, savepoint=False):
+            while True:
+                batch = queryset if last_pk is None else (
+                    queryset.filter(pk__gt=last_pk)
+                )
+                user_pks = list(
+                    batch.values_list('pk', flat=True)[:UPDATE_BATCH_SIZE]
+                )
+                if not user_pks:
+                    break
+
+                updated += self.model._base_manager.using(self.db).filter(
+                    pk__in=user_pks
+                ).update(**kwargs)
+                forget_users(*user_pks)
+
+                if len(user_pks) < UPDATE_BATCH_SIZE:
+                    break
+                last_pk = user_pks[-1]
+
+        return updated
+
+    update.alters_data = True
+
+
+class CustomUserManager(BaseUserManager.from_queryset(CustomUserQuerySet)):
     """
     The manager class for a custom user model.
 
@@ -71,18 +154,51 @@ class CustomUserManager(BaseUserManager):
             ValueError: If `email` is not set or is None, or when `is_staff`
                 is False, or when `is_superuser` is set to True.
         """
-        # Set defaults for the boolean fields for a staff user.
-        extra_fields.setdefault('is_staff', True)
-        extra_fields.setdefault('is_superuser', False)
-        extra_fields.setdefault('is_active', True)
+        return self.create_user(
+            email, password, **staff_fields(**extra_fields)
+        )
 
-        # Validate the boolean fields needed for a staff user.
-        if extra_fields.get('is_superuser') is True:
-            raise ValueError(_('Superuser must have is_superuser=False.'))
-        if extra_fields.get('is_staff') is not True:
-            raise ValueError(_('Superuser must have is_staff=True.'))
+    async def acreate_user(
+        self, email: str, password: str = None, **extra_fields
+    ):
+        """
+        Async version of `create_user()`.
 
-        return self.create_user(email, password, **extra_fields)
+        The password is hashed on a worker thread (off the event loop),
+        as hashing is CPU-bound by design.
+
+        Raises:
+            ValueError: If `email` is not set or is None.
+        """
+        # Make sure that the email is passed as an argument.
+        if not email:
+            raise ValueError(_('The email must be set'))
+
+        # Normalize the email's domain, lowercasing it.
+        email = self.normalize_email(email)
+
+        # NOTE: `make_password()` of None returns an unusable password.
+        user = self.model(email=email, **extra_fields)
+        user.password = await sync_to_async(
+            make_password, thread_sensitive=False
+        )(password)
+        await user.asave()
+
+        return user
+
+    async def acreate_staff(
+        self, email: str, password: str = None, **extra_fields
+    ):
+        """
+        Async version of `create_staff()`.
+
+        Raises:
+            ValueError: If `email` is not set or is None, or when `is_staff`
+                is False, or when `is_superuser` is set to True.
+        """
+        return await self.acreate_user(
+            email, password, **staff_fields(**extra_fields)
+        )
 
     def create_superuser(
         self, email: str, password: str = None, **extra_fields
@@ -0,0 +1,165 @@
+from functools import partial
+from typing import override
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib import auth
+from django.contrib.auth.middleware import AuthenticationMiddleware
+from django.db import transaction
+from django.utils.crypto import constant_time_compare
+from django.utils.functional import SimpleLazyObject
+
+from core.cache.backends import is_process_local
+from core.cache.tiered import tiered_cache
+
+__all__ = [
+    'CachedAuthenticationMiddleware',
+    'forget_users',
+    'is_user_cache_enabled'
+]
+
+# Time in seconds to keep a user's snapshot.
+SESSION_USER_TIMEOUT = 300
+
+# Fields of the user kept in its snapshot. The other fields (e.g. the
+# password) are deferred, and loaded from the database when accessed.
+SESSION_USER_FIELDS = (
+    'id',
+    'uid',
+    'email',
+    'display_name',
+    'avatar',
+    'first_name',
+    'last_name',
+    'is_active',
+    'is_staff',
+    'is_superuser',
+    'is_verified'
+)
+
+
+def _session_user_key(user_pk) -> str:
+    return f'auth:user:{user_pk}'
+
+
+def forget_users(*user_pks) -> None:
+    """
+    Delete the cached snapshots of users. (e.g. on save or update)
+
+    NOTE: Deleted again on commit, in case a concurrent request cached
+    the uncommitted (old) row in between.
+    """
+    keys = [_session_user_key(pk) for pk in user_pks]
+    tiered_cache.delete_many(keys, broadcast=False)
+    transaction.on_commit(lambda: tiered_cache.delete_many(keys))
+
+
+def is_user_cache_enabled() -> bool:
+    """
+    Check whether the users' snapshots are cached.
+
+    NOTE: A process-local cache can't be invalidated by the other
+    worker processes, so the users are always loaded then.
+    """
+    return not is_process_local(tiered_cache.alias)
+
+
+def _get_cached_user(request):
+    """
+    Get the user of the request's session from its cached snapshot,
+    or None when not cached (or no longer valid).
+    """
+    from .models import CustomUser
+
+    # NOTE: The session itself is still loaded, so a flushed or deleted
+    # session (e.g. on logout, in any process) is never authenticated.
+    session = request.session
+    try:
+        user_pk = CustomUser._meta.pk.to_python(
+            session[auth.SESSION_KEY]
+        )
+        backend_path = session[auth.BACKEND_SESSION_KEY]
+    except KeyError:
+        return None
+    if backend_path not in settings.AUTHENTICATION_BACKENDS:
+        return None
+
+    snapshot = tiered_cache.get(_session_user_key(user_pk))
+    if snapshot is None:
+        return None
+
+    # Verify the session, like `auth.get_user()` does.
+    # NOTE: The snapshot is deleted when the user changes, so its hash
+    # follows password changes. (see `forget_users()`)
+    if not snapshot['is_active'] or not constant_time_compare(
+        session.get(auth.HASH_SESSION_KEY, ''), snapshot['auth_hash']
+    ):
+        return None
+
+    fields = [
+        field.attname for field in CustomUser._meta.concrete_fields
+        if field.attname in snapshot
+    ]
+    user = CustomUser.from_db(
+        'default', fields, [snapshot[field] for field in fields]
+    )
+    user.backend = backend_path
+    return user
+
+
+def _cache_session_user(user) -> None:
+    snapshot = {
+        field: getattr(user, field) for field in SESSION_USER_FIELDS
+    }
+    snapshot['avatar'] = user.avatar.name
+    snapshot['auth_hash'] = user.get_session_auth_hash()
+    tiered_cache.set(
+        _session_user_key(user.pk),
+        snapshot,
+        timeout=SESSION_USER_TIMEOUT
+    )
+
+
+def get_user(request):
+    """
+    Get the user of the request, from its snapshot if possible.
+
+    On a miss, the user is resolved by `auth.get_user()`, then a
+    snapshot of its fields is cached. (see `SESSION_USER_FIELDS`)
+    """
+    if not hasattr(request, '_cached_user'):
+        user = _get_cached_user(request) if is_user_cache_enabled() else None
+        if user is None:
+            user = auth.get_user(request)
+            if user.is_authenticated and is_user_cache_enabled():
+                _cache_session_user(user)
+        request._cached_user = user
+    return request._cached_user
+
+
+async def auser(request):
+    """
+    Async version of `get_user()`.
+    """
+    return await sync_to_async(get_user)(request)
+
+
+class CachedAuthenticationMiddleware(AuthenticationMiddleware):
+    """
+    Drop-in replacement of Django's `AuthenticationMiddleware`, that
+    resolves `request.user` from a cached snapshot of the user.
+
+    The snapshot only holds the user's identity, flags and display
+    fields, plus its session auth hash. (never the password hash) It's
+    deleted when the user is saved, updated or deleted, so a password
+    change or a deactivation logs out the other sessions right away.
+
+    NOTE: Disabled when the default cache is process-local, as the
+    other worker processes couldn't invalidate it.
+    """
+
+    @override
+    def process_request(self, request):
+        super().process_request(request)
+        request.user = SimpleLazyObject(lambda: get_user(request))
+        request.auser = partial(auser, request)
@@ -0,0 +1,43 @@
+from django.db import migrations
+
+from core.db.operations import RunPostgresSQL
+
+
+class Migration(migrations.Migration):
+
+    # NOTE: Indexes are built concurrently to avoid locking the table.
+    atomic = False
+
+    dependencies = [
+        ('users', '0004_alter_customuser_options'),
+    ]
+
+    # NOTE: The indexed expressions match the SQL of Django's `icontains`
+    # lookup. (e.g. `UPPER("email"::text) LIKE UPPER('%term%')`)
+    operations = [
+        RunPostgresSQL(
+            sql='CREATE EXTENSION IF NOT EXISTS pg_trgm;',
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        RunPostgresSQL(
+            sql=(
+                'CREATE INDEX CONCURRENTLY IF NOT EXISTS '
+                'users_email_trgm_idx ON users_customuser '
+                'USING gin (UPPER(email::text) gin_trgm_ops);'
+            ),
+            reverse_sql=(
+                'DROP INDEX CONCURRENTLY IF EXISTS users_email_trgm_idx;'
+            ),
+        ),
+        RunPostgresSQL(
+            sql=(
+                'CREATE INDEX CONCURRENTLY IF NOT EXISTS '
+                'users_display_name_trgm_idx ON users_customuser '
+                'USING gin (UPPER(display_name::text) gin_trgm_ops);'
+            ),
+            reverse_sql=(
+                'DROP INDEX CONCURRENTLY IF EXISTS '
+                'users_display_name_trgm_idx;'
+            ),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.1 on 2026-10-18 23:43
+
+from django.db import migrations, models
+
+from core.db.operations import AddIndexConcurrently
+
+
+class Migration(migrations.Migration):
+
+    # NOTE: Indexes are built concurrently to avoid locking the table.
+    atomic = False
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('users', '0005_customuser_trgm_indexes'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='customuser',
+            index=models.Index(fields=['-created_at'], name='user_recent_idx'),
+        ),
+    ]
@@ -43,6 +43,41 @@ def default_display_name():
     return f'user-{random_str}'
 
 
+def _count_uid_wait(spins: int) -> None:
+    """
+    Count a wait of the UID generator for the next millisecond.
+
+    NOTE: The metrics are imported on first use, so generating IDs
+    doesn't need `prometheus_client`. (e.g. in the hasher processes)
+    """
+    from core.instrumentation.metrics import SNOWFLAKE_SPINS, SNOWFLAKE_WAITS
+
+    SNOWFLAKE_WAITS.inc()
+    SNOWFLAKE_SPINS.inc(spins)
+
+
+# The snowflake generator of the current process. (see `generate_uid`)
+_uid_generator: SnowflakeGenerator | None = None
+
+
+def _get_uid_generator() -> SnowflakeGenerator:
+    """
+    Get the snowflake generator of the current process.
+
+    NOTE: One generator is reused per process, as its sequence is what
+    keeps the IDs generated within the same millisecond unique. A forked
+    process gets its own, with its own `process_id`.
+    """
+    global _uid_generator
+
+    pid = os.getpid() % 32  # limit pid between 0 and 31
+    if _uid_generator is None or _uid_generator.process_id != pid:
+        _uid_generator = SnowflakeGenerator(
+            worker_id=1, process_id=pid, on_wait=_count_uid_wait
+        )
+    return _uid_generator
+
+
 def generate_uid() -> int:
     """
     Generates a unique identifier number for a user.
@@ -50,9 +85,20 @@ def generate_uid() -> int:
     NOTE: When having multi-deployments, opt to use `.env`
     to set the `worker_id` to ensure unique generation(s).
     """
-    pid = os.getpid() % 32  # limit pid between 0 and 31
-    uid = SnowflakeGenerator(worker_id=1, process_id=pid).generate_id()
-    return uid
+    return _get_uid_generator().generate_id()
+
+
+def generate_uids(n: int) -> list[int]:
+    """
+    Generates a batch of unique identifier numbers for users.
+
+    Args:
+        n (int): Number of IDs to generate.
+
+    Returns:
+        list[int]: The generated IDs, in ascending order.
+    """
+    return _get_uid_generator().generate_ids(n)
 
 
 class CustomUser(AbstractUser):
@@ -218,3 +264,10 @@ class CustomUser(AbstractUser):
         ordering = ['-created_at']
         verbose_name = 'User'
         verbose_name_plural = 'Users'
+        indexes = [
+            # NOTE: For the user lists, newest first.
+            models.Index(
+                fields=['-created_at'],
+                name='user_recent_idx'
+            ),
+        ]
@@ -1,2 +1,3 @@
 # flake8: noqa
 from users.resources.register import *
+from users.resources.bulk import *
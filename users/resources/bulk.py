@@ -0,0 +1,262 @@
+import os
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from itertools import islice
+
+import django
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.db import IntegrityError, transaction
+from loguru import logger
+from pydantic import ValidationError
+
+from ..managers import staff_fields
+from ..models.user import generate_uids
+from .schemas import RegisterStaffUser, RegisterUser
+
+__all__ = [
+    'BulkRegisterError',
+    'BulkRegisterResult',
+    'bulk_register_users'
+]
+
+
+@dataclass
+class BulkRegisterError:
+    """
+    Error of a single row that couldn't be registered.
+    """
+    row: int
+    email: str | None
+    errors: list[str]
+
+
+@dataclass
+class BulkRegisterResult:
+    """
+    Summary of a bulk registration.
+    """
+    created: int = 0
+    errors: list[BulkRegisterError] = field(default_factory=list)
+
+
+def _init_hasher_process() -> None:
+    """
+    Set up Django on a password hashing process.
+
+    NOTE: Only needed when processes are spawned instead of forked.
+    (e.g. on macOS and Windows)
+    """
+    django.setup()
+
+
+def _chunks(iterable: Iterable, size: int) -> Iterator[list]:
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def _validate_rows(
+    rows: Iterable[dict],
+    is_staff: bool,
+    result: BulkRegisterResult
+) -> list[tuple[int, dict]]:
+    """
+    Validate the rows, skipping (and reporting) the invalid ones
+    and the duplicated emails.
+
+    Returns:
+        list[tuple[int, dict]]: The row number and validated data of each
+            valid row.
+    """
+    User = get_user_model()
+    schema = RegisterStaffUser if is_staff else RegisterUser
+
+    valid, seen = [], set()
+    for row_no, row in enumerate(rows, start=1):
+        try:
+            data = schema(**row).model_dump(exclude_none=True)
+        except ValidationError as e:
+            result.errors.append(BulkRegisterError(
+                row=row_no,
+                email=row.get('email'),
+                errors=[
+                    f'{".".join(map(str, error["loc"]))}: {error["msg"]}'
+                    for error in e.errors()
+                ]
+            ))
+            continue
+
+        # NOTE: Avatars aren't supported in bulk.
+        data.pop('avatar', None)
+        data['email'] = User.objects.normalize_email(data['email'])
+
+        if data['email'] in seen:
+            result.errors.append(BulkRegisterError(
+                row=row_no,
+                email=data['email'],
+                errors=['email: Duplicated in this batch.']
+            ))
+            continue
+
+        seen.add(data['email'])
+        valid.append((row_no, data))
+    return valid
+
+
+def _exclude_registered(
+    rows: list[tuple[int, dict]],
+    chunk_size: int,
+    result: BulkRegisterResult
+) -> list[tuple[int, dict]]:
+    """
+    Skip (and report) the rows whose email is already registered.
+    """
+    User = get_user_model()
+
+    registered = set()
+    for chunk in _chunks(rows, chunk_size):
+        registered.update(
+            User.objects
+            .filter(email__in=[data['email'] for _, data in chunk])
+            .values_list('email', flat=True)
+        )
+
+    remaining = []
+    for row_no, data in rows:
+        if data['email'] in registered:
+            result.errors.append(BulkRegisterError(
+                row=row_no,
+                email=data['email'],
+                errors=['email: This email is already registered.']
+            ))
+        else:
+            remaining.append((row_no, data))
+    return remaining
+
+
+def _insert_users(
+    chunk: list[tuple[int, object]],
+    result: BulkRegisterResult
+) -> None:
+    """
+    Insert a chunk of users at once, falling back to one by one
+    to report the failing rows. (e.g. an email registered meanwhile)
+    """
+    User = get_user_model()
+
+    try:
+        with transaction.atomic():
+            User.objects.bulk_create([user for _, user in chunk])
+        result.created += len(chunk)
+        return
+    except IntegrityError:
+        pass
+
+    for row_no, user in chunk:
+        try:
+            with transaction.atomic():
+                User.objects.bulk_create([user])
+            result.created += 1
+        except IntegrityError as e:
+            # NOTE: The database error names the constraints, log it only.
+            logger.warning(f'Bulk registration of row {row_no} failed: {e}')
+            result.errors.append(BulkRegisterError(
+                row=row_no,
+                email=user.email,
+                errors=['email: This email is already registered.']
+            ))
+
+
+def bulk_register_users(
+    rows: Iterable[dict],
+    is_staff: bool = False,
+    chunk_size: int = 1000,
+    workers: int | None = None,
+    processes: bool = False
+) -> BulkRegisterResult:
+    """
+    Register many users (or staff) into the system at once.
+
+    Each row is validated like in `register_user()`, and the invalid
+    rows are reported instead of aborting the batch. The passwords are
+    hashed on a pool of threads (or processes), while the hashed chunks
+    are inserted as they complete. (one `INSERT` per chunk)
+
+    NOTE: `bulk_create()` doesn't send the `post_save` signals.
+
+    NOTE: Only use processes outside of the web server (e.g. the
+    `bulk_register` command), as forking a server process copies its
+    connections and threads.
+
+    Args:
+        rows (Iterable[dict]): The users to register, each with an
+            `email`, `password` and an optional `display_name`.
+        is_staff (bool): Registers staff users. Defaults to False.
+        chunk_size (int): Number of users per insert.
+        workers (int | None): Number of hashing threads or processes.
+            Defaults to `BULK_REGISTER_HASH_THREADS` threads, or to the
+            number of CPUs for processes.
+        processes (bool): Hashes on processes instead of threads, to use
+            every CPU. Defaults to False.
+
+    Returns:
+        BulkRegisterResult: The number of created users, and the errors
+            per row that wasn't registered.
+    """
+    User = get_user_model()
+    result = BulkRegisterResult()
+
+    rows = _validate_rows(rows, is_staff, result)
+    rows = _exclude_registered(rows, chunk_size, result)
+    if not rows:
+        result.errors.sort(key=lambda error: error.row)
+        return result
+
+    if processes:
+        workers = workers or os.cpu_count() or 1
+        executor = ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_hasher_process
+        )
+    else:
+        # NOTE: The hashers release the GIL while hashing. (e.g. PBKDF2)
+        workers = workers or settings.BULK_REGISTER_HASH_THREADS
+        executor = ThreadPoolExecutor(
+            max_workers=workers,
+            thread_name_prefix='bulk-register-hasher'
+        )
+
+    passwords = [data.pop('password') for _, data in rows]
+    uids = generate_uids(len(rows))
+
+    # Set the fields of a staff user.
+    extras = staff_fields() if is_staff else {}
+
+    with executor:
+
+        # NOTE: Hashes are yielded in order, as soon as they're ready.
+        hashes = executor.map(
+            make_password,
+            passwords,
+            chunksize=max(1, min(64, len(passwords) // (workers * 4)))
+        )
+        users = (
+            (row_no, User(uid=uid, password=hashed, **extras, **data))
+            for (row_no, data), uid, hashed in zip(rows, uids, hashes)
+        )
+        for chunk in _chunks(users, chunk_size):
+            _insert_users(chunk, result)
+
+    result.errors.sort(key=lambda error: error.row)
+
+    # Log the event.
+    logger.success(
+        f'Bulk registered {result.created} '
+        f'{'staff ' if is_staff else ''}user(s), '
+        f'skipped {len(result.errors)} row(s).'
+    )
+
+    return result
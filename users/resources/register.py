@@ -1,4 +1,8 @@
+import asyncio
+
+from asgiref.sync import sync_to_async
 from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import UploadedFile
 from django.db import transaction
 from loguru import logger
 
@@ -9,7 +13,9 @@ from .schemas import RegisterStaffUser, RegisterUser
 
 __all__ = [
     'register_user',
-    'register_staff_user'
+    'register_staff_user',
+    'aregister_user',
+    'aregister_staff_user'
 ]
 
 
@@ -84,3 +90,119 @@ def register_staff_user(email: str, password: str, **extras):
     Register a staff user into the system.
     """
     return _register_user(email, password, is_staff=True, **extras)
+
+
+def _store_avatar(uid: int, avatar: UploadedFile) -> str:
+    """
+    Helper function to resize and upload the avatar of a user.
+
+    Args:
+        uid (int): UID of the user to upload the avatar for.
+        avatar (UploadedFile): The uploaded avatar image file.
+
+    Returns:
+        str: The name of the stored avatar file.
+    """
+    User = get_user_model()
+    field = User._meta.get_field('avatar')
+
+    # NOTE: The upload path only depends on the user's `uid`.
+    avatar_img = resize_image_file_handler(avatar)
+    name = field.generate_filename(User(uid=uid), avatar_img.name)
+    return field.storage.save(name, avatar_img, max_length=field.max_length)
+
+
+async def _aregister_user(
+    email: str,
+    password: str,
+    is_staff: bool = False,
+    **extras
+):
+    """
+    Async version of `_register_user()`.
+
+    The avatar is resized and uploaded on a worker thread while the
+    user is being created, so the storage round trip overlaps the
+    password hashing and the insert. The user is deleted if the
+    upload fails, and the avatar if the insert fails.
+
+    Args:
+        email (str): Email address of the user.
+        password (str): Password for the user.
+        is_staff (bool): Indicates that user is a staff. Defaults to False.
+        **extras: Additional optional parameters for user registration.
+
+    Returns:
+        CustomUser: The created custom user object.
+    """
+    # Get the user model class.
+    User = get_user_model()
+
+    # Start processing the avatar file if passed, under a known `uid`.
+    avatar = extras.pop('avatar', None)
+    avatar_task = None
+    if avatar:
+        extras['uid'] = User._meta.get_field('uid').get_default()
+        avatar_task = asyncio.create_task(sync_to_async(
+            _store_avatar, thread_sensitive=False
+        )(extras['uid'], avatar))
+
+    # Create either a normal user or a staff user
+    # based on the `is_staff` flag.
+    create_user = (
+        User.objects.acreate_staff if is_staff
+        else User.objects.acreate_user
+    )
+    try:
+        user = await create_user(email=email, password=password, **extras)
+    except Exception:
+        if avatar_task:
+            await _adelete_avatar(avatar_task)
+        raise
+
+    # Save the stored avatar's name on the user.
+    if avatar_task:
+        try:
+            user.avatar.name = await avatar_task
+            await user.asave(update_fields=['avatar', 'modified_at'])
+        except Exception:
+            await user.adelete()
+            await _adelete_avatar(avatar_task)
+            raise
+
+    # Log the event.
+    logger.success(
+        f'Successfully registered {'staff ' if is_staff else ''}'
+        f'{user.email} ({user.display_name})'
+    )
+
+    return user
+
+
+async def _adelete_avatar(avatar_task: asyncio.Task) -> None:
+    """
+    Helper function to delete an avatar stored by a failed registration.
+    """
+    try:
+        name = await avatar_task
+    except Exception:
+        return  # nothing was stored
+
+    storage = get_user_model()._meta.get_field('avatar').storage
+    await sync_to_async(storage.delete, thread_sensitive=False)(name)
+
+
+@validate_params(RegisterUser)
+async def aregister_user(email: str, password: str, **extras):
+    """
+    Register a standard user into the system. (async)
+    """
+    return await _aregister_user(email, password, is_staff=False, **extras)
+
+
+@validate_params(RegisterStaffUser)
+async def aregister_staff_user(email: str, password: str, **extras):
+    """
+    Register a staff user into the system. (async)
+    """
+    return await _aregister_user(email, password, is_staff=True, **extras)
@@ -0,0 +1,15 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .middleware import forget_users
+from .models import CustomUser
+
+
+@receiver(post_save, sender=CustomUser)
+@receiver(post_delete, sender=CustomUser)
+def forget_changed_user(sender, instance, **kwargs):
+    """
+    Forget the cached snapshot of a user when saved or deleted.
+    (e.g. on password change or `set_status()`)
+    """
+    forget_users(instance.pk)
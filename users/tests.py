@@ -1,3 +1,320 @@
-from django.test import TestCase
+import pytest
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import RequestFactory, TestCase
+from django.urls import reverse
 
-# Create your tests here.
+from core.testing import PlanAssertionsMixin, requires_postgres
+
+from . import middleware
+from .managers import user as managers
+from .resources import bulk
+from .resources.bulk import bulk_register_users
+
+# Size of the seeded dataset, close enough to production's for the
+# planner to pick the same plans.
+NUM_USERS = 20_000
+
+
+@requires_postgres
+class UserQueryPlanTests(PlanAssertionsMixin, TestCase):
+    """
+    Plan regression tests of the hot user queries, which should be
+    served by an index, with no sequential scan nor sort.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        User = get_user_model()
+        cls.users = User.objects.bulk_create([
+            User(email=f'user{i}@example.com', display_name=f'User {i}')
+            for i in range(NUM_USERS)
+        ], batch_size=5000)
+
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE')
+
+    def test_recent_users(self):
+        self.assertIndexedPlan(
+            get_user_model().objects.all()[:100],
+            index='user_recent_idx'
+        )
+
+    def test_users_by_email(self):
+        self.assertIndexedPlan(
+            get_user_model().objects.order_by('email')[:100]
+        )
+
+    def test_user_by_email(self):
+        # NOTE: Unordered like `get()`, as `Meta.ordering` adds a sort.
+        self.assertIndexedPlan(
+            get_user_model().objects
+            .filter(email='user1@example.com')
+            .order_by()
+        )
+
+    def test_user_by_uid(self):
+        # NOTE: Unordered like `get()`, as `Meta.ordering` adds a sort.
+        self.assertIndexedPlan(
+            get_user_model().objects.filter(uid=self.users[1].uid).order_by()
+        )
+
+
+# Per-view budgets. (see `core.testing.budgets.BUDGETS`)
+
+
+def test_admin_user_changelist_budget(budget_client, seeded, staff_user):
+    budget_client.force_login(staff_user)
+    budget_client.get(reverse('admin:users_customuser_changelist'))
+
+
+def test_login_budget(budget_client):
+    budget_client.get(reverse('users:login'))
+
+
+def test_profile_budget(budget_client, seeded):
+    budget_client.force_login(seeded['users'][0])
+    budget_client.get(reverse('users:profile'))
+
+
+# Cached session users. (see `users.middleware`)
+
+
+@pytest.fixture
+def session_user(client, staff_user):
+    """
+    Get the user of the staff user's session, like the middleware.
+    """
+    client.force_login(staff_user)
+    session = client.session
+
+    def get_user():
+        request = RequestFactory().get('/')
+        request.session = type(session)(session.session_key)
+        return middleware.get_user(request)
+
+    return get_user
+
+
+def test_session_user_snapshot(
+    session_user, staff_user, django_assert_num_queries
+):
+    session_user()  # cached on a miss
+    snapshot = middleware.tiered_cache.get(
+        middleware._session_user_key(staff_user.pk)
+    )
+    assert 'password' not in snapshot
+
+    with django_assert_num_queries(0):
+        user = session_user()
+        assert (user.pk, user.email) == (staff_user.pk, staff_user.email)
+        assert user.is_staff and user.is_authenticated
+
+
+def test_session_user_forgotten_on_update(session_user, staff_user):
+    session_user()
+    get_user_model().objects.filter(pk=staff_user.pk).update(
+        is_active=False
+    )
+    assert not session_user().is_authenticated
+
+
+def test_session_user_forgotten_on_update_in_batches(
+    session_user, staff_user, django_user_model, monkeypatch
+):
+    monkeypatch.setattr(managers, 'UPDATE_BATCH_SIZE', 2)
+    for i in range(4):
+        django_user_model.objects.create_user(email=f'user{i}@example.com')
+
+    session_user()
+    updated = django_user_model.objects.filter(is_active=True).update(
+        is_active=False
+    )
+    assert updated == 5
+    assert not django_user_model.objects.filter(is_active=True).exists()
+    assert not session_user().is_authenticated
+
+
+def test_session_user_update_on_local_cache(
+    staff_user, django_user_model, monkeypatch, django_assert_num_queries
+):
+    monkeypatch.setattr(middleware, 'is_process_local', lambda alias: True)
+
+    # NOTE: Nothing is cached, so the users aren't looked up to forget.
+    with django_assert_num_queries(1):
+        django_user_model.objects.update(is_verified=True)
+
+
+def test_session_user_forgotten_on_password_change(session_user, staff_user):
+    session_user()
+    staff_user.set_password('changed')
+    staff_user.save()
+    assert not session_user().is_authenticated
+
+
+def test_session_user_forgotten_on_logout(client, session_user):
+    session_user()
+    client.logout()
+    assert not session_user().is_authenticated
+
+
+def test_session_user_disabled_on_local_cache(
+    client, monkeypatch, staff_user
+):
+    monkeypatch.setattr(middleware, 'is_process_local', lambda alias: True)
+    client.force_login(staff_user)
+    client.get(reverse('users:profile'))
+    assert middleware.tiered_cache.get(
+        middleware._session_user_key(staff_user.pk)
+    ) is None
+
+
+# Server timings. (see `core.instrumentation`)
+
+
+def test_login_server_timing(client, settings):
+    settings.DEBUG = False
+    settings.SERVER_TIMING_SAMPLE_RATE = 0
+    response = client.get(reverse('users:login'))
+    assert 'Server-Timing' not in response
+
+
+def test_profile_server_timing(client, settings, seeded, staff_user):
+    settings.DEBUG = False
+    settings.SERVER_TIMING_SAMPLE_RATE = 0
+    client.force_login(staff_user)
+    response = client.get(
+        reverse('users:profile'), headers={'X-Server-Timing': '1'}
+    )
+    metrics = [
+        entry.split(';')[0]
+        for entry in response['Server-Timing'].split(', ')
+    ]
+    assert metrics == ['db', 'template', 'total']
+
+
+# Metrics. (see `core.instrumentation.metrics`)
+
+
+def test_metrics_requires_staff_or_token(client, db, settings):
+    settings.METRICS_TOKEN = 'scraper-token'
+    assert client.get(reverse('metrics')).status_code == 302
+    response = client.get(
+        reverse('metrics'), headers={'Authorization': 'Bearer wrong'}
+    )
+    assert response.status_code == 302
+
+
+def test_metrics(client, db, settings):
+    settings.METRICS_TOKEN = 'scraper-token'
+    client.get(reverse('users:login'))
+    response = client.get(
+        reverse('metrics'), headers={'Authorization': 'Bearer scraper-token'}
+    )
+    assert response.status_code == 200
+    assert (
+        b'http_requests_total{method="GET",route="users:login",status="200"}'
+        in response.content
+    )
+    assert b'background_jobs{status="pending"} 0.0' in response.content
+    assert b'cache_tier_lookups_total{result="hit",tier="local"}' in (
+        response.content
+    )
+
+
+# Bulk registration. (see `users.resources.bulk`)
+
+PASSWORD = 'Str0ng-Passw0rd!'
+
+
+@pytest.fixture
+def fast_hasher(settings):
+    settings.PASSWORD_HASHERS = [
+        'django.contrib.auth.hashers.MD5PasswordHasher'
+    ]
+
+
+def test_bulk_register_users(db, fast_hasher):
+    User = get_user_model()
+    User.objects.create_user('taken@example.com', PASSWORD)
+
+    result = bulk_register_users([
+        {'email': 'new1@example.com', 'password': PASSWORD},
+        {'email': 'not-an-email', 'password': PASSWORD},
+        {'email': 'taken@example.com', 'password': PASSWORD},
+        {'email': 'new2@example.com', 'password': PASSWORD},
+        {'email': 'new1@example.com', 'password': PASSWORD},
+    ], chunk_size=1)
+
+    assert result.created == 2
+    assert [(e.row, e.errors[0].split(':')[0]) for e in result.errors] == [
+        (2, 'email'), (3, 'email'), (5, 'email')
+    ]
+    assert User.objects.get(email='new2@example.com').check_password(
+        PASSWORD
+    )
+
+
+def test_bulk_register_conflict_hides_database_error(
+    db, fast_hasher, monkeypatch
+):
+    User = get_user_model()
+    User.objects.create_user('taken@example.com', PASSWORD)
+
+    # e.g. registered after the check, by a concurrent request
+    monkeypatch.setattr(bulk, '_exclude_registered', lambda rows, *_: rows)
+    result = bulk_register_users([
+        {'email': 'taken@example.com', 'password': PASSWORD}
+    ])
+    assert result.created == 0
+    assert result.errors[0].errors == [
+        'email: This email is already registered.'
+    ]
+
+
+def test_bulk_register_view(client, staff_user, fast_hasher):
+    client.force_login(staff_user)
+    response = client.post(
+        '/api/users/bulk',
+        {'users': [{'email': 'new@example.com', 'password': PASSWORD}]},
+        content_type='application/json'
+    )
+    assert response.status_code == 200
+    assert response.json() == {'created': 1, 'errors': []}
+
+    response = client.post(
+        '/api/users/bulk',
+        {'users': [{'email': f'new{i}@example.com'} for i in range(101)]},
+        content_type='application/json'
+    )
+    assert response.status_code == 422
+
+
+def test_bulk_register_view_staff(client, django_user_model, fast_hasher):
+    staff = django_user_model.objects.create_staff(
+        email='staff@example.com',
+        password=PASSWORD
+    )
+    client.force_login(staff)
+    payload = {
+        'is_staff': True,
+        'users': [{'email': 'new@example.com', 'password': PASSWORD}]
+    }
+
+    # NOTE: Only superusers can register staff users.
+    response = client.post(
+        '/api/users/bulk', payload, content_type='application/json'
+    )
+    assert response.status_code == 403
+    assert not django_user_model.objects.filter(
+        email='new@example.com'
+    ).exists()
+
+    staff.is_superuser = True
+    staff.save()
+    client.force_login(staff)
+    response = client.post(
+        '/api/users/bulk', payload, content_type='application/json'
+    )
+    assert response.status_code == 200
+    assert django_user_model.objects.get(email='new@example.com').is_staff